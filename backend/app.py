@@ -1,30 +1,1118 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, Response, stream_with_context, g
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
-from datetime import datetime, timedelta
+import click
+from datetime import datetime, timedelta, timezone
 import requests
 import os
 import json
+import hashlib
+import sqlite3
+import tempfile
+import threading
+import random
 from functools import lru_cache
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 import time
+import gzip
+import logging
+import contextvars
+import bisect
+import unicodedata
+import numpy as np
+try:
+    from backend.playoff_sim import simulate_seasons
+except ImportError:  # run as python app.py from backend/
+    from playoff_sim import simulate_seasons
+
+# orjson encodes cached payloads and brotli adds a br variant; both are in
+# requirements.txt, and without them the cache falls back to json and gzip only
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+    format='%(asctime)s %(levelname)s [%(process)d] %(name)s: %(message)s'
+)
+logger = logging.getLogger('mlb_stats')
 
 app = Flask(__name__, template_folder='../frontend/templates', static_folder='../frontend/static')
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///baseball_stats.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///baseball_stats.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
 db = SQLAlchemy(app)
 CORS(app)
 
 # MLB Stats API Base URL
-MLB_API_BASE = 'https://statsapi.mlb.com/api/v1'
+# Point at a local replay server (backend/mlb_replay.py) to run without statsapi
+MLB_API_BASE = os.environ.get('MLB_API_BASE', 'https://statsapi.mlb.com/api/v1')
+# When set, every statsapi response is also saved here as a replay fixture
+MLB_RECORD_DIR = os.environ.get('MLB_RECORD_DIR')
 
 # Backend cache for API responses
-api_cache = {
-    'teams': {'data': None, 'timestamp': 0},
-    'games': {},
-    'standings': {'data': None, 'timestamp': 0}
-}
 CACHE_DURATION = 60  # 60 seconds for most data
+GAMES_CACHE_DURATION = 15  # shorter cache for live games
+FINAL_GAMES_CACHE_DURATION = 24 * 60 * 60  # dates whose games are all over
+LINEUPS_CACHE_DURATION = 30
+BETS_STATS_CACHE_DURATION = 3600  # also invalidated whenever a bet changes
+
+# 'sqlite' shares one cache file between all gunicorn workers on the host,
+# 'memory' keeps a private cache per process
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'sqlite')
+CACHE_DB_PATH = os.environ.get('CACHE_DB_PATH', os.path.join(tempfile.gettempdir(), 'mlb_stats_cache.db'))
+# Byte budgets for the encoded payloads; least recently used entries are evicted first
+CACHE_MAX_BYTES = int(os.environ.get('CACHE_MAX_BYTES', 64 * 1024 * 1024))
+CACHE_MEMORY_MAX_BYTES = int(os.environ.get('CACHE_MEMORY_MAX_BYTES', 16 * 1024 * 1024))
+
+COMPRESS_MIN_BYTES = 512  # smaller bodies are sent uncompressed
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9  # compression happens once per refresh, not per request
+
+_NOT_DECODED = object()
+
+class CacheEntry:
+    """
+    A cached API payload together with when it was fetched, how long it
+    stays fresh, a caller-maintained version number and a content hash.
+    The JSON body and its compressed variants are encoded once when the
+    entry is stored; data is only decoded from the body when accessed.
+    """
+    __slots__ = ('_data', 'body', 'encodings', 'timestamp', 'ttl', 'version', 'etag')
+
+    def __init__(self, data, timestamp, ttl, version=0, etag='', body=b'', encodings=None):
+        self._data = data
+        self.body = body
+        self.encodings = encodings or {}
+        self.timestamp = timestamp
+        self.ttl = ttl
+        self.version = version
+        self.etag = etag
+
+    @property
+    def data(self):
+        if self._data is _NOT_DECODED:
+            self._data = decode_cache_data(self.body)
+        return self._data
+
+    @property
+    def size(self):
+        return len(self.body) + sum(len(variant) for variant in self.encodings.values())
+
+    def age(self, now=None):
+        return (now if now is not None else time.time()) - self.timestamp
+
+    def is_fresh(self, now=None):
+        return self.age(now) < self.ttl
+
+def encode_cache_data(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def decode_cache_data(body):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+def compress_variants(body):
+    """Content-coded copies of a JSON body, keyed by Content-Encoding"""
+    if len(body) < COMPRESS_MIN_BYTES:
+        return {}
+    variants = {'gzip': gzip.compress(body, compresslevel=GZIP_LEVEL)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=BROTLI_QUALITY)
+    return variants
+
+def build_cache_entry(data, ttl, timestamp=None, version=0):
+    body = encode_cache_data(data)
+    return CacheEntry(
+        data, timestamp if timestamp is not None else time.time(), ttl, version,
+        content_etag(body), body, compress_variants(body)
+    )
+
+def content_etag(body):
+    return hashlib.blake2b(body, digest_size=12).hexdigest()
+
+class LRUCache:
+    """
+    Least-recently-used map bounded by the total size of its values in bytes.
+    Counts hits, misses and evictions.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, value, size):
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._items[key] = (value, size)
+            self._bytes += size
+            # The newest entry always stays, even if it alone exceeds the budget
+            while self._bytes > self.max_bytes and len(self._items) > 1:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def pop(self, key):
+        with self._lock:
+            item = self._items.pop(key, None)
+            if item is not None:
+                self._bytes -= item[1]
+
+    def keys(self, prefix=''):
+        with self._lock:
+            return [key for key in self._items if key.startswith(prefix)]
+
+    def stats(self):
+        return {
+            'entries': len(self._items),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+# Bounded sample series (NumPy structured records whose first field is a
+# timestamp) kept next to the cache, e.g. a game's win probability history
+SERIES_CAPACITY = 1024  # samples per series; once full the oldest are overwritten
+SERIES_MAX_KEYS = 256  # series kept by the in-memory backend
+SERIES_RETENTION = 3 * 86400  # seconds an idle series survives in the SQLite backend
+
+# Version counters (e.g. a date's scoreboard version) are kept apart from the
+# evictable entries. A new counter starts at the current Unix time, so one
+# that was lost never restarts below a version a client already holds.
+VERSION_RETENTION = 7 * 86400  # seconds an untouched counter survives in the SQLite backend
+
+def sample_fields(sample_bytes, dtype):
+    """A packed sample without its leading timestamp, for spotting repeats"""
+    return sample_bytes[dtype[0].itemsize:]
+
+class MemoryCache:
+    """Process-local cache; every worker keeps its own copy"""
+
+    def __init__(self, max_bytes=CACHE_MEMORY_MAX_BYTES):
+        self._entries = LRUCache(max_bytes)
+        self._leases = {}
+        self._series = OrderedDict()
+        self._versions = {}
+        # Other workers count the same keys on their own, so this process's
+        # versions get a random high tag and never match theirs
+        self._version_tag = random.getrandbits(20) << 32
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set(self, key, data, ttl, timestamp=None, version=0):
+        entry = build_cache_entry(data, ttl, timestamp, version)
+        self._entries.put(key, entry, entry.size)
+        return entry
+
+    def delete(self, key):
+        self._entries.pop(key)
+
+    def keys(self, prefix=''):
+        return self._entries.keys(prefix)
+
+    def stats(self):
+        return self._entries.stats()
+
+    def acquire_lease(self, key, duration):
+        now = time.time()
+        owner = threading.get_ident()
+        with self._lock:
+            holder, expires = self._leases.get(key, (None, 0))
+            if expires > now and holder != owner:
+                return False
+            self._leases[key] = (owner, now + duration)
+            return True
+
+    def release_lease(self, key):
+        with self._lock:
+            if self._leases.get(key, (None, 0))[0] == threading.get_ident():
+                del self._leases[key]
+
+    def lease_held(self, key):
+        return self._leases.get(key, (None, 0))[1] > time.time()
+
+    def current_version(self, key):
+        """key's version counter, 0 if it has none"""
+        with self._lock:
+            return self._versions.get(key, 0)
+
+    def bump_version(self, key):
+        """Increment key's version counter and return the new value"""
+        with self._lock:
+            version = self._versions[key] + 1 if key in self._versions else self._version_tag + int(time.time())
+            self._versions[key] = version
+            return version
+
+    def append_sample(self, key, sample, capacity=SERIES_CAPACITY):
+        """
+        Append one record to key's ring buffer in O(1). A record that only
+        differs from the latest one by its timestamp is skipped.
+        """
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [np.zeros(capacity, dtype=sample.dtype), 0]
+                while len(self._series) > SERIES_MAX_KEYS:
+                    self._series.popitem(last=False)
+            self._series.move_to_end(key)
+            ring, count = series
+            packed = sample.tobytes()
+            if count and sample_fields(ring[(count - 1) % len(ring)].tobytes(), ring.dtype) == sample_fields(packed, ring.dtype):
+                return False
+            ring[count % len(ring)] = sample
+            series[1] = count + 1
+            return True
+
+    def set_worker_snapshot(self, worker, data):
+        """Replace one worker's snapshot; kept apart from the entries, so never evicted or compressed"""
+        with self._lock:
+            self._snapshots[worker] = (time.time(), data)
+
+    def worker_snapshots(self, max_age):
+        """Every worker's snapshot published within the last max_age seconds"""
+        cutoff = time.time() - max_age
+        with self._lock:
+            return [data for updated, data in self._snapshots.values() if updated >= cutoff]
+
+    def series_version(self, key):
+        """Records ever appended to key's series, 0 if it has none"""
+        with self._lock:
+            series = self._series.get(key)
+            return series[1] if series else 0
+
+    def series(self, key, dtype):
+        """Every retained record for key, oldest first"""
+        with self._lock:
+            ring, count = self._series.get(key, (np.zeros(0, dtype=dtype), 0))
+            if count <= len(ring):
+                return ring[:count].copy()
+            return np.roll(ring, -(count % len(ring)))
+
+class SQLiteCache:
+    """
+    Cache shared by every worker process on one host.
+    Entries live in a SQLite file in WAL mode so readers never block the
+    single writer, and each thread gets its own connection. Decoded
+    entries are kept in a per-process LRU and reused while the row's
+    etag and timestamp still match, so hits skip the JSON decode.
+    """
+
+    SCHEMA_VERSION = 8  # bump when the tables change; older cache files are rebuilt
+    ACCESS_RESOLUTION = 60  # seconds; limits last-access writes to one per key per minute
+    PRUNE_EVERY = 50  # writes between byte-budget checks
+
+    def __init__(self, path, max_bytes=CACHE_MAX_BYTES, memory_max_bytes=CACHE_MEMORY_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._memory = LRUCache(memory_max_bytes)
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if conn.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                conn.execute('DROP TABLE IF EXISTS cache')
+                conn.execute('DROP TABLE IF EXISTS leases')
+                conn.execute('DROP TABLE IF EXISTS series')
+                conn.execute('DROP TABLE IF EXISTS series_heads')
+                conn.execute('DROP TABLE IF EXISTS versions')
+                conn.execute('DROP TABLE IF EXISTS worker_snapshots')
+                conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'key TEXT PRIMARY KEY, body BLOB NOT NULL, gzip BLOB, br BLOB, timestamp REAL NOT NULL, ttl REAL NOT NULL, '
+                'version INTEGER NOT NULL DEFAULT 0, etag TEXT NOT NULL DEFAULT \'\', '
+                'size INTEGER NOT NULL DEFAULT 0, accessed REAL NOT NULL DEFAULT 0)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)'
+            )
+            # Ring buffers: one row per slot, plus a head row with the running count
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS series ('
+                'key TEXT NOT NULL, slot INTEGER NOT NULL, sample BLOB NOT NULL, PRIMARY KEY (key, slot))'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS series_heads ('
+                'key TEXT PRIMARY KEY, count INTEGER NOT NULL, last BLOB NOT NULL, updated REAL NOT NULL)'
+            )
+            # Never evicted by the byte budget; see VERSION_RETENTION
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS versions (key TEXT PRIMARY KEY, version INTEGER NOT NULL, updated REAL NOT NULL)'
+            )
+            # Per-worker state such as metrics: uncompressed, outside the byte budget
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS worker_snapshots (worker TEXT PRIMARY KEY, body BLOB NOT NULL, updated REAL NOT NULL)'
+            )
+            conn.execute('COMMIT')
+        except sqlite3.Error:
+            conn.execute('ROLLBACK')
+            raise
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        conn = self._connect()
+        # One read transaction, so the body always belongs to the metadata
+        # even if another worker replaces the row in between
+        conn.execute('BEGIN')
+        try:
+            row = conn.execute(
+                'SELECT timestamp, ttl, version, etag, accessed FROM cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                self._memory.pop(key)
+                return None
+            self.hits += 1
+            timestamp, ttl, version, etag, accessed = row
+
+            entry = self._memory.get(key)
+            if entry is None or entry.etag != etag or entry.timestamp != timestamp:
+                body, gzip_body, br_body = conn.execute('SELECT body, gzip, br FROM cache WHERE key = ?', (key,)).fetchone()
+                encodings = {name: variant for name, variant in (('gzip', gzip_body), ('br', br_body)) if variant}
+                entry = CacheEntry(_NOT_DECODED, timestamp, ttl, version, etag, body, encodings)
+                self._memory.put(key, entry, entry.size)
+        finally:
+            conn.execute('COMMIT')
+
+        now = time.time()
+        if now - accessed > self.ACCESS_RESOLUTION:
+            conn.execute('UPDATE cache SET accessed = ? WHERE key = ?', (now, key))
+        return entry
+
+    def set(self, key, data, ttl, timestamp=None, version=0):
+        entry = build_cache_entry(data, ttl, timestamp, version)
+        self._connect().execute(
+            'INSERT OR REPLACE INTO cache (key, body, gzip, br, timestamp, ttl, version, etag, size, accessed) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (key, entry.body, entry.encodings.get('gzip'), entry.encodings.get('br'),
+             entry.timestamp, ttl, version, entry.etag, entry.size, entry.timestamp)
+        )
+        self._memory.put(key, entry, entry.size)
+
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            self.prune()
+        return entry
+
+    def delete(self, key):
+        self._connect().execute('DELETE FROM cache WHERE key = ?', (key,))
+        self._memory.pop(key)
+
+    def keys(self, prefix=''):
+        # A range scan on the primary key rather than LIKE, which cannot use the index
+        rows = self._connect().execute(
+            'SELECT key FROM cache WHERE key >= ? AND key < ?', (prefix, prefix + '\uffff')
+        )
+        return [row[0] for row in rows]
+
+    def prune(self):
+        """Evict least recently accessed rows until the file's payloads fit the byte budget"""
+        conn = self._connect()
+        idle = time.time() - SERIES_RETENTION
+        conn.execute('DELETE FROM series WHERE key IN (SELECT key FROM series_heads WHERE updated < ?)', (idle,))
+        conn.execute('DELETE FROM series_heads WHERE updated < ?', (idle,))
+        conn.execute('DELETE FROM versions WHERE updated < ?', (time.time() - VERSION_RETENTION,))
+        conn.execute('DELETE FROM worker_snapshots WHERE updated < ?', (time.time() - METRICS_WORKER_TTL,))
+
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM cache').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evict = []
+        for key, size in conn.execute('SELECT key, size FROM cache ORDER BY accessed'):
+            if total <= self.max_bytes:
+                break
+            evict.append(key)
+            total -= size
+        conn.executemany('DELETE FROM cache WHERE key = ?', [(key,) for key in evict])
+        for key in evict:
+            self._memory.pop(key)
+        self.evictions += len(evict)
+
+    def stats(self):
+        entries, total = self._connect().execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache').fetchone()
+        return {
+            'entries': entries,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'memory': self._memory.stats()
+        }
+
+    def _lease_owner(self):
+        return f'{os.getpid()}:{threading.get_ident()}'
+
+    def acquire_lease(self, key, duration):
+        """Atomically claim (or renew) the right to refresh key; expired leases can be taken over"""
+        now = time.time()
+        cursor = self._connect().execute(
+            'INSERT INTO leases (key, owner, expires) VALUES (?, ?, ?) '
+            'ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires = excluded.expires '
+            'WHERE leases.expires <= ? OR leases.owner = excluded.owner',
+            (key, self._lease_owner(), now + duration, now)
+        )
+        return cursor.rowcount == 1
+
+    def release_lease(self, key):
+        self._connect().execute(
+            'DELETE FROM leases WHERE key = ? AND owner = ?', (key, self._lease_owner())
+        )
+
+    def lease_held(self, key):
+        row = self._connect().execute('SELECT expires FROM leases WHERE key = ?', (key,)).fetchone()
+        return row is not None and row[0] > time.time()
+
+    def current_version(self, key):
+        """key's version counter, 0 if it has none"""
+        row = self._connect().execute('SELECT version FROM versions WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else 0
+
+    def bump_version(self, key):
+        """Atomically increment key's version counter and return the new value"""
+        now = time.time()
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(
+                'INSERT INTO versions (key, version, updated) VALUES (?, ?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET version = versions.version + 1, updated = excluded.updated',
+                (key, int(now), now)
+            )
+            version = conn.execute('SELECT version FROM versions WHERE key = ?', (key,)).fetchone()[0]
+            conn.execute('COMMIT')
+        except sqlite3.Error:
+            conn.execute('ROLLBACK')
+            raise
+        return version
+
+    def append_sample(self, key, sample, capacity=SERIES_CAPACITY):
+        """
+        Append one record to key's ring buffer: one slot upsert and one head
+        update, whatever the series length. A record that only differs from
+        the latest one by its timestamp is skipped.
+        """
+        packed = sample.tobytes()
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            head = conn.execute('SELECT count, last FROM series_heads WHERE key = ?', (key,)).fetchone()
+            count = head[0] if head else 0
+            if head and sample_fields(head[1], sample.dtype) == sample_fields(packed, sample.dtype):
+                conn.execute('ROLLBACK')
+                return False
+            conn.execute(
+                'INSERT OR REPLACE INTO series (key, slot, sample) VALUES (?, ?, ?)', (key, count % capacity, packed)
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO series_heads (key, count, last, updated) VALUES (?, ?, ?, ?)',
+                (key, count + 1, packed, time.time())
+            )
+            conn.execute('COMMIT')
+            return True
+        except sqlite3.Error:
+            conn.execute('ROLLBACK')
+            raise
+
+    def set_worker_snapshot(self, worker, data):
+        """Replace one worker's snapshot; kept apart from the entries, so never evicted or compressed"""
+        self._connect().execute(
+            'INSERT OR REPLACE INTO worker_snapshots (worker, body, updated) VALUES (?, ?, ?)',
+            (worker, encode_cache_data(data), time.time())
+        )
+
+    def worker_snapshots(self, max_age):
+        """Every worker's snapshot published within the last max_age seconds"""
+        rows = self._connect().execute(
+            'SELECT body FROM worker_snapshots WHERE updated >= ?', (time.time() - max_age,)
+        )
+        return [decode_cache_data(row[0]) for row in rows]
+
+    def series_version(self, key):
+        """Records ever appended to key's series, 0 if it has none"""
+        row = self._connect().execute('SELECT count FROM series_heads WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else 0
+
+    def series(self, key, dtype):
+        """Every retained record for key, oldest first"""
+        conn = self._connect()
+        head = conn.execute('SELECT count FROM series_heads WHERE key = ?', (key,)).fetchone()
+        rows = conn.execute('SELECT sample FROM series WHERE key = ? ORDER BY slot', (key,)).fetchall()
+        ring = np.frombuffer(b''.join(row[0] for row in rows), dtype=dtype)
+        if head is None or head[0] <= len(ring):
+            return ring
+        return np.roll(ring, -(head[0] % len(ring)))
+
+def create_cache(backend):
+    if backend == 'memory':
+        return MemoryCache()
+    try:
+        return SQLiteCache(CACHE_DB_PATH)
+    except sqlite3.Error as e:
+        logger.warning("Shared cache unavailable at %s, using per-process cache: %s", CACHE_DB_PATH, e)
+        return MemoryCache()
+
+api_cache = create_cache(CACHE_BACKEND)
+
+# Prometheus metrics: each worker counts locally and publishes a snapshot next
+# to the shared cache (not in it, so it skews neither the byte budget nor the
+# hit counters), and /metrics adds up the snapshots of every live worker
+METRICS_PUBLISH_INTERVAL = 10  # seconds between snapshots from one worker
+METRICS_WORKER_TTL = 300  # snapshots older than this belong to workers that have exited
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+METRIC_DEFINITIONS = {
+    'mlb_upstream_request_duration_seconds': ('histogram', 'Time spent in each statsapi call attempt'),
+    'mlb_upstream_errors_total': ('counter', 'Failed statsapi call attempts by reason (timeout, connection, status)'),
+    'mlb_upstream_retries_total': ('counter', 'statsapi call attempts that were retried'),
+    'mlb_upstream_circuit_opened_total': ('counter', 'Times an endpoint circuit breaker opened'),
+    'mlb_cache_requests_total': ('counter', 'API cache lookups by key family and result (hit, stale, miss)'),
+    'mlb_http_request_duration_seconds': ('histogram', 'Time spent handling each request by route'),
+}
+
+def format_labels(labels):
+    escaped = (
+        (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}' if labels else ''
+
+class Metrics:
+    """Thread-safe counters and histograms in the shape Prometheus expects"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._published = 0
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * len(LATENCY_BUCKETS), 0.0, 0]
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    histogram[0][index] += 1
+                    break
+            histogram[1] += value
+            histogram[2] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'counters': [[name, labels, value] for (name, labels), value in self._counters.items()],
+                'histograms': [
+                    [name, labels, list(buckets), total, count]
+                    for (name, labels), (buckets, total, count) in self._histograms.items()
+                ]
+            }
+
+    def publish(self, force=False):
+        """Share this worker's totals with the other workers, at most every METRICS_PUBLISH_INTERVAL"""
+        now = time.time()
+        if not force and now - self._published < METRICS_PUBLISH_INTERVAL:
+            return
+        self._published = now
+        self.cache.set_worker_snapshot(f'metrics:{os.getpid()}', self.snapshot())
+
+    def collect(self):
+        """Sum the published snapshots of every worker that is still running"""
+        counters = {}
+        histograms = {}
+        for snapshot in self.cache.worker_snapshots(METRICS_WORKER_TTL):
+            for name, labels, value in snapshot['counters']:
+                series = (name, tuple(tuple(label) for label in labels))
+                counters[series] = counters.get(series, 0) + value
+            for name, labels, buckets, total, count in snapshot['histograms']:
+                series = (name, tuple(tuple(label) for label in labels))
+                merged = histograms.setdefault(series, [[0] * len(LATENCY_BUCKETS), 0.0, 0])
+                merged[0] = [a + b for a, b in zip(merged[0], buckets)]
+                merged[1] += total
+                merged[2] += count
+        return counters, histograms
+
+    def render(self):
+        """Prometheus text exposition format"""
+        self.publish(force=True)
+        counters, histograms = self.collect()
+        lines = []
+        for name, (kind, help_text) in METRIC_DEFINITIONS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            if kind == 'counter':
+                for (series_name, labels), value in sorted(counters.items()):
+                    if series_name == name:
+                        lines.append(f'{name}{format_labels(labels)} {value}')
+                continue
+            for (series_name, labels), (buckets, total, count) in sorted(histograms.items()):
+                if series_name != name:
+                    continue
+                cumulative = 0
+                for bound, bucket in zip(LATENCY_BUCKETS, buckets):
+                    cumulative += bucket
+                    lines.append(f'{name}_bucket{format_labels(labels + (("le", bound),))} {cumulative}')
+                lines.append(f'{name}_bucket{format_labels(labels + (("le", "+Inf"),))} {count}')
+                lines.append(f'{name}_sum{format_labels(labels)} {total}')
+                lines.append(f'{name}_count{format_labels(labels)} {count}')
+
+        # Shared cache size comes straight from the cache, not from the workers
+        cache_stats = self.cache.stats()
+        for stat, kind in (('entries', 'gauge'), ('bytes', 'gauge'), ('evictions', 'counter')):
+            metric = f'mlb_cache_{stat}' + ('_total' if kind == 'counter' else '')
+            lines.append(f'# TYPE {metric} {kind}')
+            lines.append(f'{metric} {cache_stats[stat]}')
+        return '\n'.join(lines) + '\n'
+
+metrics = Metrics(api_cache)
+
+class SingleFlight:
+    """
+    Coalesces concurrent refreshes of the same cache key.
+    The caller holding the key's lease runs the loader and stores its
+    result. A stale entry is served straight away while it is revalidated
+    in the background; only a cold key makes callers wait for the leader.
+    """
+
+    BUSY = object()  # another thread or worker is already refreshing the key
+
+    def __init__(self, cache, lease_duration=30, wait_timeout=15, poll_interval=0.05):
+        self.cache = cache
+        self.lease_duration = lease_duration
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._refreshing = set()  # keys this worker is refreshing right now
+        self._refreshing_guard = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='cache-refresh')
+
+    def _start_refresh(self, key):
+        """Claim key for this worker; False if one of its threads already has it"""
+        with self._refreshing_guard:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _finish_refresh(self, key):
+        # Nothing is kept per key once its refresh is over, so the set stays small
+        with self._refreshing_guard:
+            self._refreshing.discard(key)
+
+    def _is_refreshing(self, key):
+        with self._refreshing_guard:
+            return key in self._refreshing
+
+    def fetch(self, key, ttl, loader, store=None):
+        """Return the CacheEntry for key (possibly stale), or None if it could not be loaded"""
+        entry = self.cache.get(key)
+        # Label by key family ('games', 'players', ...) so per-date and per-id keys stay one series
+        family = key.split(':', 1)[0]
+        if entry and entry.is_fresh():
+            metrics.inc('mlb_cache_requests_total', key=family, result='hit')
+            return entry
+
+        if entry is not None:
+            metrics.inc('mlb_cache_requests_total', key=family, result='stale')
+            self.refresh_async(key, ttl, loader, store)
+            return entry
+
+        metrics.inc('mlb_cache_requests_total', key=family, result='miss')
+        refreshed = self.refresh(key, ttl, loader, store=store)
+        if refreshed is not self.BUSY:
+            return refreshed
+        return self._wait_for(key)
+
+    def refresh(self, key, ttl, loader, force=False, store=None):
+        """
+        Run loader() and store its result if no one else is refreshing key.
+        store(data) replaces the plain cache.set() when given.
+        Returns the new entry, None if the loader produced nothing, or BUSY.
+        """
+        # The refreshing set coalesces within this worker, the lease across workers
+        if not self._start_refresh(key):
+            return self.BUSY
+        try:
+            if not self.cache.acquire_lease(key, self.lease_duration):
+                return self.BUSY
+            try:
+                if not force:
+                    latest = self.cache.get(key)
+                    if latest and latest.is_fresh():
+                        return latest
+                data = loader()
+                if data is None:
+                    return None
+                if store is not None:
+                    return store(data)
+                return self.cache.set(key, data, ttl)
+            finally:
+                self.cache.release_lease(key)
+        finally:
+            self._finish_refresh(key)
+
+    def refresh_async(self, key, ttl, loader, store=None):
+        if self._is_refreshing(key):
+            return
+        self._executor.submit(self._refresh_quietly, key, ttl, loader, store)
+
+    def _refresh_quietly(self, key, ttl, loader, store):
+        try:
+            self.refresh(key, ttl, loader, store=store)
+        except Exception as e:
+            logger.error("Error refreshing cache key %s: %s", key, e)
+
+    def _wait_for(self, key):
+        wait_timeout = self.wait_timeout
+        budget = remaining_budget()
+        if budget is not None:
+            wait_timeout = min(wait_timeout, max(budget, 0))
+        deadline = time.time() + wait_timeout
+        while time.time() < deadline:
+            time.sleep(self.poll_interval)
+            entry = self.cache.get(key)
+            if entry and entry.is_fresh():
+                return entry
+            if not self._is_refreshing(key) and not self.cache.lease_held(key):
+                # The leader finished without storing anything
+                return entry
+        return None
+
+single_flight = SingleFlight(api_cache)
+
+def add_cache_headers(response, *entries):
+    """Report how old the cached data behind a response is"""
+    now = time.time()
+    age = max(entry.age(now) for entry in entries)
+    stale_age = max(max(entry.age(now) - entry.ttl, 0) for entry in entries)
+    response.headers['Age'] = str(int(age))
+    response.headers['X-Stale-Age'] = str(int(stale_age))
+    return response
+
+def conditional_response(entry, cache_control=None):
+    """
+    Answer a read request from a cache entry.
+    The ETag is the entry's content hash (computed when it was stored), so
+    a client that already has this content gets a 304 without anything
+    being encoded. Otherwise the pre-encoded body is sent as is, in the
+    best Content-Encoding the client accepts.
+    """
+    etag = entry.etag
+    last_modified = datetime.fromtimestamp(int(entry.timestamp), timezone.utc)
+
+    encoding = negotiate_encoding(entry)
+    # Each content-coding is a different representation, so it gets its own ETag
+    representation_etag = f'{etag}-{encoding}' if encoding else etag
+
+    if request.if_none_match:
+        not_modified = any(
+            request.if_none_match.contains(candidate)
+            for candidate in (etag, f'{etag}-gzip', f'{etag}-br')
+        )
+    else:
+        not_modified = request.if_modified_since is not None and request.if_modified_since >= last_modified
+
+    if not_modified:
+        response = Response(status=304)
+    else:
+        response = Response(entry.encodings[encoding] if encoding else entry.body, mimetype='application/json')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(representation_etag)
+    response.last_modified = last_modified
+    # max-age is the full TTL; browsers subtract the Age header themselves
+    response.headers['Cache-Control'] = cache_control or f'public, max-age={int(entry.ttl)}'
+    return add_cache_headers(response, entry)
+
+def negotiate_encoding(entry):
+    """Pick the pre-compressed variant the client accepts, preferring brotli"""
+    for encoding in ('br', 'gzip'):
+        if encoding in entry.encodings and request.accept_encodings[encoding] > 0:
+            return encoding
+    return None
+
+# MLB Stats API client: per-endpoint timeout (seconds), cache TTL and retry count
+EndpointPolicy = namedtuple('EndpointPolicy', ['timeout', 'ttl', 'retries'])
+MLB_ENDPOINT_POLICIES = {
+    'teams': EndpointPolicy(timeout=5, ttl=CACHE_DURATION, retries=2),
+    'standings': EndpointPolicy(timeout=5, ttl=CACHE_DURATION, retries=2),
+    'schedule': EndpointPolicy(timeout=8, ttl=GAMES_CACHE_DURATION, retries=1),
+    'feed/live': EndpointPolicy(timeout=5, ttl=GAMES_CACHE_DURATION, retries=0),  # bounded by the fan-out deadline
+    'roster': EndpointPolicy(timeout=8, ttl=CACHE_DURATION, retries=1),
+    'boxscore': EndpointPolicy(timeout=8, ttl=LINEUPS_CACHE_DURATION, retries=1),
+    'vsPlayer': EndpointPolicy(timeout=8, ttl=60 * 60, retries=1),  # career lines only move when the two meet
+    'people': EndpointPolicy(timeout=8, ttl=CACHE_DURATION, retries=1),
+}
+DEFAULT_ENDPOINT_POLICY = EndpointPolicy(timeout=10, ttl=CACHE_DURATION, retries=1)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_BACKOFF = 0.25  # seconds; doubled per attempt, with full jitter
+
+# Circuit breaking: an endpoint that keeps failing is not called again until
+# it has had time to recover, so routes go straight to their fallbacks
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failed calls that open an endpoint's circuit
+CIRCUIT_RESET_TIMEOUT = 30  # seconds an open circuit rejects calls before one trial call
+
+# Every request gets a total time budget for its statsapi calls; later calls
+# get whatever is left instead of their endpoint's full timeout
+REQUEST_DEADLINE = float(os.environ.get('REQUEST_DEADLINE', 8))
+request_deadline = contextvars.ContextVar('request_deadline', default=None)
+
+def remaining_budget():
+    """Seconds left in the current request's deadline, or None outside a request"""
+    deadline = request_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+class UpstreamUnavailable(requests.RequestException):
+    """A statsapi call was skipped: its circuit is open or the request's deadline has passed"""
+
+class CircuitBreaker:
+    """
+    Counts consecutive failures of one endpoint within this worker.
+    At the threshold the circuit opens and calls are refused; after the
+    reset timeout a single trial call is let through, and its outcome
+    closes the circuit again or keeps it open for another period.
+    """
+
+    def __init__(self, threshold=CIRCUIT_FAILURE_THRESHOLD, reset_timeout=CIRCUIT_RESET_TIMEOUT):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        return 'half_open' if time.monotonic() - self.opened_at >= self.reset_timeout else 'open'
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        """Count a failed call; True only if it took the circuit from closed or half-open to open"""
+        with self._lock:
+            self.failures += 1
+            trial, self._trial = self._trial, False
+            if self.opened_at is None:
+                if self.failures >= self.threshold:
+                    self.opened_at = time.monotonic()
+                    return True
+                return False
+            if trial and time.monotonic() - self.opened_at >= self.reset_timeout:
+                # The half-open trial failed: open for another period
+                self.opened_at = time.monotonic()
+                return True
+            # A call that started before the circuit opened; the open period stands
+            return False
+
+    def release(self):
+        """End a call whose outcome says nothing about the endpoint's health"""
+        with self._lock:
+            self._trial = False
+
+class MLBStatsClient:
+    """
+    The single way routes talk to the MLB Stats API.
+    A pooled keep-alive Session reuses TCP/TLS connections to statsapi;
+    each named endpoint has its own timeout, cache TTL, retry budget and
+    circuit breaker. Connection errors and 5xx/429 responses are retried
+    with jittered exponential backoff; timeouts are not, so slow calls
+    fail fast. Timeouts are also capped by the request's deadline budget.
+    """
+
+    def __init__(self, base_url, policies, pool_size=32, record_dir=None):
+        self.base_url = base_url.rstrip('/')
+        self.policies = policies
+        self.record_dir = record_dir
+        self.breakers = {}
+        self._breakers_lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def policy(self, endpoint):
+        return self.policies.get(endpoint, DEFAULT_ENDPOINT_POLICY)
+
+    def ttl(self, endpoint):
+        return self.policy(endpoint).ttl
+
+    def breaker(self, endpoint):
+        with self._breakers_lock:
+            return self.breakers.setdefault(endpoint, CircuitBreaker())
+
+    def get(self, endpoint, path):
+        """
+        GET base_url/path using the endpoint's policy; returns the
+        requests.Response. Raises UpstreamUnavailable without calling
+        statsapi when the circuit is open or the deadline has passed.
+        """
+        breaker = self.breaker(endpoint)
+        if not breaker.allow():
+            metrics.inc('mlb_upstream_errors_total', endpoint=endpoint, reason='circuit_open')
+            raise UpstreamUnavailable(f'{endpoint} circuit is open')
+
+        try:
+            response = self._get_with_retries(endpoint, path)
+        except UpstreamUnavailable:
+            breaker.release()
+            raise
+        except requests.Timeout as e:
+            # A timeout cut short by the deadline budget is not the endpoint's fault
+            if getattr(e, 'budget_limited', False):
+                breaker.release()
+            elif breaker.record_failure():
+                self._circuit_opened(endpoint)
+            raise
+        except requests.RequestException:
+            if breaker.record_failure():
+                self._circuit_opened(endpoint)
+            raise
+
+        if response.status_code in RETRY_STATUS_CODES:
+            if breaker.record_failure():
+                self._circuit_opened(endpoint)
+        else:
+            breaker.record_success()
+            if self.record_dir:
+                self._record(endpoint, path, response)
+        return response
+
+    def _record(self, endpoint, path, response):
+        """Save a response as a fixture that mlb_replay.py can serve back"""
+        path = path.lstrip('/')
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+        slug = ''.join(c if c.isalnum() else '_' for c in path.split('?')[0])[:60]
+        digest = hashlib.blake2b(path.encode('utf-8'), digest_size=6).hexdigest()
+        fixture_path = os.path.join(self.record_dir, f'{slug}-{digest}.json')
+        try:
+            os.makedirs(self.record_dir, exist_ok=True)
+            temp_path = f'{fixture_path}.{os.getpid()}.tmp'
+            with open(temp_path, 'w') as fixture_file:
+                json.dump({'endpoint': endpoint, 'path': path, 'status': response.status_code, 'body': body}, fixture_file)
+            os.replace(temp_path, fixture_path)
+        except OSError as e:
+            logger.warning("Could not record fixture for %s: %s", path, e)
+
+    def _circuit_opened(self, endpoint):
+        logger.warning("Circuit opened for statsapi endpoint %s", endpoint)
+        metrics.inc('mlb_upstream_circuit_opened_total', endpoint=endpoint)
+
+    def _get_with_retries(self, endpoint, path):
+        policy = self.policy(endpoint)
+        url = f'{self.base_url}/{path.lstrip("/")}'
+        response = None
+        for attempt in range(policy.retries + 1):
+            timeout = policy.timeout
+            budget = remaining_budget()
+            if budget is not None:
+                if budget <= 0:
+                    metrics.inc('mlb_upstream_errors_total', endpoint=endpoint, reason='deadline')
+                    raise UpstreamUnavailable(f'request deadline passed before calling {endpoint}')
+                timeout = min(timeout, budget)
+
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, timeout=timeout)
+            except requests.RequestException as e:
+                reason = 'timeout' if isinstance(e, requests.Timeout) else 'connection'
+                metrics.observe('mlb_upstream_request_duration_seconds', time.perf_counter() - started, endpoint=endpoint)
+                metrics.inc('mlb_upstream_errors_total', endpoint=endpoint, reason=reason)
+                e.budget_limited = timeout < policy.timeout
+                # Read timeouts are not retried; connect timeouts are connection errors too
+                if not isinstance(e, requests.ConnectionError) or attempt == policy.retries:
+                    raise
+            else:
+                metrics.observe('mlb_upstream_request_duration_seconds', time.perf_counter() - started, endpoint=endpoint)
+                if response.status_code >= 400:
+                    metrics.inc('mlb_upstream_errors_total', endpoint=endpoint, reason=str(response.status_code))
+                if response.status_code not in RETRY_STATUS_CODES or attempt == policy.retries:
+                    return response
+
+            backoff = random.uniform(0, RETRY_BACKOFF * (2 ** attempt))
+            budget = remaining_budget()
+            if budget is not None and backoff >= budget:
+                # No time left for another attempt; give up with what we have
+                if response is not None:
+                    return response
+                raise UpstreamUnavailable(f'request deadline leaves no time to retry {endpoint}')
+            metrics.inc('mlb_upstream_retries_total', endpoint=endpoint)
+            time.sleep(backoff)
+
+mlb_api = MLBStatsClient(MLB_API_BASE, MLB_ENDPOINT_POLICIES, record_dir=MLB_RECORD_DIR)
+
+# Live game feeds are fetched concurrently with one shared deadline
+LIVE_FEED_MAX_WORKERS = 8
+LIVE_FEED_DEADLINE = 5  # seconds for the whole fan-out, not per game
+live_feed_executor = ThreadPoolExecutor(max_workers=LIVE_FEED_MAX_WORKERS, thread_name_prefix='live-feed')
 
 # Team logo URL generator
 def get_team_logo_url(team_id):
@@ -58,6 +1146,47 @@ class Game(db.Model):
     home_team = db.relationship('Team', foreign_keys=[home_team_id])
     away_team = db.relationship('Team', foreign_keys=[away_team_id])
 
+class ArchivedGame(db.Model):
+    """A finished game, stored once its date is complete so it is never fetched again"""
+    id = db.Column(db.Integer, primary_key=True)
+    game_pk = db.Column(db.Integer, nullable=False, index=True)
+    date = db.Column(db.Date, nullable=False, index=True)
+    home_team_id = db.Column(db.Integer, index=True)
+    away_team_id = db.Column(db.Integer, index=True)
+    home_team = db.Column(db.String(100), nullable=False)
+    away_team = db.Column(db.String(100), nullable=False)
+    home_score = db.Column(db.Integer, default=0)
+    away_score = db.Column(db.Integer, default=0)
+    status = db.Column(db.String(20), nullable=False)
+    status_detail = db.Column(db.String(50))
+    venue = db.Column(db.String(100))
+    home_pitcher = db.Column(db.String(100))
+    away_pitcher = db.Column(db.String(100))
+    winning_pitcher = db.Column(db.String(100))
+    losing_pitcher = db.Column(db.String(100))
+    save_pitcher = db.Column(db.String(100))
+    series = db.Column(db.Text)  # JSON series info
+    linescore = db.Column(db.Text)  # JSON list of per-inning runs
+    data = db.Column(db.Text, nullable=False)  # the game exactly as /api/games returns it
+    __table_args__ = (db.UniqueConstraint('game_pk', 'date'),)
+
+class PlayerStatsArchive(db.Model):
+    """Marks a player's closed seasons as stored in PlayerSeasonStats"""
+    player_id = db.Column(db.Integer, primary_key=True)
+    through_season = db.Column(db.Integer, nullable=False)
+    layout = db.Column(db.Text, nullable=False)  # JSON [type, group] pairs in statsapi's order
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class PlayerSeasonStats(db.Model):
+    """One stat row of a season that is over; it can never change, so it is fetched once"""
+    id = db.Column(db.Integer, primary_key=True)
+    player_id = db.Column(db.Integer, nullable=False, index=True)
+    stat_group = db.Column(db.String(20), nullable=False)  # 'hitting' or 'pitching'
+    season = db.Column(db.Integer, nullable=False)
+    sequence = db.Column(db.Integer, nullable=False)  # order within the group's splits
+    data = db.Column(db.Text, nullable=False)  # the row exactly as /api/player/<id>/stats returns it
+    __table_args__ = (db.UniqueConstraint('player_id', 'stat_group', 'sequence'),)
+
 class PitcherBatterMatchup(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     pitcher_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
@@ -233,200 +1362,402 @@ def about():
 def matchup():
     return render_template('matchup.html')
 
+# Static team metadata, keyed by MLB team id
+TEAM_METADATA = {
+    109: {'name': 'Diamondbacks', 'city': 'Arizona', 'league': 'National League', 'division': 'NL West'},
+    144: {'name': 'Braves', 'city': 'Atlanta', 'league': 'National League', 'division': 'NL East'},
+    110: {'name': 'Orioles', 'city': 'Baltimore', 'league': 'American League', 'division': 'AL East'},
+    111: {'name': 'Red Sox', 'city': 'Boston', 'league': 'American League', 'division': 'AL East'},
+    112: {'name': 'Cubs', 'city': 'Chicago', 'league': 'National League', 'division': 'NL Central'},
+    145: {'name': 'White Sox', 'city': 'Chicago', 'league': 'American League', 'division': 'AL Central'},
+    113: {'name': 'Reds', 'city': 'Cincinnati', 'league': 'National League', 'division': 'NL Central'},
+    114: {'name': 'Guardians', 'city': 'Cleveland', 'league': 'American League', 'division': 'AL Central'},
+    115: {'name': 'Rockies', 'city': 'Colorado', 'league': 'National League', 'division': 'NL West'},
+    116: {'name': 'Tigers', 'city': 'Detroit', 'league': 'American League', 'division': 'AL Central'},
+    117: {'name': 'Astros', 'city': 'Houston', 'league': 'American League', 'division': 'AL West'},
+    118: {'name': 'Royals', 'city': 'Kansas City', 'league': 'American League', 'division': 'AL Central'},
+    108: {'name': 'Angels', 'city': 'Los Angeles', 'league': 'American League', 'division': 'AL West'},
+    119: {'name': 'Dodgers', 'city': 'Los Angeles', 'league': 'National League', 'division': 'NL West'},
+    146: {'name': 'Marlins', 'city': 'Miami', 'league': 'National League', 'division': 'NL East'},
+    158: {'name': 'Brewers', 'city': 'Milwaukee', 'league': 'National League', 'division': 'NL Central'},
+    142: {'name': 'Twins', 'city': 'Minnesota', 'league': 'American League', 'division': 'AL Central'},
+    121: {'name': 'Mets', 'city': 'New York', 'league': 'National League', 'division': 'NL East'},
+    147: {'name': 'Yankees', 'city': 'New York', 'league': 'American League', 'division': 'AL East'},
+    133: {'name': 'Athletics', 'city': '', 'league': 'American League', 'division': 'AL West'},
+    143: {'name': 'Phillies', 'city': 'Philadelphia', 'league': 'National League', 'division': 'NL East'},
+    134: {'name': 'Pirates', 'city': 'Pittsburgh', 'league': 'National League', 'division': 'NL Central'},
+    135: {'name': 'Padres', 'city': 'San Diego', 'league': 'National League', 'division': 'NL West'},
+    137: {'name': 'Giants', 'city': 'San Francisco', 'league': 'National League', 'division': 'NL West'},
+    136: {'name': 'Mariners', 'city': 'Seattle', 'league': 'American League', 'division': 'AL West'},
+    138: {'name': 'Cardinals', 'city': 'St. Louis', 'league': 'National League', 'division': 'NL Central'},
+    139: {'name': 'Rays', 'city': 'Tampa Bay', 'league': 'American League', 'division': 'AL East'},
+    140: {'name': 'Rangers', 'city': 'Texas', 'league': 'American League', 'division': 'AL West'},
+    141: {'name': 'Blue Jays', 'city': 'Toronto', 'league': 'American League', 'division': 'AL East'},
+    120: {'name': 'Nationals', 'city': 'Washington', 'league': 'National League', 'division': 'NL East'}
+}
+
+# 2024 Postseason Results - Manual tracking
+POSTSEASON_STATUS_2024 = {
+    147: {'status': 'ELIM_WS', 'round': 'World Series', 'description': 'Lost World Series'},  # Yankees
+    119: {'status': 'WS_CHAMP', 'round': 'World Series', 'description': 'Won World Series'},  # Dodgers
+    121: {'status': 'ELIM_NLCS', 'round': 'NLCS', 'description': 'Lost NLCS'},  # Mets
+    158: {'status': 'ELIM_NL_WC', 'round': 'NL Wild Card', 'description': 'Lost NL Wild Card'},  # Brewers
+    143: {'status': 'ELIM_NLDS', 'round': 'NLDS', 'description': 'Lost NLDS'},  # Phillies
+    135: {'status': 'ELIM_NL_WC', 'round': 'NL Wild Card', 'description': 'Lost NL Wild Card'},  # Padres
+    144: {'status': 'ELIM_NL_WC', 'round': 'NL Wild Card', 'description': 'Lost NL Wild Card'},  # Braves
+    109: {'status': 'ELIM_NL_WC', 'round': 'NL Wild Card', 'description': 'Lost NL Wild Card'},  # Diamondbacks
+    114: {'status': 'ELIM_ALCS', 'round': 'ALCS', 'description': 'Lost ALCS'},  # Guardians
+    117: {'status': 'ELIM_ALDS', 'round': 'ALDS', 'description': 'Lost ALDS'},  # Astros
+    116: {'status': 'ELIM_ALDS', 'round': 'ALDS', 'description': 'Lost ALDS'},  # Tigers
+    141: {'status': 'ELIM_AL_WC', 'round': 'AL Wild Card', 'description': 'Lost AL Wild Card'},  # Blue Jays
+    110: {'status': 'ELIM_AL_WC', 'round': 'AL Wild Card', 'description': 'Lost AL Wild Card'},  # Orioles
+    118: {'status': 'ELIM_AL_WC', 'round': 'AL Wild Card', 'description': 'Lost AL Wild Card'},  # Royals
+}
+
+TEAMS_PAYLOAD_TTL = 24 * 60 * 60  # the merged payload only changes when its sources do
+
 @app.route('/api/teams')
 def get_teams():
     return get_live_teams()
 
 def get_live_teams():
     try:
-        current_year = datetime.now().year
-
-        # 2024 Postseason Results - Manual tracking
-        postseason_status_2024 = {
-            147: {'status': 'ELIM_WS', 'round': 'World Series', 'description': 'Lost World Series'},  # Yankees
-            119: {'status': 'WS_CHAMP', 'round': 'World Series', 'description': 'Won World Series'},  # Dodgers
-            121: {'status': 'ELIM_NLCS', 'round': 'NLCS', 'description': 'Lost NLCS'},  # Mets
-            158: {'status': 'ELIM_NL_WC', 'round': 'NL Wild Card', 'description': 'Lost NL Wild Card'},  # Brewers
-            143: {'status': 'ELIM_NLDS', 'round': 'NLDS', 'description': 'Lost NLDS'},  # Phillies
-            135: {'status': 'ELIM_NL_WC', 'round': 'NL Wild Card', 'description': 'Lost NL Wild Card'},  # Padres
-            144: {'status': 'ELIM_NL_WC', 'round': 'NL Wild Card', 'description': 'Lost NL Wild Card'},  # Braves
-            109: {'status': 'ELIM_NL_WC', 'round': 'NL Wild Card', 'description': 'Lost NL Wild Card'},  # Diamondbacks
-            114: {'status': 'ELIM_ALCS', 'round': 'ALCS', 'description': 'Lost ALCS'},  # Guardians
-            117: {'status': 'ELIM_ALDS', 'round': 'ALDS', 'description': 'Lost ALDS'},  # Astros
-            116: {'status': 'ELIM_ALDS', 'round': 'ALDS', 'description': 'Lost ALDS'},  # Tigers
-            141: {'status': 'ELIM_AL_WC', 'round': 'AL Wild Card', 'description': 'Lost AL Wild Card'},  # Blue Jays
-            110: {'status': 'ELIM_AL_WC', 'round': 'AL Wild Card', 'description': 'Lost AL Wild Card'},  # Orioles
-            118: {'status': 'ELIM_AL_WC', 'round': 'AL Wild Card', 'description': 'Lost AL Wild Card'},  # Royals
-        }
+        # Teams and standings come from the shared cache; one caller refreshes each on a miss
+        teams_entry = single_flight.fetch('teams', mlb_api.ttl('teams'), load_teams_data)
+        if not teams_entry or not teams_entry.data:
+            return get_fallback_teams()
 
-        # Check cache for teams data
-        now = time.time()
-        if api_cache['teams']['data'] and (now - api_cache['teams']['timestamp']) < CACHE_DURATION:
-            data = api_cache['teams']['data']
-        else:
-            # Fetch teams data
-            url = f'{MLB_API_BASE}/teams?sportId=1'
-            response = requests.get(url, timeout=10)
+        standings_entry = single_flight.fetch('standings', mlb_api.ttl('standings'), load_standings_data)
+        source_entries = [entry for entry in (teams_entry, standings_entry) if entry]
 
-            if response.status_code != 200:
-                return get_fallback_teams()
+        payload_entry = fetch_teams_payload(teams_entry, standings_entry)
+        # Browsers should recheck as often as the sources can change
+        max_age = int(min(entry.ttl for entry in source_entries))
+        return conditional_response(payload_entry, cache_control=f'public, max-age={max_age}')
 
-            data = response.json()
-            api_cache['teams']['data'] = data
-            api_cache['teams']['timestamp'] = now
+    except Exception as e:
+        logger.error("Error fetching live teams: %s", e)
+        return get_fallback_teams()
 
-        # Check cache for standings data
-        if api_cache['standings']['data'] and (now - api_cache['standings']['timestamp']) < CACHE_DURATION:
-            standings_json = api_cache['standings']['data']
-        else:
-            # Fetch standings data
-            standings_response = requests.get(f'{MLB_API_BASE}/standings?leagueId=103,104&season={current_year}', timeout=10)
-            if standings_response.status_code == 200:
-                standings_json = standings_response.json()
-                api_cache['standings']['data'] = standings_json
-                api_cache['standings']['timestamp'] = now
+def fetch_teams_payload(teams_entry, standings_entry):
+    """
+    The merged teams list as its own cache entry, keyed by the content hashes
+    of the teams and standings entries it was built from. It is only rebuilt
+    (and re-encoded) when one of them actually changes.
+    """
+    sources = f"{teams_entry.etag}.{standings_entry.etag if standings_entry else 'none'}"
+    key = f"teams_payload:{content_etag(sources.encode('utf-8'))}"
+    timestamp = max(entry.timestamp for entry in (teams_entry, standings_entry) if entry)
+
+    def store(payload):
+        # Drop payloads built from older sources before storing this one
+        for old_key in api_cache.keys('teams_payload:'):
+            if old_key != key:
+                api_cache.delete(old_key)
+        return api_cache.set(key, payload, TEAMS_PAYLOAD_TTL, timestamp=timestamp)
+
+    return single_flight.fetch(
+        key, TEAMS_PAYLOAD_TTL,
+        lambda: build_teams_payload(teams_entry.data, standings_entry.data if standings_entry else {}),
+        store=store
+    )
+
+def parse_standings(standings_json):
+    """Record, rank and playoff status for each team id in a standings response"""
+    standings_data = {}
+
+    for record in standings_json.get('records', []):
+        for team_record in record.get('teamRecords', []):
+            team_id = team_record.get('team', {}).get('id')
+            if team_id:
+                # Determine playoff status and display indicator
+                playoff_status = None
+                display_indicator = None
+                clinch_indicator = team_record.get('clinchIndicator', '')
+                wild_card_elim = team_record.get('wildCardEliminationNumber', '')
+                elim_number_sport = team_record.get('eliminationNumberSport', '')
+
+                if clinch_indicator == 'x':
+                    playoff_status = 'Clinched Playoff Spot'
+                    display_indicator = 'PO'
+                elif clinch_indicator == 'y':
+                    playoff_status = 'Clinched Division'
+                    display_indicator = 'DIV'
+                elif clinch_indicator == 'z':
+                    playoff_status = 'Clinched Best Record'
+                    display_indicator = 'BR'
+                elif clinch_indicator == 'w':
+                    playoff_status = 'Clinched Wild Card'
+                    display_indicator = 'WC'
+                elif clinch_indicator == 'e':
+                    playoff_status = 'Eliminated from Playoffs'
+                    display_indicator = 'E'
+                # Check if team is eliminated (wildCardEliminationNumber = 'E' or eliminationNumberSport = 'E')
+                elif not clinch_indicator and (wild_card_elim == 'E' or elim_number_sport == 'E'):
+                    playoff_status = 'Eliminated from Playoffs'
+                    display_indicator = 'E'
+                    clinch_indicator = 'e'
+
+                standings_data[team_id] = {
+                    'wins': team_record.get('wins', 0),
+                    'losses': team_record.get('losses', 0),
+                    'win_pct': team_record.get('winningPercentage', '.000'),
+                    'games_back': team_record.get('gamesBack', '-'),
+                    'division_rank': team_record.get('divisionRank', '-'),
+                    'playoff_status': playoff_status,
+                    'clinch_indicator': clinch_indicator,
+                    'display_indicator': display_indicator
+                }
+
+    return standings_data
+
+def build_teams_payload(data, standings_json):
+    """Merge the teams list with standings and postseason status"""
+    current_year = datetime.now().year
+    standings_data = parse_standings(standings_json) if standings_json else {}
+    teams = []
+
+    for team in data.get('teams', []):
+        if team.get('sport', {}).get('id') == 1:  # MLB only
+            team_id = team.get('id')
+
+            # Use our normalized names if available, otherwise use API data
+            normalized = TEAM_METADATA.get(team_id)
+            if normalized:
+                team_info = {
+                    'id': team_id,
+                    'name': normalized['name'],
+                    'abbreviation': team.get('abbreviation', ''),
+                    'city': normalized['city'],
+                    'league': normalized['league'],
+                    'division': normalized['division'],
+                    'logo_url': get_team_logo_url(team_id)
+                }
             else:
-                standings_json = {}
-
-        standings_data = {}
-
-        if standings_json:
-            # First pass: collect all teams with playoff spots
-            playoff_teams = set()
-            for record in standings_json.get('records', []):
-                for team_record in record.get('teamRecords', []):
-                    clinch_indicator = team_record.get('clinchIndicator', '')
-                    if clinch_indicator in ['x', 'y', 'z', 'w']:
-                        team_id = team_record.get('team', {}).get('id')
-                        if team_id:
-                            playoff_teams.add(team_id)
-
-            # Second pass: determine status for all teams
-            for record in standings_json.get('records', []):
-                for team_record in record.get('teamRecords', []):
-                    team_id = team_record.get('team', {}).get('id')
-                    if team_id:
-                        # Determine playoff status and display indicator
-                        playoff_status = None
-                        display_indicator = None
-                        clinch_indicator = team_record.get('clinchIndicator', '')
-                        wild_card_elim = team_record.get('wildCardEliminationNumber', '')
-                        elim_number_sport = team_record.get('eliminationNumberSport', '')
-
-                        if clinch_indicator == 'x':
-                            playoff_status = 'Clinched Playoff Spot'
-                            display_indicator = 'PO'
-                        elif clinch_indicator == 'y':
-                            playoff_status = 'Clinched Division'
-                            display_indicator = 'DIV'
-                        elif clinch_indicator == 'z':
-                            playoff_status = 'Clinched Best Record'
-                            display_indicator = 'BR'
-                        elif clinch_indicator == 'w':
-                            playoff_status = 'Clinched Wild Card'
-                            display_indicator = 'WC'
-                        elif clinch_indicator == 'e':
-                            playoff_status = 'Eliminated from Playoffs'
-                            display_indicator = 'E'
-                        # Check if team is eliminated (wildCardEliminationNumber = 'E' or eliminationNumberSport = 'E')
-                        elif not clinch_indicator and (wild_card_elim == 'E' or elim_number_sport == 'E'):
-                            playoff_status = 'Eliminated from Playoffs'
-                            display_indicator = 'E'
-                            clinch_indicator = 'e'
-
-                        standings_data[team_id] = {
-                            'wins': team_record.get('wins', 0),
-                            'losses': team_record.get('losses', 0),
-                            'win_pct': team_record.get('winningPercentage', '.000'),
-                            'games_back': team_record.get('gamesBack', '-'),
-                            'division_rank': team_record.get('divisionRank', '-'),
-                            'playoff_status': playoff_status,
-                            'clinch_indicator': clinch_indicator,
-                            'display_indicator': display_indicator
-                        }
-
-        data = response.json()
-        teams = []
-
-        # Team name normalization mapping with league/division
-        team_name_map = {
-            109: {'name': 'Diamondbacks', 'city': 'Arizona', 'league': 'National League', 'division': 'NL West'},
-            144: {'name': 'Braves', 'city': 'Atlanta', 'league': 'National League', 'division': 'NL East'},
-            110: {'name': 'Orioles', 'city': 'Baltimore', 'league': 'American League', 'division': 'AL East'},
-            111: {'name': 'Red Sox', 'city': 'Boston', 'league': 'American League', 'division': 'AL East'},
-            112: {'name': 'Cubs', 'city': 'Chicago', 'league': 'National League', 'division': 'NL Central'},
-            145: {'name': 'White Sox', 'city': 'Chicago', 'league': 'American League', 'division': 'AL Central'},
-            113: {'name': 'Reds', 'city': 'Cincinnati', 'league': 'National League', 'division': 'NL Central'},
-            114: {'name': 'Guardians', 'city': 'Cleveland', 'league': 'American League', 'division': 'AL Central'},
-            115: {'name': 'Rockies', 'city': 'Colorado', 'league': 'National League', 'division': 'NL West'},
-            116: {'name': 'Tigers', 'city': 'Detroit', 'league': 'American League', 'division': 'AL Central'},
-            117: {'name': 'Astros', 'city': 'Houston', 'league': 'American League', 'division': 'AL West'},
-            118: {'name': 'Royals', 'city': 'Kansas City', 'league': 'American League', 'division': 'AL Central'},
-            108: {'name': 'Angels', 'city': 'Los Angeles', 'league': 'American League', 'division': 'AL West'},
-            119: {'name': 'Dodgers', 'city': 'Los Angeles', 'league': 'National League', 'division': 'NL West'},
-            146: {'name': 'Marlins', 'city': 'Miami', 'league': 'National League', 'division': 'NL East'},
-            158: {'name': 'Brewers', 'city': 'Milwaukee', 'league': 'National League', 'division': 'NL Central'},
-            142: {'name': 'Twins', 'city': 'Minnesota', 'league': 'American League', 'division': 'AL Central'},
-            121: {'name': 'Mets', 'city': 'New York', 'league': 'National League', 'division': 'NL East'},
-            147: {'name': 'Yankees', 'city': 'New York', 'league': 'American League', 'division': 'AL East'},
-            133: {'name': 'Athletics', 'city': '', 'league': 'American League', 'division': 'AL West'},
-            143: {'name': 'Phillies', 'city': 'Philadelphia', 'league': 'National League', 'division': 'NL East'},
-            134: {'name': 'Pirates', 'city': 'Pittsburgh', 'league': 'National League', 'division': 'NL Central'},
-            135: {'name': 'Padres', 'city': 'San Diego', 'league': 'National League', 'division': 'NL West'},
-            137: {'name': 'Giants', 'city': 'San Francisco', 'league': 'National League', 'division': 'NL West'},
-            136: {'name': 'Mariners', 'city': 'Seattle', 'league': 'American League', 'division': 'AL West'},
-            138: {'name': 'Cardinals', 'city': 'St. Louis', 'league': 'National League', 'division': 'NL Central'},
-            139: {'name': 'Rays', 'city': 'Tampa Bay', 'league': 'American League', 'division': 'AL East'},
-            140: {'name': 'Rangers', 'city': 'Texas', 'league': 'American League', 'division': 'AL West'},
-            141: {'name': 'Blue Jays', 'city': 'Toronto', 'league': 'American League', 'division': 'AL East'},
-            120: {'name': 'Nationals', 'city': 'Washington', 'league': 'National League', 'division': 'NL East'}
-        }
+                team_info = {
+                    'id': team_id,
+                    'name': team.get('teamName', ''),
+                    'abbreviation': team.get('abbreviation', ''),
+                    'city': team.get('locationName', ''),
+                    'league': 'Unknown',
+                    'division': 'Unknown',
+                    'logo_url': get_team_logo_url(team_id)
+                }
 
-        for team in data.get('teams', []):
-            if team.get('sport', {}).get('id') == 1:  # MLB only
-                team_id = team.get('id')
-
-                # Use our normalized names if available, otherwise use API data
-                if team_id in team_name_map:
-                    normalized = team_name_map[team_id]
-                    team_info = {
-                        'id': team_id,
-                        'name': normalized['name'],
-                        'abbreviation': team.get('abbreviation', ''),
-                        'city': normalized['city'],
-                        'league': normalized['league'],
-                        'division': normalized['division'],
-                        'logo_url': get_team_logo_url(team_id)
-                    }
-                else:
-                    team_info = {
-                        'id': team_id,
-                        'name': team.get('teamName', ''),
-                        'abbreviation': team.get('abbreviation', ''),
-                        'city': team.get('locationName', ''),
-                        'league': 'Unknown',
-                        'division': 'Unknown',
-                        'logo_url': get_team_logo_url(team_id)
-                    }
+            # Add standings data if available
+            if team_id in standings_data:
+                team_info.update(standings_data[team_id])
+
+            # Add postseason status for 2024
+            if current_year == 2024 and team_id in POSTSEASON_STATUS_2024:
+                ps_status = POSTSEASON_STATUS_2024[team_id]
+                team_info['postseason_status'] = ps_status['status']
+                team_info['postseason_round'] = ps_status['round']
+                team_info['postseason_description'] = ps_status['description']
+
+            teams.append(team_info)
+
+    return teams if teams else get_fallback_teams_data()
+
+def load_teams_data():
+    response = mlb_api.get('teams', 'teams?sportId=1')
+    if response.status_code != 200:
+        return None
+    return response.json()
+
+def load_standings_data():
+    current_year = datetime.now().year
+    response = mlb_api.get('standings', f'standings?leagueId=103,104&season={current_year}')
+    if response.status_code != 200:
+        return None
+    return response.json()
+
+# Playoff odds: Monte Carlo over the rest of the regular season
+PLAYOFF_SIMULATIONS = int(os.environ.get('PLAYOFF_SIMULATIONS', 20000))
+PLAYOFF_SIMULATION_CHUNK = 2500  # seasons simulated per task
+# Each pool process costs its own memory; one chunk takes ~0.1 s in the web
+# worker, so the pool is opt-in and exits again when it goes unused
+PLAYOFF_PROCESSES = int(os.environ.get('PLAYOFF_PROCESSES', 1))
+PLAYOFF_POOL_IDLE = 300  # seconds without simulations before the pool's processes exit
+PLAYOFF_ODDS_TTL = 24 * 60 * 60  # keyed by games decided, so it only goes stale when one ends
+PRIOR_GAMES = 60  # games of .500 play blended into each record to temper early-season streaks
+HOME_FIELD_ODDS = 0.54 / 0.46
+simulation_pool = None
+simulation_pool_used = 0
+simulation_pool_lock = threading.Lock()
+
+@app.route('/api/standings/odds')
+def get_playoff_odds():
+    """Division, wild card and bye probabilities for every team"""
+    try:
+        standings_entry = single_flight.fetch('standings', mlb_api.ttl('standings'), load_standings_data)
+        if not standings_entry or not standings_entry.data or not standings_entry.data.get('records'):
+            return jsonify({'message': 'Standings not available'}), 503
 
-                # Add standings data if available
-                if team_id in standings_data:
-                    team_info.update(standings_data[team_id])
+        odds_entry = fetch_playoff_odds(standings_entry)
+        if odds_entry is None:
+            return jsonify({'message': 'Playoff odds not available'}), 503
+        return conditional_response(odds_entry, cache_control=f"public, max-age={int(mlb_api.ttl('standings'))}")
 
-                # Add postseason status for 2024
-                if current_year == 2024 and team_id in postseason_status_2024:
-                    ps_status = postseason_status_2024[team_id]
-                    team_info['postseason_status'] = ps_status['status']
-                    team_info['postseason_round'] = ps_status['round']
-                    team_info['postseason_description'] = ps_status['description']
+    except Exception as e:
+        logger.error("Error computing playoff odds: %s", e)
+        return jsonify({'message': 'Playoff odds not available'}), 503
+
+def fetch_playoff_odds(standings_entry):
+    """
+    Odds are cached under the number of games decided so far (every final
+    game adds exactly one win to the standings), so they are recomputed
+    once per final game rather than on a timer.
+    """
+    teams = parse_standings_teams(standings_entry.data)
+    decided = sum(team['wins'] for team in teams)
+    season = datetime.now().year
+    key = f'playoff_odds:{season}:{decided}'
+
+    def store(odds):
+        for old_key in api_cache.keys('playoff_odds:'):
+            if old_key != key:
+                api_cache.delete(old_key)
+        return api_cache.set(key, odds, PLAYOFF_ODDS_TTL)
+
+    return single_flight.fetch(key, PLAYOFF_ODDS_TTL, lambda: load_playoff_odds(teams, season), store=store)
+
+def parse_standings_teams(standings_json):
+    """Flat list of team records with league and division ids from a standings response"""
+    teams = []
+    for record in standings_json.get('records', []):
+        league_id = record.get('league', {}).get('id')
+        division_id = record.get('division', {}).get('id')
+        for team_record in record.get('teamRecords', []):
+            team_id = team_record.get('team', {}).get('id')
+            if team_id:
+                teams.append({
+                    'id': team_id,
+                    'league_id': league_id,
+                    'division_id': division_id,
+                    'wins': team_record.get('wins', 0),
+                    'losses': team_record.get('losses', 0)
+                })
+    return teams
 
-                teams.append(team_info)
+def load_remaining_games(season):
+    """(home_id, away_id) for every regular season game not yet decided, or None on failure"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    response = mlb_api.get(
+        'schedule',
+        f'schedule?sportId=1&gameType=R&startDate={today}&endDate={season}-12-31'
+        '&fields=dates,games,teams,home,away,team,id,status,abstractGameState,detailedState'
+    )
+    if response.status_code != 200:
+        return None
+
+    games = []
+    for date_data in response.json().get('dates', []):
+        for game in date_data.get('games', []):
+            status = game.get('status', {})
+            # Postponed games reappear on their makeup date
+            if status.get('abstractGameState') == 'Final' or status.get('detailedState') in ARCHIVE_DONE_STATES:
+                continue
+            home_id = game.get('teams', {}).get('home', {}).get('team', {}).get('id')
+            away_id = game.get('teams', {}).get('away', {}).get('team', {}).get('id')
+            if home_id and away_id:
+                games.append((home_id, away_id))
+    return games
+
+def load_playoff_odds(teams, season):
+    remaining = load_remaining_games(season)
+    if remaining is None:
+        return None
+
+    index = {team['id']: position for position, team in enumerate(teams)}
+    remaining = [(home, away) for home, away in remaining if home in index and away in index]
+    wins = np.array([team['wins'] for team in teams], dtype=np.float64)
+    losses = np.array([team['losses'] for team in teams], dtype=np.float64)
+    home = np.array([index[home] for home, _ in remaining], dtype=np.int64)
+    away = np.array([index[away] for _, away in remaining], dtype=np.int64)
+
+    # Log5 with home field advantage on records regressed towards .500
+    strength = (wins + PRIOR_GAMES / 2) / (wins + losses + PRIOR_GAMES)
+    odds = strength / (1 - strength)
+    home_odds = odds[home] / odds[away] * HOME_FIELD_ODDS
+    home_win_prob = home_odds / (1 + home_odds)
+
+    league = np.array([team['league_id'] or 0 for team in teams])
+    division = np.array([team['division_id'] or 0 for team in teams])
+    counts = run_playoff_simulations(wins, home, away, home_win_prob, league, division)
+
+    results = []
+    for position, team in enumerate(teams):
+        metadata = TEAM_METADATA.get(team['id'], {})
+        division_odds = float(counts['division'][position]) / PLAYOFF_SIMULATIONS
+        wild_card_odds = float(counts['wild_card'][position]) / PLAYOFF_SIMULATIONS
+        results.append({
+            'id': team['id'],
+            'name': metadata.get('name', ''),
+            'league': metadata.get('league', 'Unknown'),
+            'division': metadata.get('division', 'Unknown'),
+            'wins': team['wins'],
+            'losses': team['losses'],
+            'projected_wins': round(float(counts['wins'][position]) / PLAYOFF_SIMULATIONS, 1),
+            'division_odds': round(division_odds * 100, 1),
+            'wild_card_odds': round(wild_card_odds * 100, 1),
+            'bye_odds': round(float(counts['bye'][position]) / PLAYOFF_SIMULATIONS * 100, 1),
+            'playoff_odds': round((division_odds + wild_card_odds) * 100, 1)
+        })
+    results.sort(key=lambda team: (team['league'], team['division'], -team['playoff_odds'], -team['wins']))
+
+    return {
+        'season': season,
+        'simulations': PLAYOFF_SIMULATIONS,
+        'remaining_games': len(remaining),
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'teams': results
+    }
 
-        return jsonify(teams if teams else get_fallback_teams_data())
+def get_simulation_pool():
+    """Process pool for the simulations, started on first use and shut down once idle"""
+    global simulation_pool, simulation_pool_used
+    with simulation_pool_lock:
+        if simulation_pool is None and PLAYOFF_PROCESSES > 1:
+            # spawn rather than fork: forking a threaded server process can copy held locks
+            simulation_pool = ProcessPoolExecutor(
+                max_workers=PLAYOFF_PROCESSES, mp_context=multiprocessing.get_context('spawn')
+            )
+        simulation_pool_used = time.time()
+        if simulation_pool is not None:
+            timer = threading.Timer(PLAYOFF_POOL_IDLE, shutdown_idle_simulation_pool)
+            timer.daemon = True
+            timer.start()
+        return simulation_pool
+
+def shutdown_idle_simulation_pool():
+    global simulation_pool
+    with simulation_pool_lock:
+        if simulation_pool is not None and time.time() - simulation_pool_used >= PLAYOFF_POOL_IDLE:
+            simulation_pool.shutdown(wait=False)
+            simulation_pool = None
+
+def run_playoff_simulations(wins, home, away, home_win_prob, league, division):
+    """Split the simulations into seeded chunks and add up the per-team counts"""
+    global simulation_pool
+    sizes = [PLAYOFF_SIMULATION_CHUNK] * (PLAYOFF_SIMULATIONS // PLAYOFF_SIMULATION_CHUNK)
+    if PLAYOFF_SIMULATIONS % PLAYOFF_SIMULATION_CHUNK:
+        sizes.append(PLAYOFF_SIMULATIONS % PLAYOFF_SIMULATION_CHUNK)
+    seeds = np.random.SeedSequence().spawn(len(sizes))
+    tasks = [(seed, size, wins, home, away, home_win_prob, league, division) for seed, size in zip(seeds, sizes)]
+
+    pool = get_simulation_pool()
+    try:
+        chunks = list(pool.map(simulate_seasons, *zip(*tasks))) if pool else None
+    except BrokenProcessPool as e:
+        logger.warning("Simulation pool failed, simulating in process: %s", e)
+        with simulation_pool_lock:
+            simulation_pool = None
+        chunks = None
+    if chunks is None:
+        chunks = [simulate_seasons(*task) for task in tasks]
 
-    except Exception as e:
-        print(f"Error fetching live teams: {e}")
-        return get_fallback_teams()
+    return {name: sum(chunk[name] for chunk in chunks) for name in chunks[0]}
 
 def get_fallback_teams():
     teams = Team.query.all()
@@ -484,202 +1815,589 @@ def get_games_by_date(date_str):
     """Get games for a specific date (YYYY-MM-DD format)"""
     return get_live_games(date_str)
 
+# Server-Sent Events stream of scoreboard changes
+STREAM_POLL_INTERVAL = 2  # seconds between checks of the shared cache
+STREAM_HEARTBEAT_INTERVAL = 15
+STREAM_MAX_DURATION = 300  # close after this long; EventSource reconnects on its own
+# Each open stream holds a worker thread, so only this many per worker; the
+# rest are refused and the page falls back to polling ?since=
+STREAM_MAX_CLIENTS = int(os.environ.get('STREAM_MAX_CLIENTS', '8'))
+stream_slots = threading.BoundedSemaphore(STREAM_MAX_CLIENTS)
+def format_sse(event, data, event_id=None):
+    message = f'event: {event}\ndata: {json.dumps(data, separators=(",", ":"))}\n'
+    if event_id is not None:
+        message += f'id: {event_id}\n'
+    return message + '\n'
+
+def diff_live_games(previous, current):
+    """
+    Return {game_id: changed fields} between two scoreboard snapshots.
+    Every field is compared (decisions, pitchers, series status...), since
+    the stream's baseline moves on each tick; a dropped field is sent as None.
+    """
+    changes = {}
+    for game_id, game in current.items():
+        before = previous.get(game_id, {})
+        changed = {
+            field: game.get(field) for field in game.keys() | before.keys()
+            if field != 'id' and game.get(field) != before.get(field)
+        }
+        if changed:
+            changes[game_id] = changed
+    return changes
+
+@app.route('/api/games/stream')
+def stream_games():
+    """
+    Push scoreboard changes for a date (default today) as they land in the cache.
+    Sends a full 'snapshot' event first, then one 'game' event per changed game.
+    """
+    date_str = request.args.get('date') or datetime.now().strftime('%Y-%m-%d')
+    last_event_id = request.headers.get('Last-Event-ID', type=int)
+    if not stream_slots.acquire(blocking=False):
+        # A non-200 answer closes the EventSource for good instead of reconnecting
+        response = jsonify({'message': 'Too many open streams; poll /api/games/<date>?since=<version> instead'})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(STREAM_MAX_DURATION)
+        return response
+
+    def load_snapshot():
+        entry = fetch_games_entry(date_str)
+        return entry, {game['id']: game for game in (entry.data if entry else [])}
+
+    def generate():
+        entry, games = load_snapshot()
+        version = entry.version if entry else 0
+        yield 'retry: 3000\n\n'
+
+        # A reconnecting client only needs what changed since its last event
+        delta = build_games_delta(date_str, entry, last_event_id) if entry and last_event_id is not None else None
+        if delta is not None and not delta['full'] and not delta['removed']:
+            for game in delta['games']:
+                yield format_sse('game', game, version)
+        else:
+            yield format_sse('snapshot', {'date': date_str, 'games': list(games.values())}, version)
+
+        started = last_sent = time.time()
+        while time.time() - started < STREAM_MAX_DURATION:
+            time.sleep(STREAM_POLL_INTERVAL)
+            entry, current = load_snapshot()
+
+            if entry is not None and entry.version != version:
+                version = entry.version
+                if current.keys() != games.keys():
+                    # Games added or removed: resend everything
+                    yield format_sse('snapshot', {'date': date_str, 'games': list(current.values())}, version)
+                    last_sent = time.time()
+                else:
+                    for game_id, changed in diff_live_games(games, current).items():
+                        yield format_sse('game', {'id': game_id, **changed}, version)
+                        last_sent = time.time()
+                games = current
+
+            if time.time() - last_sent >= STREAM_HEARTBEAT_INTERVAL:
+                yield ': keep-alive\n\n'
+                last_sent = time.time()
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    # Runs when the client goes away or the stream ends, even if it never started
+    response.call_on_close(stream_slots.release)
+    return response
+
 def get_live_games(date_str=None):
     try:
         # Use provided date or default to today
         if date_str is None:
             date_str = datetime.now().strftime('%Y-%m-%d')
 
-        # Check cache for games data (shorter cache for live games - 15 seconds)
-        now = time.time()
-        if date_str in api_cache['games']:
-            cache_entry = api_cache['games'][date_str]
-            if (now - cache_entry['timestamp']) < 15:  # 15 second cache for games
-                return jsonify(cache_entry['data'])
+        # Shorter cache for live games; concurrent misses share one refresh
+        games_entry = fetch_games_entry(date_str)
+        if games_entry is None:
+            return get_fallback_games()
 
-        url = f'{MLB_API_BASE}/schedule?sportId=1&date={date_str}&hydrate=venue,linescore,probablePitcher,seriesStatus,decisions,weather'
-        response = requests.get(url, timeout=10)
+        # ?since=<version> returns only what changed after that version
+        since = request.args.get('since', type=int)
+        if since is not None:
+            response = add_cache_headers(jsonify(build_games_delta(date_str, games_entry, since)), games_entry)
+            response.headers['Cache-Control'] = 'no-cache'
+        else:
+            response = conditional_response(games_entry)
+        response.headers['X-Games-Version'] = str(games_entry.version)
+        return response
 
-        if response.status_code != 200:
-            return get_fallback_games()
+    except Exception as e:
+        logger.error("Error fetching live games: %s", e)
+        return get_fallback_games()
 
-        data = response.json()
-        games = []
-
-        if 'dates' in data and len(data['dates']) > 0:
-            for date_data in data['dates']:
-                for game in date_data.get('games', []):
-                    home_team_data = game.get('teams', {}).get('home', {}).get('team', {})
-                    away_team_data = game.get('teams', {}).get('away', {}).get('team', {})
-
-                    home_team_id = home_team_data.get('id')
-                    away_team_id = away_team_data.get('id')
-
-                    # Get venue information
-                    venue = game.get('venue', {})
-                    venue_name = venue.get('name', 'TBD')
-
-                    # Get game time in ISO format (let frontend handle timezone conversion)
-                    game_date = game.get('gameDate', '')
-
-                    # Get additional game information
-                    status_detail = game.get('status', {}).get('detailedState', 'Scheduled')
-                    inning = game.get('linescore', {}).get('currentInningOrdinal', '')
-                    inning_state = game.get('linescore', {}).get('inningState', '')
-
-                    # Get live play-by-play data if game is in progress
-                    live_data = {}
-                    if game.get('status', {}).get('statusCode') in ['I', 'IR', 'IT', 'IW']:
-                        # Fetch live game feed for current at-bat information
-                        game_pk = game.get('gamePk')
-                        try:
-                            live_feed_url = f'{MLB_API_BASE}/game/{game_pk}/feed/live'
-                            live_response = requests.get(live_feed_url, timeout=10)
-                            print(f"[LIVE FEED] Game {game_pk}: HTTP {live_response.status_code}")
-
-                            if live_response.status_code == 200:
-                                live_data_json = live_response.json()
-                                live_play = live_data_json.get('liveData', {})
-                                plays = live_play.get('plays', {})
-                                current_play = plays.get('currentPlay', {})
-
-                                print(f"[LIVE FEED] Game {game_pk}: currentPlay exists = {current_play is not None and len(current_play) > 0}")
-
-                                if current_play:
-                                    # Get count
-                                    count = current_play.get('count', {})
-                                    balls = count.get('balls', 0)
-                                    strikes = count.get('strikes', 0)
-                                    outs = count.get('outs', 0)
-
-                                    # Get current batter
-                                    matchup = current_play.get('matchup', {})
-                                    batter_data = matchup.get('batter', {})
-                                    batter_name = batter_data.get('fullName', '')
-                                    batter_id = batter_data.get('id', 0)
-
-                                    # Get current pitcher
-                                    pitcher_data = matchup.get('pitcher', {})
-                                    pitcher_name = pitcher_data.get('fullName', '')
-                                    pitcher_id = pitcher_data.get('id', 0)
-
-                                    if batter_name and pitcher_name:
-                                        live_data = {
-                                            'balls': balls,
-                                            'strikes': strikes,
-                                            'outs': outs,
-                                            'current_batter': batter_name,
-                                            'current_batter_id': batter_id,
-                                            'current_pitcher': pitcher_name,
-                                            'current_pitcher_id': pitcher_id
-                                        }
-                                        print(f"[LIVE FEED] Game {game_pk}: {pitcher_name} vs {batter_name}, Count: {balls}-{strikes}, Outs: {outs}")
-                                    else:
-                                        print(f"[LIVE FEED] Game {game_pk}: currentPlay exists but missing batter/pitcher data")
-                                else:
-                                    print(f"[LIVE FEED] Game {game_pk}: No currentPlay data (likely between innings)")
-                            else:
-                                print(f"[LIVE FEED] Game {game_pk}: API returned {live_response.status_code}")
-                        except Exception as e:
-                            print(f"[LIVE FEED ERROR] Game {game_pk}: {e}")
-                            live_data = {}
-
-                    # Get probable pitchers
-                    home_pitcher = ''
-                    away_pitcher = ''
-                    if 'probablePitchers' in game:
-                        home_pitcher_data = game['probablePitchers'].get('home', {})
-                        away_pitcher_data = game['probablePitchers'].get('away', {})
-                        home_pitcher = home_pitcher_data.get('fullName', '')
-                        away_pitcher = away_pitcher_data.get('fullName', '')
-
-                    # Get series information (for playoffs)
-                    series_info = {}
-                    if 'seriesStatus' in game:
-                        series_status = game['seriesStatus']
-                        winning_team = series_status.get('winningTeam', {})
-                        losing_team = series_status.get('losingTeam', {})
-                        winning_team_id = winning_team.get('id')
-
-                        # Determine which team is home/away and their wins
-                        if winning_team_id == home_team_id:
-                            home_wins = series_status.get('wins', 0)
-                            away_wins = series_status.get('losses', 0)
-                        else:
-                            away_wins = series_status.get('wins', 0)
-                            home_wins = series_status.get('losses', 0)
-
-                        series_info = {
-                            'series_description': series_status.get('shortName', ''),
-                            'series_result': series_status.get('result', ''),
-                            'series_game_number': series_status.get('gameNumber', 0),
-                            'games_needed': series_status.get('totalGames', 0),
-                            'home_wins': home_wins,
-                            'away_wins': away_wins,
-                            'is_tied': series_status.get('isTied', False)
-                        }
-
-                    # Get weather information
-                    weather_info = {}
-                    if 'weather' in game:
-                        weather_data = game['weather']
-                        weather_info = {
-                            'condition': weather_data.get('condition', 'Unknown'),
-                            'temp': weather_data.get('temp', 'N/A'),
-                            'wind': weather_data.get('wind', 'N/A')
-                        }
-
-                    # Calculate win probability
-                    home_score = game.get('teams', {}).get('home', {}).get('score', 0) or 0
-                    away_score = game.get('teams', {}).get('away', {}).get('score', 0) or 0
-                    game_status = get_game_status(game.get('status', {}))
-
-                    win_probability = calculate_win_probability(
-                        home_score,
-                        away_score,
-                        inning if inning else '1st',
-                        inning_state if inning_state else 'Top',
-                        game_status
-                    )
-
-                    # Get full team names (city + name) for consistency
-                    home_location = home_team_data.get('locationName', '')
-                    home_name = home_team_data.get('teamName', home_team_data.get('name', 'TBD'))
-                    away_location = away_team_data.get('locationName', '')
-                    away_name = away_team_data.get('teamName', away_team_data.get('name', 'TBD'))
-
-                    game_info = {
-                        'id': game.get('gamePk'),
-                        'home_team': f'{home_location} {home_name}'.strip() if home_location else home_name,
-                        'away_team': f'{away_location} {away_name}'.strip() if away_location else away_name,
-                        'home_team_logo': get_team_logo_url(home_team_id) if home_team_id else '',
-                        'away_team_logo': get_team_logo_url(away_team_id) if away_team_id else '',
-                        'home_score': home_score,
-                        'away_score': away_score,
-                        'status': game_status,
-                        'status_detail': status_detail,
-                        'venue': venue_name,
-                        'game_date': game_date,
-                        'inning': inning,
-                        'inning_state': inning_state,
-                        'home_pitcher': home_pitcher,
-                        'away_pitcher': away_pitcher,
-                        'series': series_info,
-                        'live_data': live_data,
-                        'weather': weather_info,
-                        'win_probability': round(win_probability, 1)
+@app.route('/api/cache/stats')
+def get_cache_stats():
+    """Cache size, hit/miss and eviction counters for this worker"""
+    return jsonify(api_cache.stats())
+
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus metrics summed over every worker on this host"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    # The SSE stream polls for minutes, so it has no overall deadline
+    if request.endpoint != 'stream_games':
+        g.deadline_token = request_deadline.set(time.monotonic() + REQUEST_DEADLINE)
+
+@app.teardown_request
+def clear_request_deadline(exc):
+    token = g.pop('deadline_token', None)
+    if token is not None:
+        request_deadline.reset(token)
+
+@app.after_request
+def record_request_duration(response):
+    started = getattr(g, 'request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.observe(
+            'mlb_http_request_duration_seconds', time.perf_counter() - started,
+            route=route, method=request.method, status=response.status_code
+        )
+    try:
+        metrics.publish()
+    except sqlite3.Error as e:
+        logger.warning("Could not publish metrics: %s", e)
+    return response
+
+# Versioned scoreboard snapshots with a short history of diffs per date
+GAMES_DIFF_HISTORY = 40  # diffs kept per date; older ?since= versions get a full snapshot
+GAMES_DIFF_TTL = 6 * 60 * 60
+
+def fetch_games_entry(date_str):
+    return single_flight.fetch(
+        f'games:{date_str}', GAMES_CACHE_DURATION, lambda: load_games(date_str),
+        store=lambda games: store_games_snapshot(date_str, games)
+    )
+
+def refresh_games_entry(date_str, force=False):
+    return single_flight.refresh(
+        f'games:{date_str}', GAMES_CACHE_DURATION, lambda: load_games(date_str), force=force,
+        store=lambda games: store_games_snapshot(date_str, games)
+    )
+
+def store_games_snapshot(date_str, games):
+    """
+    Cache a freshly built scoreboard under the next version number and
+    append what changed to the date's diff ring.
+    The ring is written before the snapshot, so it is never behind it.
+    """
+    previous = api_cache.get(f'games:{date_str}')
+    ring_entry = api_cache.get(f'games_diffs:{date_str}')
+    diffs = ring_entry.data if ring_entry else []
+
+    # The counter outlives both entries, so versions never go backwards
+    version = api_cache.current_version(f'games:{date_str}')
+    previous_games = {game['id']: game for game in (previous.data if previous else [])}
+    current_games = {game['id']: game for game in games}
+    changed = [game for game_id, game in current_games.items() if previous_games.get(game_id) != game]
+    removed = [game_id for game_id in previous_games if game_id not in current_games]
+
+    if previous is None or not version:
+        # Nothing to diff against: start a new ring, so any older version gets a full snapshot
+        version = api_cache.bump_version(f'games:{date_str}')
+        api_cache.set(f'games_diffs:{date_str}', [], GAMES_DIFF_TTL, version=version)
+    elif changed or removed:
+        version = api_cache.bump_version(f'games:{date_str}')
+        diffs = (diffs + [{'version': version, 'changed': changed, 'removed': removed}])[-GAMES_DIFF_HISTORY:]
+        api_cache.set(f'games_diffs:{date_str}', diffs, GAMES_DIFF_TTL, version=version)
+
+    return api_cache.set(f'games:{date_str}', games, games_cache_ttl(date_str, games), version=version)
+
+def games_cache_ttl(date_str, games):
+    """Short TTL while a date can still change, a long one once every game is over"""
+    if any(game.get('status') == 'live' for game in games):
+        return GAMES_CACHE_DURATION
+    if games and all(game.get('status') == 'final' for game in games):
+        return FINAL_GAMES_CACHE_DURATION
+    if date_str == datetime.now().strftime('%Y-%m-%d'):
+        return GAMES_CACHE_DURATION
+    return CACHE_DURATION
+
+def build_games_delta(date_str, games_entry, since):
+    """Games changed and ids removed after version `since`, or a full snapshot if it is too old"""
+    if since == games_entry.version:
+        return {'version': games_entry.version, 'full': False, 'games': [], 'removed': []}
+    if since > games_entry.version:
+        # A version this server never issued (another worker's, or from before a reset)
+        return {'version': games_entry.version, 'full': True, 'games': games_entry.data, 'removed': []}
+
+    ring_entry = api_cache.get(f'games_diffs:{date_str}')
+    diffs = [diff for diff in (ring_entry.data if ring_entry else []) if diff['version'] <= games_entry.version]
+    if not diffs or diffs[0]['version'] > since + 1:
+        return {'version': games_entry.version, 'full': True, 'games': games_entry.data, 'removed': []}
+
+    changed = {}
+    removed = set()
+    for diff in diffs:
+        if diff['version'] <= since:
+            continue
+        for game in diff['changed']:
+            changed[game['id']] = game
+            removed.discard(game['id'])
+        for game_id in diff['removed']:
+            changed.pop(game_id, None)
+            removed.add(game_id)
+
+    return {'version': games_entry.version, 'full': False, 'games': list(changed.values()), 'removed': sorted(removed)}
+
+def load_games(date_str):
+    """Fetch and assemble the scoreboard for one date, or None if the schedule call fails"""
+    archived = load_archived_games(date_str)
+    if archived is not None:
+        return archived
+
+    response = mlb_api.get('schedule', f'schedule?sportId=1&date={date_str}&hydrate=venue,linescore,probablePitcher,seriesStatus,decisions,weather')
+
+    if response.status_code != 200:
+        return None
+
+    data = response.json()
+    games = []
+    archive_extras = {}
+    live_situations = []
+
+    # Fan out the live feed requests for every in-progress game at once
+    live_game_pks = [
+        game.get('gamePk')
+        for date_data in data.get('dates', [])
+        for game in date_data.get('games', [])
+        if game.get('status', {}).get('statusCode') in ['I', 'IR', 'IT', 'IW']
+    ]
+    live_feeds = fetch_live_feeds(live_game_pks)
+
+    if 'dates' in data and len(data['dates']) > 0:
+        for date_data in data['dates']:
+            for game in date_data.get('games', []):
+                home_team_data = game.get('teams', {}).get('home', {}).get('team', {})
+                away_team_data = game.get('teams', {}).get('away', {}).get('team', {})
+
+                home_team_id = home_team_data.get('id')
+                away_team_id = away_team_data.get('id')
+
+                # Get venue information
+                venue = game.get('venue', {})
+                venue_name = venue.get('name', 'TBD')
+
+                # Get game time in ISO format (let frontend handle timezone conversion)
+                game_date = game.get('gameDate', '')
+
+                # Get additional game information
+                status_detail = game.get('status', {}).get('detailedState', 'Scheduled')
+                inning = game.get('linescore', {}).get('currentInningOrdinal', '')
+                inning_state = game.get('linescore', {}).get('inningState', '')
+
+                # Live play-by-play data was fetched concurrently above
+                live_data = live_feeds.get(game.get('gamePk'), {})
+
+                # Get probable pitchers
+                home_pitcher = ''
+                away_pitcher = ''
+                if 'probablePitchers' in game:
+                    home_pitcher_data = game['probablePitchers'].get('home', {})
+                    away_pitcher_data = game['probablePitchers'].get('away', {})
+                    home_pitcher = home_pitcher_data.get('fullName', '')
+                    away_pitcher = away_pitcher_data.get('fullName', '')
+
+                # Get series information (for playoffs)
+                series_info = {}
+                if 'seriesStatus' in game:
+                    series_status = game['seriesStatus']
+                    winning_team = series_status.get('winningTeam', {})
+                    losing_team = series_status.get('losingTeam', {})
+                    winning_team_id = winning_team.get('id')
+
+                    # Determine which team is home/away and their wins
+                    if winning_team_id == home_team_id:
+                        home_wins = series_status.get('wins', 0)
+                        away_wins = series_status.get('losses', 0)
+                    else:
+                        away_wins = series_status.get('wins', 0)
+                        home_wins = series_status.get('losses', 0)
+
+                    series_info = {
+                        'series_description': series_status.get('shortName', ''),
+                        'series_result': series_status.get('result', ''),
+                        'series_game_number': series_status.get('gameNumber', 0),
+                        'games_needed': series_status.get('totalGames', 0),
+                        'home_wins': home_wins,
+                        'away_wins': away_wins,
+                        'is_tied': series_status.get('isTied', False)
                     }
-                    games.append(game_info)
 
-        # Cache the results
-        result_data = games if games else get_fallback_games_data()
-        api_cache['games'][date_str] = {'data': result_data, 'timestamp': time.time()}
+                # Get pitching decisions (final games)
+                decisions = {}
+                if 'decisions' in game:
+                    decisions = {
+                        'winner': game['decisions'].get('winner', {}).get('fullName', ''),
+                        'loser': game['decisions'].get('loser', {}).get('fullName', ''),
+                        'save': game['decisions'].get('save', {}).get('fullName', '')
+                    }
 
-        return jsonify(result_data)
+                # Get weather information
+                weather_info = {}
+                if 'weather' in game:
+                    weather_data = game['weather']
+                    weather_info = {
+                        'condition': weather_data.get('condition', 'Unknown'),
+                        'temp': weather_data.get('temp', 'N/A'),
+                        'wind': weather_data.get('wind', 'N/A')
+                    }
 
+                # Calculate win probability
+                home_score = game.get('teams', {}).get('home', {}).get('score', 0) or 0
+                away_score = game.get('teams', {}).get('away', {}).get('score', 0) or 0
+                game_status = get_game_status(game.get('status', {}))
+
+                win_probability = calculate_win_probability(
+                    home_score,
+                    away_score,
+                    inning if inning else '1st',
+                    inning_state if inning_state else 'Top',
+                    game_status
+                )
+
+                # Get full team names (city + name) for consistency
+                home_location = home_team_data.get('locationName', '')
+                home_name = home_team_data.get('teamName', home_team_data.get('name', 'TBD'))
+                away_location = away_team_data.get('locationName', '')
+                away_name = away_team_data.get('teamName', away_team_data.get('name', 'TBD'))
+
+                game_info = {
+                    'id': game.get('gamePk'),
+                    'home_team': f'{home_location} {home_name}'.strip() if home_location else home_name,
+                    'away_team': f'{away_location} {away_name}'.strip() if away_location else away_name,
+                    'home_team_logo': get_team_logo_url(home_team_id) if home_team_id else '',
+                    'away_team_logo': get_team_logo_url(away_team_id) if away_team_id else '',
+                    'home_score': home_score,
+                    'away_score': away_score,
+                    'status': game_status,
+                    'status_detail': status_detail,
+                    'venue': venue_name,
+                    'game_date': game_date,
+                    'inning': inning,
+                    'inning_state': inning_state,
+                    'home_pitcher': home_pitcher,
+                    'away_pitcher': away_pitcher,
+                    'series': series_info,
+                    'decisions': decisions,
+                    'live_data': live_data,
+                    'weather': weather_info,
+                    'win_probability': round(win_probability, 1)
+                }
+                games.append(game_info)
+
+                if game_status == 'live':
+                    live_situations.append((game_info, game_situation(
+                        game.get('linescore', {}), live_data, home_score, away_score
+                    )))
+
+                archive_extras[game_info['id']] = {
+                    'home_team_id': home_team_id,
+                    'away_team_id': away_team_id,
+                    'linescore': [
+                        {'inning': inning_data.get('num'),
+                         'away': inning_data.get('away', {}).get('runs'),
+                         'home': inning_data.get('home', {}).get('runs')}
+                        for inning_data in game.get('linescore', {}).get('innings', [])
+                    ]
+                }
+
+    # One vectorised table lookup covers every live game on the scoreboard
+    probabilities = win_expectancy.lookup_many([situation for _, situation in live_situations])
+    if probabilities is not None:
+        for (game_info, _), probability in zip(live_situations, probabilities):
+            game_info['win_probability'] = round(float(probability), 1)
+    record_win_probabilities([
+        (game_info['id'], situation, game_info['win_probability']) for game_info, situation in live_situations
+    ])
+
+    if is_date_complete(date_str, games):
+        archive_games(date_str, games, archive_extras)
+
+    return games if games else get_fallback_games_data()
+
+# Finished dates are archived in the database and never fetched from statsapi again
+ARCHIVE_DONE_STATES = ('Postponed', 'Cancelled')
+archive_tables_ready = False
+
+def ensure_tables(*models):
+    """Create tables added after the database was first set up (gunicorn never runs create_all)"""
+    for model in models:
+        try:
+            model.__table__.create(db.engine, checkfirst=True)
+        except Exception as e:
+            # Another worker may have created it first
+            logger.warning("Could not create table %s: %s", model.__tablename__, e)
+
+def ensure_archive_tables():
+    global archive_tables_ready
+    if not archive_tables_ready:
+        ensure_tables(ArchivedGame)
+        archive_tables_ready = True
+
+def is_date_complete(date_str, games):
+    """True once every game on the date has finished and nothing about it can change"""
+    if not games:
+        return False
+    if all(game['status'] == 'final' for game in games):
+        return True
+    is_past = date_str < datetime.now().strftime('%Y-%m-%d')
+    return is_past and all(
+        game['status'] == 'final' or game.get('status_detail') in ARCHIVE_DONE_STATES for game in games
+    )
+
+def archive_games(date_str, games, extras):
+    try:
+        with app.app_context():
+            ensure_archive_tables()
+
+            game_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            if ArchivedGame.query.filter_by(date=game_date).count() > 0:
+                return
+
+            for game in games:
+                extra = extras.get(game['id'], {})
+                decisions = game.get('decisions', {})
+                db.session.add(ArchivedGame(
+                    game_pk=game['id'],
+                    date=game_date,
+                    home_team_id=extra.get('home_team_id'),
+                    away_team_id=extra.get('away_team_id'),
+                    home_team=game['home_team'],
+                    away_team=game['away_team'],
+                    home_score=game['home_score'],
+                    away_score=game['away_score'],
+                    status=game['status'],
+                    status_detail=game.get('status_detail'),
+                    venue=game.get('venue'),
+                    home_pitcher=game.get('home_pitcher'),
+                    away_pitcher=game.get('away_pitcher'),
+                    winning_pitcher=decisions.get('winner'),
+                    losing_pitcher=decisions.get('loser'),
+                    save_pitcher=decisions.get('save'),
+                    series=json.dumps(game.get('series', {})),
+                    linescore=json.dumps(extra.get('linescore', [])),
+                    data=json.dumps(game)
+                ))
+            db.session.commit()
     except Exception as e:
-        print(f"Error fetching live games: {e}")
-        return get_fallback_games()
+        logger.error("Error archiving games for %s: %s", date_str, e)
+
+def load_archived_games(date_str):
+    """Games for a completed date from the local archive, or None if the date is not archived"""
+    try:
+        game_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+    try:
+        with app.app_context():
+            ensure_archive_tables()
+            archived = ArchivedGame.query.filter_by(date=game_date).order_by(ArchivedGame.id).all()
+            return [json.loads(game.data) for game in archived] or None
+    except Exception as e:
+        logger.error("Error reading archived games for %s: %s", date_str, e)
+        return None
+
+def fetch_live_feed(game_pk):
+    """Fetch the live game feed for one game and extract the current at-bat"""
+    live_data = {}
+    try:
+        live_response = mlb_api.get('feed/live', f'game/{game_pk}/feed/live')
+        logger.debug("[LIVE FEED] Game %s: HTTP %s", game_pk, live_response.status_code)
+
+        if live_response.status_code == 200:
+            live_data_json = live_response.json()
+            live_play = live_data_json.get('liveData', {})
+            plays = live_play.get('plays', {})
+            current_play = plays.get('currentPlay', {})
+            offense = live_play.get('linescore', {}).get('offense', {})
+
+            logger.debug("[LIVE FEED] Game %s: currentPlay exists = %s", game_pk, bool(current_play))
+
+            if current_play:
+                # Get count
+                count = current_play.get('count', {})
+                balls = count.get('balls', 0)
+                strikes = count.get('strikes', 0)
+                outs = count.get('outs', 0)
+
+                # Get current batter
+                matchup = current_play.get('matchup', {})
+                batter_data = matchup.get('batter', {})
+                batter_name = batter_data.get('fullName', '')
+                batter_id = batter_data.get('id', 0)
+
+                # Get current pitcher
+                pitcher_data = matchup.get('pitcher', {})
+                pitcher_name = pitcher_data.get('fullName', '')
+                pitcher_id = pitcher_data.get('id', 0)
+
+                if batter_name and pitcher_name:
+                    live_data = {
+                        'balls': balls,
+                        'strikes': strikes,
+                        'outs': outs,
+                        'current_batter': batter_name,
+                        'current_batter_id': batter_id,
+                        'current_pitcher': pitcher_name,
+                        'current_pitcher_id': pitcher_id,
+                        'on_first': 'first' in offense,
+                        'on_second': 'second' in offense,
+                        'on_third': 'third' in offense,
+                        'bases': base_state(offense)
+                    }
+                    logger.debug("[LIVE FEED] Game %s: %s vs %s, Count: %s-%s, Outs: %s", game_pk, pitcher_name, batter_name, balls, strikes, outs)
+                else:
+                    logger.debug("[LIVE FEED] Game %s: currentPlay exists but missing batter/pitcher data", game_pk)
+            else:
+                logger.debug("[LIVE FEED] Game %s: No currentPlay data (likely between innings)", game_pk)
+        else:
+            logger.debug("[LIVE FEED] Game %s: API returned %s", game_pk, live_response.status_code)
+    except Exception as e:
+        logger.warning("[LIVE FEED ERROR] Game %s: %s", game_pk, e)
+        live_data = {}
+
+    return live_data
+
+def fetch_live_feeds(game_pks):
+    """
+    Fetch live feeds for several games in parallel.
+    All feeds share one overall deadline; a game whose feed has not
+    arrived by then gets empty live_data instead of holding up the rest.
+    """
+    if not game_pks:
+        return {}
+
+    # Each task runs in a copy of this context so it shares the request's deadline budget
+    futures = {
+        live_feed_executor.submit(contextvars.copy_context().run, fetch_live_feed, game_pk): game_pk
+        for game_pk in game_pks
+    }
+    deadline = LIVE_FEED_DEADLINE
+    budget = remaining_budget()
+    if budget is not None:
+        deadline = max(min(deadline, budget), 0)
+    done, not_done = wait(futures, timeout=deadline)
+
+    live_feeds = {}
+    for future, game_pk in futures.items():
+        if future in done:
+            live_feeds[game_pk] = future.result()
+        else:
+            # Leave the straggler running in the pool; its result is discarded
+            logger.warning("[LIVE FEED] Game %s: missed %.1fs deadline", game_pk, deadline)
+            metrics.inc('mlb_upstream_errors_total', endpoint='feed/live', reason='deadline')
+            live_feeds[game_pk] = {}
+    return live_feeds
 
 def calculate_win_probability(home_score, away_score, inning, inning_state, status):
     """
@@ -745,6 +2463,270 @@ def get_game_status(status_data):
     else:
         return 'scheduled'
 
+# Win expectancy: the home team's chance of winning from every game state
+# (inning, half, outs, runners, score difference), precomputed offline from
+# a Markov run-expectancy model by `flask build-win-expectancy`
+WIN_EXPECTANCY_PATH = os.environ.get('WIN_EXPECTANCY_PATH', os.path.join(app.instance_path, 'win_expectancy.npy'))
+WE_INNINGS = 10  # innings 1-9, then one slot shared by every extra inning
+WE_MAX_DIFF = 10  # larger leads are looked up as +/-10
+WE_MAX_RUNS = 20  # most runs one half-inning is tracked to
+WE_MIN_HALF_INNINGS = 500  # archive sample needed before calibrating the run environment
+EXTRA_INNING_START_BASES = 0b010  # extra innings start with a runner on second
+
+# League-average plate appearance outcomes for the base-out Markov chain. The
+# non-out rates are scaled so runs per half-inning match the local archive.
+PA_EVENT_RATES = {
+    'out': 0.686,
+    'walk': 0.090,
+    'single': 0.142,
+    'double': 0.045,
+    'triple': 0.004,
+    'home_run': 0.033
+}
+
+def advance_runners(bases, event):
+    """
+    Apply one plate appearance to a base state (bit 0 = first, bit 1 =
+    second, bit 2 = third). Returns the new base state and runs scored.
+    """
+    on_first, on_second, on_third = bases & 1, (bases >> 1) & 1, (bases >> 2) & 1
+    if event == 'walk':
+        if not on_first:
+            return bases | 0b001, 0
+        if not on_second:
+            return bases | 0b011, 0
+        if not on_third:
+            return 0b111, 0
+        return 0b111, 1
+    if event == 'single':
+        return 0b001 | (on_first << 1), on_second + on_third
+    if event == 'double':
+        return 0b010 | (on_first << 2), on_second + on_third
+    if event == 'triple':
+        return 0b100, on_first + on_second + on_third
+    # home_run
+    return 0, on_first + on_second + on_third + 1
+
+def build_run_distributions(rates, iterations=120):
+    """
+    P(r more runs score before the third out) for every (outs, bases) state,
+    as an array of shape (3, 8, WE_MAX_RUNS + 1)
+    """
+    transitions = [
+        (rate, [advance_runners(bases, event) for bases in range(8)])
+        for event, rate in rates.items() if event != 'out'
+    ]
+
+    dist = np.zeros((4, 8, WE_MAX_RUNS + 1))
+    dist[3, :, 0] = 1.0  # three outs: the half-inning is over
+    for _ in range(iterations):
+        updated = np.zeros_like(dist)
+        updated[3, :, 0] = 1.0
+        for outs in range(3):
+            updated[outs] = rates['out'] * dist[outs + 1]
+            for rate, moves in transitions:
+                for bases, (next_bases, runs) in enumerate(moves):
+                    shifted = np.zeros(WE_MAX_RUNS + 1)
+                    shifted[runs:] = dist[outs, next_bases, :WE_MAX_RUNS + 1 - runs]
+                    shifted[-1] += dist[outs, next_bases, WE_MAX_RUNS + 1 - runs:].sum()
+                    updated[outs, bases] += rate * shifted
+        dist = updated
+    return dist[:3]
+
+def scaled_event_rates(scale):
+    rates = {event: rate * scale for event, rate in PA_EVENT_RATES.items() if event != 'out'}
+    total = sum(PA_EVENT_RATES.values())
+    rates = {event: rate / total for event, rate in rates.items()}
+    rates['out'] = 1.0 - sum(rates.values())
+    return rates
+
+def calibrate_run_distributions(runs_per_half_inning):
+    """Run distributions whose expected runs per inning match the observed mean"""
+    if len(runs_per_half_inning) < WE_MIN_HALF_INNINGS:
+        return build_run_distributions(scaled_event_rates(1.0)), 1.0
+
+    target = float(np.mean(runs_per_half_inning))
+    low, high = 0.5, 1.5
+    for _ in range(20):
+        scale = (low + high) / 2
+        dist = build_run_distributions(scaled_event_rates(scale), iterations=60)
+        expected = float(dist[0, 0] @ np.arange(WE_MAX_RUNS + 1))
+        if expected < target:
+            low = scale
+        else:
+            high = scale
+    scale = (low + high) / 2
+    return build_run_distributions(scaled_event_rates(scale)), scale
+
+def play_half_inning(dist, after, sign):
+    """
+    Win expectancy for every (outs, bases, diff) state of a half-inning,
+    given the win expectancy by diff once it ends. sign is +1 when the home
+    team bats and -1 when the away team does.
+    """
+    span = (len(after) - 1) // 2
+    diffs = np.arange(-span, span + 1)
+    runs = np.arange(WE_MAX_RUNS + 1)
+    next_index = np.clip(diffs[None, :] + sign * runs[:, None], -span, span) + span
+    return dist @ after[next_index]
+
+def build_win_expectancy_table(runs_per_half_inning):
+    """
+    Backward induction over the innings of a game using the half-inning
+    run distributions. Returns (table, scale) where table has shape
+    (WE_INNINGS, 2, 3, 8, 2 * WE_MAX_DIFF + 1) and holds home win chances.
+    """
+    dist, scale = calibrate_run_distributions(runs_per_half_inning)
+    span = WE_MAX_DIFF + 2 * WE_MAX_RUNS
+    diffs = np.arange(-span, span + 1)
+    tie = span
+
+    def final_innings(start_bases, tied):
+        # From the ninth on, only a tie after the bottom half plays on
+        end_of_game = np.where(diffs > 0, 1.0, 0.0)
+        end_of_game[tie] = tied
+        bottom = play_half_inning(dist, end_of_game, 1)
+        # Leading after the top of the inning, the home team does not bat
+        after_top = np.where(diffs > 0, 1.0, bottom[0, start_bases])
+        top = play_half_inning(dist, after_top, -1)
+        return top, bottom
+
+    # A tie after nine goes to extra innings, which repeat until decided
+    extra_tied = 0.5
+    for _ in range(50):
+        extra_top, extra_bottom = final_innings(EXTRA_INNING_START_BASES, extra_tied)
+        extra_tied = extra_top[0, EXTRA_INNING_START_BASES, tie]
+
+    halves = [None] * WE_INNINGS
+    halves[9] = (extra_top, extra_bottom)
+    halves[8] = final_innings(0, extra_tied)
+    for inning in range(7, -1, -1):
+        next_top = halves[inning + 1][0][0, 0]
+        bottom = play_half_inning(dist, next_top, 1)
+        top = play_half_inning(dist, bottom[0, 0], -1)
+        halves[inning] = (top, bottom)
+
+    window = slice(span - WE_MAX_DIFF, span + WE_MAX_DIFF + 1)
+    table = np.stack([np.stack([top, bottom]) for top, bottom in halves])[..., window]
+    return table.astype(np.float32), scale
+
+def archived_runs_per_half_inning():
+    """Runs scored in every completed half-inning of innings 1-8 in the archive"""
+    runs = []
+    with app.app_context():
+        ensure_archive_tables()
+        for (linescore,) in db.session.query(ArchivedGame.linescore).filter(ArchivedGame.status == 'final'):
+            for inning_data in json.loads(linescore or '[]'):
+                if (inning_data.get('inning') or 0) > 8:
+                    continue
+                runs.extend(inning_data[side] for side in ('away', 'home') if inning_data.get(side) is not None)
+    return runs
+
+@app.cli.command('build-win-expectancy')
+def build_win_expectancy_command():
+    """Build the win expectancy table from the archived linescores"""
+    runs = archived_runs_per_half_inning()
+    table, scale = build_win_expectancy_table(runs)
+    os.makedirs(os.path.dirname(WIN_EXPECTANCY_PATH), exist_ok=True)
+    temp_path = f'{WIN_EXPECTANCY_PATH}.tmp'
+    with open(temp_path, 'wb') as table_file:
+        np.save(table_file, table)
+    os.replace(temp_path, WIN_EXPECTANCY_PATH)
+    if len(runs) < WE_MIN_HALF_INNINGS:
+        click.echo(f"Only {len(runs)} archived half-innings; used league-average event rates")
+    else:
+        click.echo(f"Calibrated on {len(runs)} archived half-innings (mean {np.mean(runs):.3f} runs, scale {scale:.3f})")
+    click.echo(f"Wrote {WIN_EXPECTANCY_PATH}")
+
+class WinExpectancy:
+    """
+    Serves lookups from the precomputed table. The file is reloaded when
+    it changes on disk; without it, callers fall back to
+    calculate_win_probability.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._table = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def table(self):
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return None
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    try:
+                        self._table = np.load(self.path)
+                    except (OSError, ValueError) as e:
+                        logger.warning("Could not load win expectancy table %s: %s", self.path, e)
+                        self._table = None
+                    self._mtime = mtime
+        return self._table
+
+    def lookup_many(self, situations):
+        """
+        Home win percentages for a batch of (inning, is_bottom, outs, bases,
+        score_diff) situations, or None when no table has been built
+        """
+        table = self.table()
+        if table is None or not situations:
+            return None
+        states = np.asarray(situations, dtype=np.int64).reshape(-1, 5)
+        probabilities = table[
+            np.clip(states[:, 0], 1, WE_INNINGS) - 1,
+            states[:, 1],
+            np.clip(states[:, 2], 0, 2),
+            states[:, 3] & 0b111,
+            np.clip(states[:, 4], -WE_MAX_DIFF, WE_MAX_DIFF) + WE_MAX_DIFF
+        ]
+        return np.clip(probabilities * 100.0, 0.1, 99.9)
+
+win_expectancy = WinExpectancy(WIN_EXPECTANCY_PATH)
+
+# One win probability sample per change of state, charted by /api/game/<id>/winprob
+WINPROB_SAMPLE = np.dtype([
+    ('timestamp', '<f8'), ('inning', 'i1'), ('half', 'i1'), ('outs', 'i1'), ('win_probability', '<f4')
+])
+
+def record_win_probabilities(samples):
+    """Append (game_pk, situation, win_probability) samples to each game's series"""
+    now = time.time()
+    for game_pk, (inning, is_bottom, outs, _, _), probability in samples:
+        sample = np.array([(now, min(inning, 127), is_bottom, outs, probability)], dtype=WINPROB_SAMPLE)
+        try:
+            api_cache.append_sample(f'winprob:{game_pk}', sample)
+        except sqlite3.Error as e:
+            logger.warning("Could not record win probability for game %s: %s", game_pk, e)
+
+def base_state(offense):
+    """Base occupancy bitmask from a linescore 'offense' block"""
+    return (('first' in offense) << 0) | (('second' in offense) << 1) | (('third' in offense) << 2)
+
+def game_situation(linescore, live_data, home_score, away_score):
+    """The (inning, is_bottom, outs, bases, score_diff) state of a live game"""
+    inning = linescore.get('currentInning') or 1
+    is_bottom = not linescore.get('isTopInning', True)
+    inning_state = linescore.get('inningState', '')
+    outs = live_data.get('outs', linescore.get('outs', 0)) or 0
+    if 'bases' in live_data:
+        bases = live_data['bases']
+    else:
+        bases = base_state(linescore.get('offense', {}))
+
+    # Between half-innings, look up the start of the next one
+    if inning_state == 'Middle' or (outs >= 3 and not is_bottom and inning_state != 'End'):
+        is_bottom, outs = True, 0
+        bases = EXTRA_INNING_START_BASES if inning > 9 else 0
+    elif inning_state == 'End' or outs >= 3:
+        inning, is_bottom, outs = inning + 1, False, 0
+        bases = EXTRA_INNING_START_BASES if inning > 9 else 0
+
+    return (inning, int(is_bottom), outs, bases, home_score - away_score)
+
 def get_fallback_games():
     today = datetime.now().date()
     games = Game.query.filter_by(date=today).all()
@@ -762,6 +2744,100 @@ def get_fallback_games():
 def get_fallback_games_data():
     return []
 
+# Background refresher keeping today's scoreboard, standings and teams warm
+REFRESH_LIVE_INTERVAL = 5  # seconds between polls while games are in progress
+REFRESH_PREGAME_INTERVAL = 60  # polls shortly before first pitch or between games
+REFRESH_IDLE_INTERVAL = 900  # overnight back-off
+REFRESH_PREGAME_WINDOW = 1800  # start polling this long before the next first pitch
+
+class ScoreboardRefresher(threading.Thread):
+    """
+    Refreshes today's cache entries before they expire so requests are
+    always served from the cache. Only one worker per host polls at a
+    time (it holds the 'refresher' lease); the others stand by in case it
+    goes away.
+    """
+
+    def __init__(self, cache, flight):
+        super().__init__(name='scoreboard-refresher', daemon=True)
+        self.cache = cache
+        self.flight = flight
+        self.interval = REFRESH_LIVE_INTERVAL
+
+    def run(self):
+        while True:
+            try:
+                if self.cache.acquire_lease('refresher', max(self.interval, REFRESH_LIVE_INTERVAL) * 3):
+                    self.interval = self.refresh_once()
+                else:
+                    self.interval = REFRESH_PREGAME_INTERVAL
+            except Exception as e:
+                logger.error("Error in scoreboard refresher: %s", e)
+                self.interval = REFRESH_PREGAME_INTERVAL
+            time.sleep(self.interval)
+
+    def _refresh_if_expiring(self, key, horizon, refresh):
+        entry = self.cache.get(key)
+        if entry is None or entry.age() + horizon >= entry.ttl:
+            refreshed = refresh()
+            if isinstance(refreshed, CacheEntry):
+                return refreshed
+        return entry
+
+    def refresh_once(self):
+        """Refresh whatever would expire before the next poll and return the next poll interval"""
+        date_str = datetime.now().strftime('%Y-%m-%d')
+        horizon = self.interval
+        games_entry = self._refresh_if_expiring(
+            f'games:{date_str}', horizon, lambda: refresh_games_entry(date_str, force=True)
+        )
+        games = games_entry.data if games_entry else []
+
+        # Rosters cost a call per team, so outside live games they are only
+        # reloaded when a request finds them stale
+        if any(game.get('status') == 'live' for game in games):
+            self._refresh_if_expiring(
+                'standings', horizon, lambda: self.flight.refresh('standings', mlb_api.ttl('standings'), load_standings_data, force=True)
+            )
+            self._refresh_if_expiring(
+                'teams', horizon, lambda: self.flight.refresh('teams', mlb_api.ttl('teams'), load_teams_data, force=True)
+            )
+            self._refresh_if_expiring(
+                'rosters', horizon, lambda: self.flight.refresh('rosters', ROSTERS_CACHE_DURATION, load_league_rosters, force=True)
+            )
+            return REFRESH_LIVE_INTERVAL
+
+        # Nothing live: back off until shortly before the next first pitch
+        now = datetime.now().astimezone()
+        upcoming = []
+        for game in games:
+            if game.get('status') != 'scheduled' or not game.get('game_date'):
+                continue
+            try:
+                upcoming.append(datetime.fromisoformat(game['game_date'].replace('Z', '+00:00')))
+            except ValueError:
+                continue
+        if not upcoming:
+            return REFRESH_IDLE_INTERVAL
+        seconds_to_first_pitch = (min(upcoming) - now).total_seconds()
+        if seconds_to_first_pitch <= REFRESH_PREGAME_WINDOW:
+            return REFRESH_PREGAME_INTERVAL
+        return min(REFRESH_IDLE_INTERVAL, seconds_to_first_pitch - REFRESH_PREGAME_WINDOW)
+
+scoreboard_refresher = None
+scoreboard_refresher_lock = threading.Lock()
+
+@app.before_request
+def start_scoreboard_refresher():
+    """Start the refresher in each worker on its first request (gunicorn forks after import)"""
+    global scoreboard_refresher
+    if scoreboard_refresher is not None or os.environ.get('BACKGROUND_REFRESH', '1') == '0':
+        return
+    with scoreboard_refresher_lock:
+        if scoreboard_refresher is None:
+            scoreboard_refresher = ScoreboardRefresher(api_cache, single_flight)
+            scoreboard_refresher.start()
+
 def get_position_sort_order(position):
     """Return sort order for baseball positions (1-9 defensive positions, then P, then DH/OF)"""
     position_order = {
@@ -785,67 +2861,462 @@ def get_position_sort_order(position):
     }
     return position_order.get(position, 99)  # Unknown positions go to end
 
+# All 30 rosters are loaded together and held as one entry, so per-team
+# requests are served from the cache instead of a roster call each
+ROSTERS_CACHE_DURATION = 10 * 60  # season stats only move when games end
+ROSTER_BATCH_WORKERS = 8
+ROSTER_BATCH_DEADLINE = 20  # seconds for the whole batch
+roster_executor = ThreadPoolExecutor(max_workers=ROSTER_BATCH_WORKERS, thread_name_prefix='roster')
+
 @app.route('/api/players/<int:team_id>')
 def get_team_players(team_id):
     return get_live_team_players(team_id)
 
 def get_live_team_players(team_id):
     try:
-        # Get roster with current season stats in one call
-        current_year = datetime.now().year
-        url = f'{MLB_API_BASE}/teams/{team_id}/roster?rosterType=active&season={current_year}&hydrate=person(stats(type=season,season={current_year}))'
-        response = requests.get(url, timeout=10)
+        rosters_entry = fetch_league_rosters()
+        if rosters_entry is not None and str(team_id) in rosters_entry.data['teams']:
+            return conditional_response(team_players_entry(rosters_entry, team_id))
 
-        if response.status_code != 200:
+        # Not one of the league's teams, or its roster has never loaded
+        players_entry = single_flight.fetch(f'players:{team_id}', mlb_api.ttl('roster'), lambda: load_team_players(team_id))
+        if players_entry is None:
             return get_fallback_players(team_id)
 
-        data = response.json()
-        players = []
-
-        for player_data in data.get('roster', []):
-            player = player_data.get('person', {})
-            player_id = player.get('id')
-            position = player_data.get('position', {}).get('abbreviation', 'UNK')
-
-            # Get stats from hydrated response
-            batting_avg = 0.0
-            era = 0.0
-
-            # Check if stats are included in the response
-            if 'stats' in player and player['stats']:
-                for stat_group in player['stats']:
-                    # Include pitching stats for pitchers (P) and two-way players (TWP/Y)
-                    if stat_group.get('group', {}).get('displayName') == 'pitching' and position in ['P', 'TWP', 'Y']:
-                        splits = stat_group.get('splits', [])
-                        if splits and 'stat' in splits[0]:
-                            stat = splits[0]['stat']
-                            era_value = stat.get('era', '0.00')
-                            era = float(era_value) if isinstance(era_value, (int, float)) else float(era_value) if era_value not in ['---', '.---'] else 0.0
-                    # Include hitting stats for non-pitchers and two-way players
-                    elif stat_group.get('group', {}).get('displayName') == 'hitting' and position not in ['P']:
-                        splits = stat_group.get('splits', [])
-                        if splits and 'stat' in splits[0]:
-                            stat = splits[0]['stat']
-                            avg_value = stat.get('avg', '.000')
-                            batting_avg = float(avg_value) if isinstance(avg_value, (int, float)) else float(avg_value) if avg_value not in ['---', '.---'] else 0.0
-
-            player_info = {
-                'id': player_id,
-                'name': player.get('fullName', ''),
-                'position': position,
-                'batting_avg': round(batting_avg, 3),
-                'era': round(era, 2)
-            }
-            players.append(player_info)
+        return conditional_response(players_entry)
+
+    except Exception as e:
+        logger.error("Error fetching live players: %s", e)
+        return get_fallback_players(team_id)
+
+def fetch_league_rosters():
+    return single_flight.fetch('rosters', ROSTERS_CACHE_DURATION, load_league_rosters)
+
+def team_players_entry(rosters_entry, team_id):
+    """One team's player rows, rebuilt only when the league rosters entry is newer"""
+    key = f'players:{team_id}'
+    entry = api_cache.get(key)
+    if entry is None or entry.timestamp < rosters_entry.timestamp:
+        rosters = rosters_entry.data
+        entries = [rosters['players'][str(player_id)] for player_id in rosters['teams'][str(team_id)]]
+        entry = api_cache.set(key, roster_player_rows(entries), rosters_entry.ttl, timestamp=rosters_entry.timestamp)
+    return entry
+
+def roster_path(team_id, season):
+    return f'teams/{team_id}/roster?rosterType=active&season={season}&hydrate=person(stats(type=season,season={season}))'
+
+def load_league_rosters():
+    """
+    Every team's active roster with season stats, fetched as a bounded
+    concurrent batch. Returns {'teams': {team id: [player ids]}, 'players':
+    {player id: roster entry}} (string keys, as they come back from the
+    cache), or None if no roster could be loaded. A team whose call fails
+    keeps the roster from the previous load.
+    """
+    current_year = datetime.now().year
+    futures = {
+        roster_executor.submit(contextvars.copy_context().run, mlb_api.get, 'roster', roster_path(team_id, current_year)): team_id
+        for team_id in TEAM_METADATA
+    }
+
+    deadline = ROSTER_BATCH_DEADLINE
+    budget = remaining_budget()
+    if budget is not None:
+        deadline = max(min(deadline, budget), 0)
+    done, not_done = wait(futures, timeout=deadline)
+    if not_done:
+        logger.warning("Roster batch: %d teams missed the %.1fs deadline", len(not_done), deadline)
+
+    teams = {}
+    players = {}
+    for future, team_id in futures.items():
+        if future not in done:
+            continue
+        try:
+            response = future.result()
+        except requests.RequestException as e:
+            logger.warning("Error fetching roster for team %s: %s", team_id, e)
+            continue
+        if response.status_code != 200:
+            continue
+        entries = parse_roster_entries(response.json(), team_id)
+        teams[str(team_id)] = [entry['id'] for entry in entries]
+        players.update((str(entry['id']), entry) for entry in entries)
+
+    previous = api_cache.get('rosters')
+    if previous is not None:
+        for team_id, player_ids in previous.data['teams'].items():
+            if team_id not in teams:
+                teams[team_id] = player_ids
+                players.update((str(player_id), previous.data['players'][str(player_id)]) for player_id in player_ids)
+
+    if not teams:
+        return None
+    logger.info("Loaded rosters for %d teams (%d players)", len(teams), len(players))
+    return {'teams': teams, 'players': players}
+
+def load_team_players(team_id):
+    """Fetch a team's active roster with season stats, or None if the roster call fails"""
+    # Get roster with current season stats in one call
+    current_year = datetime.now().year
+    response = mlb_api.get('roster', roster_path(team_id, current_year))
+
+    if response.status_code != 200:
+        return None
+
+    players = parse_roster_players(response.json())
+
+    return players if players else get_fallback_players_data(team_id)
+
+def parse_roster_entries(roster_json, team_id=None):
+    """Id, name, position and full season hitting/pitching stat lines for each player on a hydrated roster"""
+    entries = []
+
+    for player_data in roster_json.get('roster', []):
+        player = player_data.get('person', {})
+        entry = {
+            'id': player.get('id'),
+            'name': player.get('fullName', ''),
+            'position': player_data.get('position', {}).get('abbreviation', 'UNK'),
+            'team_id': team_id,
+            'hitting': {},
+            'pitching': {},
+        }
 
-        # Sort players by position
-        players.sort(key=lambda p: get_position_sort_order(p['position']))
+        # Check if stats are included in the response
+        for stat_group in player.get('stats') or []:
+            group = stat_group.get('group', {}).get('displayName')
+            splits = stat_group.get('splits', [])
+            if group in ('hitting', 'pitching') and splits and 'stat' in splits[0]:
+                entry[group] = splits[0]['stat']
+
+        entries.append(entry)
+
+    return entries
+
+def roster_player_rows(entries):
+    """Player rows (id, name, position, batting_avg, era) sorted by position"""
+    players = []
+
+    for entry in entries:
+        position = entry['position']
+        batting_avg = 0.0
+        era = 0.0
+
+        # Include pitching stats for pitchers (P) and two-way players (TWP/Y)
+        if entry['pitching'] and position in ['P', 'TWP', 'Y']:
+            era_value = entry['pitching'].get('era', '0.00')
+            era = float(era_value) if isinstance(era_value, (int, float)) else float(era_value) if era_value not in ['---', '.---'] else 0.0
+        # Include hitting stats for non-pitchers and two-way players
+        if entry['hitting'] and position not in ['P']:
+            avg_value = entry['hitting'].get('avg', '.000')
+            batting_avg = float(avg_value) if isinstance(avg_value, (int, float)) else float(avg_value) if avg_value not in ['---', '.---'] else 0.0
+
+        players.append({
+            'id': entry['id'],
+            'name': entry['name'],
+            'position': position,
+            'batting_avg': round(batting_avg, 3),
+            'era': round(era, 2)
+        })
+
+    # Sort players by position
+    players.sort(key=lambda p: get_position_sort_order(p['position']))
 
-        return jsonify(players if players else get_fallback_players_data(team_id))
+    return players
 
+def parse_roster_players(roster_json):
+    """Player rows (id, name, position, batting_avg, era) from a stats-hydrated roster response"""
+    return roster_player_rows(parse_roster_entries(roster_json))
+
+SEARCH_DEFAULT_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
+
+def normalize_name(name):
+    """Lowercase, accent-free words: 'José Ramírez' -> 'jose ramirez'"""
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(''.join(char if char.isalnum() else ' ' for char in stripped.lower()).split())
+
+class PlayerSearchIndex:
+    """
+    Prefix index over every rostered player's name. Each name word (and
+    the whole name) is a sorted token, so the players matching a prefix are
+    one bisect range; multi-word queries intersect the ranges. Position and
+    team facets are plain sets of row numbers.
+    """
+
+    def __init__(self, rosters):
+        self.rows = []
+        self.positions = {}
+        self.teams = {}
+        self.names = []
+        tokens = []
+        for team_id, player_ids in rosters['teams'].items():
+            team = TEAM_METADATA.get(int(team_id), {})
+            rows = roster_player_rows([rosters['players'][str(player_id)] for player_id in player_ids])
+            for row in rows:
+                number = len(self.rows)
+                self.rows.append({**row, 'team_id': int(team_id), 'team': f"{team.get('city', '')} {team.get('name', '')}".strip()})
+                self.positions.setdefault(row['position'], set()).add(number)
+                self.teams.setdefault(int(team_id), set()).add(number)
+                name = normalize_name(row['name'])
+                self.names.append(name)
+                tokens.append((name, number))
+                tokens.extend((word, number) for word in name.split()[1:])
+        tokens.sort()
+        self.tokens = [token for token, _ in tokens]
+        self.numbers = [number for _, number in tokens]
+
+    def _prefix_matches(self, prefix):
+        start = bisect.bisect_left(self.tokens, prefix)
+        # The first string past every prefix match: bump its last character
+        # (appending '\uffff' would miss tokens continuing above the BMP)
+        end = bisect.bisect_left(self.tokens, prefix[:-1] + chr(ord(prefix[-1]) + 1), start)
+        return set(self.numbers[start:end])
+
+    def search(self, query, position=None, team_id=None, limit=SEARCH_DEFAULT_LIMIT):
+        """Players whose name words start with every query word, with facet counts over all matches"""
+        words = normalize_name(query).split()
+        if not words:
+            return {'players': [], 'total': 0, 'facets': {'position': {}, 'team': {}}}
+
+        # The whole query as a name prefix catches 'jose ram'; word by word catches 'ramirez jose'
+        matches = self._prefix_matches(' '.join(words))
+        if len(words) > 1:
+            by_word = self._prefix_matches(words[0])
+            for word in words[1:]:
+                by_word &= self._prefix_matches(word)
+            matches |= by_word
+
+        facets = {
+            'position': {name: len(numbers & matches) for name, numbers in self.positions.items() if numbers & matches},
+            'team': {team: len(numbers & matches) for team, numbers in self.teams.items() if numbers & matches},
+        }
+        if position:
+            matches &= self.positions.get(position, set())
+        if team_id:
+            matches &= self.teams.get(team_id, set())
+
+        # Full-name prefix hits first, then alphabetical
+        prefix = ' '.join(words)
+        ranked = sorted(matches, key=lambda number: (not self.names[number].startswith(prefix), self.names[number]))
+        return {
+            'players': [self.rows[number] for number in ranked[:limit]],
+            'total': len(matches),
+            'facets': facets,
+        }
+
+class RostersIndex:
+    """build(rosters) for the current rosters entry, rebuilt only when that entry changes"""
+
+    def __init__(self, build):
+        self.build = build
+        self._index = None
+        self._etag = None
+        self._lock = threading.Lock()
+
+    def index_for(self, rosters_entry):
+        with self._lock:
+            if self._etag != rosters_entry.etag:
+                self._index = self.build(rosters_entry.data)
+                self._etag = rosters_entry.etag
+            return self._index
+
+player_search = RostersIndex(PlayerSearchIndex)
+
+@app.route('/api/players/search')
+def search_players():
+    """Autocomplete over every rostered player; ?q=, optional position, team and limit"""
+    query = request.args.get('q', '')
+    limit = min(max(request.args.get('limit', SEARCH_DEFAULT_LIMIT, type=int), 1), SEARCH_MAX_LIMIT)
+    try:
+        rosters_entry = fetch_league_rosters()
     except Exception as e:
-        print(f"Error fetching live players: {e}")
-        return get_fallback_players(team_id)
+        logger.error("Error loading rosters for search: %s", e)
+        rosters_entry = None
+    if rosters_entry is None:
+        return jsonify({'message': 'Player rosters not available'}), 503
+
+    result = player_search.index_for(rosters_entry).search(
+        query, position=request.args.get('position'), team_id=request.args.get('team', type=int), limit=limit
+    )
+    response = jsonify({'query': query, **result})
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
+
+# Leaderboards and percentiles. stat: (group, higher is better, rate stat
+# that only counts for qualified players)
+LEADER_STATS = {
+    'avg': ('hitting', True, True),
+    'obp': ('hitting', True, True),
+    'slg': ('hitting', True, True),
+    'ops': ('hitting', True, True),
+    'homeRuns': ('hitting', True, False),
+    'rbi': ('hitting', True, False),
+    'runs': ('hitting', True, False),
+    'hits': ('hitting', True, False),
+    'stolenBases': ('hitting', True, False),
+    'era': ('pitching', False, True),
+    'whip': ('pitching', False, True),
+    'strikeoutsPer9Inn': ('pitching', True, True),
+    'strikeOuts': ('pitching', True, False),
+    'wins': ('pitching', True, False),
+    'saves': ('pitching', True, False),
+}
+HITTER_QUALIFYING_PA = 3.1  # plate appearances per team game
+PITCHER_QUALIFYING_IP = 1.0  # innings per team game
+LEADERS_DEFAULT_LIMIT = 10
+LEADERS_MAX_LIMIT = 100
+
+def stat_value(value):
+    """A statsapi stat ('.300', '3.45', 27, '-.--') as a float, NaN when missing"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+def innings_value(value):
+    """Innings pitched: '123.1' is 123 and a third"""
+    innings = stat_value(value)
+    whole = np.floor(innings)
+    return whole + (innings - whole) * 10 / 3
+
+class SeasonStatsColumns:
+    """
+    The season stats of every rostered player as one float column per stat,
+    indexed by row. Leaders are a top-k partial selection over a column;
+    percentiles a binary search in the sorted column of qualified players.
+    A team's game count is taken as the most games any of its hitters has
+    played, which is what the qualifying thresholds are measured against.
+    """
+
+    def __init__(self, rosters):
+        players = [player for player in rosters['players'].values() if player.get('id') is not None]
+        self.players = players
+        self.rows = {player['id']: row for row, player in enumerate(players)}
+        self.columns = {
+            stat: np.array([stat_value(player[group].get(stat)) for player in players], dtype=np.float64)
+            for stat, (group, _, _) in LEADER_STATS.items()
+        }
+
+        team_ids = np.array([player.get('team_id') or 0 for player in players], dtype=np.int64)
+        games = np.nan_to_num(np.array([stat_value(player['hitting'].get('gamesPlayed')) for player in players]))
+        teams, team_rows = np.unique(team_ids, return_inverse=True)
+        team_games = np.zeros(len(teams))
+        np.maximum.at(team_games, team_rows, games)
+        plate_appearances = np.array([stat_value(player['hitting'].get('plateAppearances')) for player in players])
+        innings = np.array([innings_value(player['pitching'].get('inningsPitched')) for player in players])
+        with np.errstate(invalid='ignore'):
+            self.qualified = {
+                'hitting': plate_appearances >= HITTER_QUALIFYING_PA * team_games[team_rows],
+                'pitching': innings >= PITCHER_QUALIFYING_IP * team_games[team_rows],
+            }
+        self._pools = {}
+
+    def pool(self, stat):
+        """Sorted values of the qualified players who have stat"""
+        if stat not in self._pools:
+            values = self.columns[stat]
+            self._pools[stat] = np.sort(values[self.qualified[LEADER_STATS[stat][0]] & ~np.isnan(values)])
+        return self._pools[stat]
+
+    def leaders(self, stat, limit=LEADERS_DEFAULT_LIMIT, qualified=True):
+        """Row numbers of the top limit players for stat, best first"""
+        group, higher, rate = LEADER_STATS[stat]
+        values = self.columns[stat]
+        mask = ~np.isnan(values)
+        if rate and qualified:
+            mask &= self.qualified[group]
+        candidates = np.flatnonzero(mask)
+        if not len(candidates):
+            return candidates
+        keyed = -values[candidates] if higher else values[candidates]
+        k = min(limit, len(candidates))
+        # Everyone at least as good as the k-th value, then a stable sort, so
+        # ties (also across the cut) keep roster order instead of partition order
+        kth = np.partition(keyed, k - 1)[k - 1]
+        top = np.flatnonzero(keyed <= kth)
+        return candidates[top[np.argsort(keyed[top], kind='stable')][:k]]
+
+    def percentiles(self, player_id):
+        """{group: {stat: {value, percentile}}} for one player, or None if they are not rostered"""
+        row = self.rows.get(player_id)
+        if row is None:
+            return None
+        result = {}
+        for stat, (group, higher, _) in LEADER_STATS.items():
+            value = self.columns[stat][row]
+            pool = self.pool(stat)
+            if np.isnan(value) or not len(pool):
+                continue
+            # Share of qualified players this value beats, ties counting half
+            below = np.searchsorted(pool, value, side='left')
+            above = len(pool) - np.searchsorted(pool, value, side='right')
+            beaten = below if higher else above
+            tied = len(pool) - below - above
+            result.setdefault(group, {})[stat] = {
+                'value': float(value),
+                'percentile': round(float(100 * (beaten + tied / 2) / len(pool)), 1),
+            }
+        return result
+
+season_columns = RostersIndex(SeasonStatsColumns)
+
+def rostered_player(player):
+    team = TEAM_METADATA.get(player.get('team_id'), {})
+    return {
+        'id': player['id'],
+        'name': player['name'],
+        'position': player['position'],
+        'team_id': player.get('team_id'),
+        'team': f"{team.get('city', '')} {team.get('name', '')}".strip(),
+    }
+
+@app.route('/api/leaders')
+def get_leaders():
+    """League leaders for one season stat; ?stat=, limit and qualified=0 to include everyone for rate stats"""
+    stat = request.args.get('stat', 'ops')
+    if stat not in LEADER_STATS:
+        return jsonify({'message': f"Unknown stat; choose one of {', '.join(LEADER_STATS)}"}), 400
+    limit = min(max(request.args.get('limit', LEADERS_DEFAULT_LIMIT, type=int), 1), LEADERS_MAX_LIMIT)
+    qualified = request.args.get('qualified', '1') != '0'
+    try:
+        rosters_entry = fetch_league_rosters()
+    except Exception as e:
+        logger.error("Error loading rosters for leaders: %s", e)
+        rosters_entry = None
+    if rosters_entry is None:
+        return jsonify({'message': 'Player rosters not available'}), 503
+
+    columns = season_columns.index_for(rosters_entry)
+    values = columns.columns[stat]
+    leaders = [
+        {'rank': rank, **rostered_player(columns.players[row]), 'value': float(values[row])}
+        for rank, row in enumerate(columns.leaders(stat, limit, qualified), start=1)
+    ]
+    response = jsonify({'stat': stat, 'group': LEADER_STATS[stat][0], 'qualified': qualified, 'leaders': leaders})
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
+
+@app.route('/api/player/<int:player_id>/percentiles')
+def get_player_percentiles(player_id):
+    """Where a player's season stats rank among qualified players, 0-100 with 100 best"""
+    try:
+        rosters_entry = fetch_league_rosters()
+    except Exception as e:
+        logger.error("Error loading rosters for percentiles: %s", e)
+        rosters_entry = None
+    if rosters_entry is None:
+        return jsonify({'message': 'Player rosters not available'}), 503
+
+    columns = season_columns.index_for(rosters_entry)
+    percentiles = columns.percentiles(player_id)
+    if percentiles is None:
+        return jsonify({'message': 'Player is not on an active roster'}), 404
+    response = jsonify({**rostered_player(columns.players[columns.rows[player_id]]), **percentiles})
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
 
 def get_fallback_players(team_id):
     players = Player.query.filter_by(team_id=team_id).all()
@@ -874,61 +3345,56 @@ def get_fallback_players_data(team_id):
     }
     return fallback_players.get(team_id, [])
 
+def fetch_vs_player(pitcher_id, batter_id):
+    """Cached career batter-vs-pitcher line; the entry's data is {} when they have never faced each other"""
+    return single_flight.fetch(
+        f'vsplayer:{pitcher_id}:{batter_id}', mlb_api.ttl('vsPlayer'), lambda: load_vs_player(pitcher_id, batter_id)
+    )
+
+def load_vs_player(pitcher_id, batter_id):
+    # No season parameter gets career totals
+    response = mlb_api.get('vsPlayer', f'people/{batter_id}/stats?stats=vsPlayer&opposingPlayerId={pitcher_id}&group=hitting')
+    if response.status_code != 200:
+        return None
+    return parse_vs_player(response.json()) or {}
+
+def parse_vs_player(data):
+    """Career totals (the vsPlayerTotal group) from a vsPlayer stats response, or None if there are none"""
+    # Find the vsPlayerTotal stat group (career totals through current season)
+    for stat_group in data.get('stats', []):
+        if stat_group.get('type', {}).get('displayName') == 'vsPlayerTotal':
+            if 'splits' in stat_group and len(stat_group['splits']) > 0:
+                stats = stat_group['splits'][0]['stat']
+
+                avg = stats.get('avg', '0.000')
+                # Convert avg to float if it's a string
+                if isinstance(avg, str):
+                    avg = float(avg) if avg not in ['---', '.---'] else 0.0
+
+                return {
+                    'at_bats': stats.get('atBats', 0),
+                    'hits': stats.get('hits', 0),
+                    'avg': round(avg, 3),
+                    'home_runs': stats.get('homeRuns', 0),
+                    'strikeouts': stats.get('strikeOuts', 0),
+                    'doubles': stats.get('doubles', 0),
+                    'triples': stats.get('triples', 0),
+                    'walks': stats.get('baseOnBalls', 0),
+                    'rbi': stats.get('rbi', 0),
+                    'total_bases': stats.get('totalBases', 0),
+                    'obp': stats.get('obp', '.000'),
+                    'slg': stats.get('slg', '.000'),
+                    'ops': stats.get('ops', '.000')
+                }
+    return None
+
 @app.route('/api/matchup/<int:pitcher_id>/<int:batter_id>')
 def get_matchup(pitcher_id, batter_id):
     """Get pitcher vs batter matchup stats from MLB Stats API"""
     try:
-        # Get current year for up-to-date stats
-        current_year = datetime.now().year
-
-        # Try to get live matchup data from MLB Stats API - no season parameter gets career totals
-        url = f'{MLB_API_BASE}/people/{batter_id}/stats?stats=vsPlayer&opposingPlayerId={pitcher_id}&group=hitting'
-        response = requests.get(url, timeout=10)
-
-        if response.status_code == 200:
-            data = response.json()
-
-            # Parse the stats from the API response - look for vsPlayerTotal for career totals
-            if 'stats' in data and len(data['stats']) > 0:
-                # Find the vsPlayerTotal stat group (career totals through current season)
-                for stat_group in data['stats']:
-                    if stat_group.get('type', {}).get('displayName') == 'vsPlayerTotal':
-                        if 'splits' in stat_group and len(stat_group['splits']) > 0:
-                            stats = stat_group['splits'][0]['stat']
-
-                            at_bats = stats.get('atBats', 0)
-                            hits = stats.get('hits', 0)
-                            avg = stats.get('avg', '0.000')
-                            home_runs = stats.get('homeRuns', 0)
-                            strikeouts = stats.get('strikeOuts', 0)
-                            doubles = stats.get('doubles', 0)
-                            triples = stats.get('triples', 0)
-                            walks = stats.get('baseOnBalls', 0)
-                            rbi = stats.get('rbi', 0)
-                            total_bases = stats.get('totalBases', 0)
-                            obp = stats.get('obp', '.000')
-                            slg = stats.get('slg', '.000')
-                            ops = stats.get('ops', '.000')
-
-                            # Convert avg to float if it's a string
-                            if isinstance(avg, str):
-                                avg = float(avg) if avg not in ['---', '.---'] else 0.0
-
-                            return jsonify({
-                                'at_bats': at_bats,
-                                'hits': hits,
-                                'avg': round(avg, 3),
-                                'home_runs': home_runs,
-                                'strikeouts': strikeouts,
-                                'doubles': doubles,
-                                'triples': triples,
-                                'walks': walks,
-                                'rbi': rbi,
-                                'total_bases': total_bases,
-                                'obp': obp,
-                                'slg': slg,
-                                'ops': ops
-                            })
+        matchup_entry = fetch_vs_player(pitcher_id, batter_id)
+        if matchup_entry is not None and matchup_entry.data:
+            return conditional_response(matchup_entry)
 
         # If live API fails or no data, try database fallback
         matchup = PitcherBatterMatchup.query.filter_by(
@@ -949,104 +3415,264 @@ def get_matchup(pitcher_id, batter_id):
             return jsonify({'message': 'No matchup data found'}), 404
 
     except Exception as e:
-        print(f"Error fetching matchup data: {e}")
+        logger.error("Error fetching matchup data: %s", e)
         return jsonify({'message': 'No matchup data found'}), 404
 
+@app.route('/api/game/<int:game_id>/winprob')
+def get_win_probability_series(game_id):
+    """Win probability history for one game as parallel arrays, oldest sample first"""
+    try:
+        # The encoded response is kept until another sample is appended, so
+        # polling clients cost one head lookup instead of a rebuild and gzip
+        version = api_cache.series_version(f'winprob:{game_id}')
+        if not version:
+            return jsonify({'message': 'No win probability data for this game'}), 404
+        entry = api_cache.get(f'winprob_series:{game_id}')
+        if entry is not None and entry.version == version:
+            return conditional_response(entry)
+
+        samples = api_cache.series(f'winprob:{game_id}', WINPROB_SAMPLE)
+        if len(samples) == 0:
+            return jsonify({'message': 'No win probability data for this game'}), 404
+        series = {
+            'game_id': game_id,
+            'timestamp': samples['timestamp'].tolist(),
+            'inning': samples['inning'].tolist(),
+            'half': samples['half'].tolist(),  # 0 = top, 1 = bottom
+            'outs': samples['outs'].tolist(),
+            'win_probability': np.round(samples['win_probability'].astype(float), 1).tolist()
+        }
+        entry = api_cache.set(
+            f'winprob_series:{game_id}', series, REFRESH_LIVE_INTERVAL,
+            timestamp=float(samples['timestamp'][-1]), version=version
+        )
+        return conditional_response(entry)
+
+    except Exception as e:
+        logger.error("Error fetching win probability series: %s", e)
+        return jsonify({'message': 'No win probability data for this game'}), 404
+
 @app.route('/api/game/<int:game_id>/lineups')
 def get_game_lineups(game_id):
     """Get starting lineups for a specific game"""
     try:
-        url = f'{MLB_API_BASE}/game/{game_id}/boxscore'
-        response = requests.get(url, timeout=10)
-
-        if response.status_code != 200:
+        lineups_entry = single_flight.fetch(f'lineups:{game_id}', mlb_api.ttl('boxscore'), lambda: load_game_lineups(game_id))
+        if lineups_entry is None:
             return jsonify({'message': 'Lineup data not available'}), 404
 
-        data = response.json()
-        teams = data.get('teams', {})
+        return conditional_response(lineups_entry)
 
-        lineups = {
-            'home': [],
-            'away': [],
-            'home_pitcher': None,
-            'away_pitcher': None
-        }
+    except Exception as e:
+        logger.error("Error fetching lineup data: %s", e)
+        return jsonify({'message': 'Lineup data not available'}), 404
 
-        # Process home team
-        if 'home' in teams:
-            home_team = teams['home']
-            batting_order = home_team.get('battingOrder', [])
-            pitchers = home_team.get('pitchers', [])
-            players = home_team.get('players', {})
-
-            for i, player_id in enumerate(batting_order[:9], 1):  # First 9 batters
-                player_key = f'ID{player_id}'
-                if player_key in players:
-                    player = players[player_key]
-                    person = player.get('person', {})
-                    position = player.get('position', {})
-
-                    lineups['home'].append({
-                        'order': i,
-                        'name': person.get('fullName', 'Unknown'),
-                        'id': player_id,
-                        'position': position.get('abbreviation', ''),
-                        'jersey_number': player.get('jerseyNumber', '')
-                    })
-
-            # Get starting pitcher (first pitcher in the list)
-            if pitchers and len(pitchers) > 0:
-                pitcher_id = pitchers[0]
-                pitcher_key = f'ID{pitcher_id}'
-                if pitcher_key in players:
-                    pitcher = players[pitcher_key]
-                    pitcher_person = pitcher.get('person', {})
-                    lineups['home_pitcher'] = {
-                        'name': pitcher_person.get('fullName', 'Unknown'),
-                        'id': pitcher_id,
-                        'jersey_number': pitcher.get('jerseyNumber', '')
-                    }
+def load_game_lineups(game_id):
+    """Fetch starting lineups and pitchers from the boxscore, or None if it is unavailable"""
+    response = mlb_api.get('boxscore', f'game/{game_id}/boxscore')
 
-        # Process away team
-        if 'away' in teams:
-            away_team = teams['away']
-            batting_order = away_team.get('battingOrder', [])
-            pitchers = away_team.get('pitchers', [])
-            players = away_team.get('players', {})
-
-            for i, player_id in enumerate(batting_order[:9], 1):  # First 9 batters
-                player_key = f'ID{player_id}'
-                if player_key in players:
-                    player = players[player_key]
-                    person = player.get('person', {})
-                    position = player.get('position', {})
-
-                    lineups['away'].append({
-                        'order': i,
-                        'name': person.get('fullName', 'Unknown'),
-                        'id': player_id,
-                        'position': position.get('abbreviation', ''),
-                        'jersey_number': player.get('jerseyNumber', '')
-                    })
-
-            # Get starting pitcher (first pitcher in the list)
-            if pitchers and len(pitchers) > 0:
-                pitcher_id = pitchers[0]
-                pitcher_key = f'ID{pitcher_id}'
-                if pitcher_key in players:
-                    pitcher = players[pitcher_key]
-                    pitcher_person = pitcher.get('person', {})
-                    lineups['away_pitcher'] = {
-                        'name': pitcher_person.get('fullName', 'Unknown'),
-                        'id': pitcher_id,
-                        'jersey_number': pitcher.get('jerseyNumber', '')
-                    }
+    if response.status_code != 200:
+        return None
+
+    data = response.json()
+    teams = data.get('teams', {})
+
+    lineups = {
+        'home': [],
+        'away': [],
+        'home_pitcher': None,
+        'away_pitcher': None
+    }
+
+    # Process home team
+    if 'home' in teams:
+        home_team = teams['home']
+        batting_order = home_team.get('battingOrder', [])
+        pitchers = home_team.get('pitchers', [])
+        players = home_team.get('players', {})
+
+        for i, player_id in enumerate(batting_order[:9], 1):  # First 9 batters
+            player_key = f'ID{player_id}'
+            if player_key in players:
+                player = players[player_key]
+                person = player.get('person', {})
+                position = player.get('position', {})
+
+                lineups['home'].append({
+                    'order': i,
+                    'name': person.get('fullName', 'Unknown'),
+                    'id': player_id,
+                    'position': position.get('abbreviation', ''),
+                    'jersey_number': player.get('jerseyNumber', '')
+                })
+
+        # Get starting pitcher (first pitcher in the list)
+        if pitchers and len(pitchers) > 0:
+            pitcher_id = pitchers[0]
+            pitcher_key = f'ID{pitcher_id}'
+            if pitcher_key in players:
+                pitcher = players[pitcher_key]
+                pitcher_person = pitcher.get('person', {})
+                lineups['home_pitcher'] = {
+                    'name': pitcher_person.get('fullName', 'Unknown'),
+                    'id': pitcher_id,
+                    'jersey_number': pitcher.get('jerseyNumber', '')
+                }
+
+    # Process away team
+    if 'away' in teams:
+        away_team = teams['away']
+        batting_order = away_team.get('battingOrder', [])
+        pitchers = away_team.get('pitchers', [])
+        players = away_team.get('players', {})
+
+        for i, player_id in enumerate(batting_order[:9], 1):  # First 9 batters
+            player_key = f'ID{player_id}'
+            if player_key in players:
+                player = players[player_key]
+                person = player.get('person', {})
+                position = player.get('position', {})
+
+                lineups['away'].append({
+                    'order': i,
+                    'name': person.get('fullName', 'Unknown'),
+                    'id': player_id,
+                    'position': position.get('abbreviation', ''),
+                    'jersey_number': player.get('jerseyNumber', '')
+                })
+
+        # Get starting pitcher (first pitcher in the list)
+        if pitchers and len(pitchers) > 0:
+            pitcher_id = pitchers[0]
+            pitcher_key = f'ID{pitcher_id}'
+            if pitcher_key in players:
+                pitcher = players[pitcher_key]
+                pitcher_person = pitcher.get('person', {})
+                lineups['away_pitcher'] = {
+                    'name': pitcher_person.get('fullName', 'Unknown'),
+                    'id': pitcher_id,
+                    'jersey_number': pitcher.get('jerseyNumber', '')
+                }
+
+    return lineups
+
+# Starting pitchers against the opposing lineups, one vsPlayer call per pair
+MATCHUPS_CACHE_DURATION = 6 * 60 * 60  # keyed by the lineups, so a lineup change is a new entry
+MATCHUPS_MAX_WORKERS = 8
+MATCHUPS_DEADLINE = 6  # seconds for the whole fan-out
+matchup_executor = ThreadPoolExecutor(max_workers=MATCHUPS_MAX_WORKERS, thread_name_prefix='matchup')
+
+@app.route('/api/game/<int:game_id>/matchups')
+def get_game_matchups(game_id):
+    """Each starting pitcher's career line against every batter in the opposing lineup"""
+    try:
+        lineups_entry = single_flight.fetch(f'lineups:{game_id}', mlb_api.ttl('boxscore'), lambda: load_game_lineups(game_id))
+        if lineups_entry is None:
+            return jsonify({'message': 'Lineup data not available'}), 404
+
+        matchups_entry = fetch_game_matchups(game_id, lineups_entry)
+        if matchups_entry is None:
+            return jsonify({'message': 'No matchup data found'}), 404
 
-        return jsonify(lineups)
+        return conditional_response(matchups_entry)
 
     except Exception as e:
-        print(f"Error fetching lineup data: {e}")
-        return jsonify({'message': 'Lineup data not available'}), 404
+        logger.error("Error fetching matchups for game %s: %s", game_id, e)
+        return jsonify({'message': 'No matchup data found'}), 404
+
+def fetch_game_matchups(game_id, lineups_entry):
+    """
+    The matrix as its own cache entry, keyed by the etag of the lineups it
+    was built from so it is rebuilt only when a lineup changes. A matrix
+    with missing cells or unconfirmed starters is kept only briefly.
+    """
+    key = f'matchups:{game_id}:{lineups_entry.etag}'
+
+    def store(matchups):
+        for old_key in api_cache.keys(f'matchups:{game_id}:'):
+            if old_key != key:
+                api_cache.delete(old_key)
+        ttl = MATCHUPS_CACHE_DURATION if matchups['complete'] else mlb_api.ttl('boxscore')
+        return api_cache.set(key, matchups, ttl)
+
+    return single_flight.fetch(
+        key, MATCHUPS_CACHE_DURATION, lambda: load_game_matchups(game_id, lineups_entry.data), store=store
+    )
+
+def load_probable_pitchers(game_id):
+    """{'home': pitcher, 'away': pitcher} announced for a game that has not started"""
+    response = mlb_api.get('schedule', f'schedule?gamePk={game_id}&hydrate=probablePitcher')
+    if response.status_code != 200:
+        return {}
+    probables = {}
+    for date in response.json().get('dates', []):
+        for game in date.get('games', []):
+            for side in ('home', 'away'):
+                pitcher = game.get('teams', {}).get(side, {}).get('probablePitcher')
+                if pitcher and pitcher.get('id'):
+                    probables[side] = {'name': pitcher.get('fullName', 'Unknown'), 'id': pitcher['id'], 'jersey_number': ''}
+    return probables
+
+def load_game_matchups(game_id, lineups):
+    """
+    Both starters against the opposing batting orders. Every distinct pair
+    is fetched once, concurrently, under one deadline; cells that miss it
+    or fail are None and the matrix is marked incomplete.
+    """
+    pitchers = {'home': lineups.get('home_pitcher'), 'away': lineups.get('away_pitcher')}
+    confirmed = all(pitchers.values())
+    if not confirmed:
+        # Before first pitch the boxscore has no pitchers yet; use the probables
+        probables = load_probable_pitchers(game_id)
+        pitchers = {side: pitcher or probables.get(side) for side, pitcher in pitchers.items()}
+
+    # The home starter faces the away lineup and vice versa
+    opponents = {'home': lineups.get('away', []), 'away': lineups.get('home', [])}
+    pairs = {
+        (pitchers[side]['id'], batter['id'])
+        for side in ('home', 'away') if pitchers[side]
+        for batter in opponents[side]
+    }
+    if not pairs:
+        return None
+
+    # Each task runs in a copy of this context so it shares the request's deadline budget
+    futures = {
+        matchup_executor.submit(contextvars.copy_context().run, fetch_vs_player, pitcher_id, batter_id): (pitcher_id, batter_id)
+        for pitcher_id, batter_id in pairs
+    }
+    deadline = MATCHUPS_DEADLINE
+    budget = remaining_budget()
+    if budget is not None:
+        deadline = max(min(deadline, budget), 0)
+    done, not_done = wait(futures, timeout=deadline)
+    if not_done:
+        logger.warning("Game %s matchups: %d of %d pairs missed the %.1fs deadline", game_id, len(not_done), len(pairs), deadline)
+
+    cells = {}
+    for future, pair in futures.items():
+        if future not in done:
+            continue
+        try:
+            entry = future.result()
+        except Exception as e:
+            # One bad pair (upstream error, unexpected payload) only blanks its own cell
+            logger.warning("Error fetching matchup %s vs %s: %s", pair[0], pair[1], e)
+            continue
+        if entry is not None:
+            # {} means the two have never faced each other
+            cells[pair] = entry.data
+
+    matchups = {'complete': confirmed and len(cells) == len(pairs)}
+    for side in ('home', 'away'):
+        pitcher = pitchers[side]
+        matchups[f'{side}_pitcher'] = pitcher and {
+            **pitcher,
+            'batters': [
+                {**batter, 'matchup': cells.get((pitcher['id'], batter['id']))}
+                for batter in opponents[side]
+            ],
+        }
+    return matchups
 
 # Betting Tracker Routes
 @app.route('/bets')
@@ -1108,7 +3734,7 @@ def get_bets():
             } for pick in bet.picks]
         } for bet in bets])
     except Exception as e:
-        print(f"Error fetching bets: {e}")
+        logger.error("Error fetching bets: %s", e)
         return jsonify({'message': 'Error fetching bets'}), 500
 
 @app.route('/api/bets', methods=['POST'])
@@ -1166,10 +3792,11 @@ def create_bet():
             db.session.add(pick)
 
         db.session.commit()
+        api_cache.delete('bets_stats')
 
         return jsonify({'message': 'Parlay entry created successfully', 'id': bet.id}), 201
     except Exception as e:
-        print(f"Error creating bet: {e}")
+        logger.error("Error creating bet: %s", e)
         db.session.rollback()
         return jsonify({'message': 'Error creating bet', 'error': str(e)}), 500
 
@@ -1235,6 +3862,7 @@ def update_bet(bet_id):
             bet.notes = data['notes']
 
         db.session.commit()
+        api_cache.delete('bets_stats')
 
         return jsonify({
             'message': 'Bet updated successfully',
@@ -1244,7 +3872,7 @@ def update_bet(bet_id):
             'status': bet.status
         })
     except Exception as e:
-        print(f"Error updating bet: {e}")
+        logger.error("Error updating bet: %s", e)
         db.session.rollback()
         return jsonify({'message': 'Error updating bet', 'error': str(e)}), 500
 
@@ -1255,10 +3883,11 @@ def delete_bet(bet_id):
         bet = Bet.query.get_or_404(bet_id)
         db.session.delete(bet)
         db.session.commit()
+        api_cache.delete('bets_stats')
 
         return jsonify({'message': 'Bet deleted successfully'})
     except Exception as e:
-        print(f"Error deleting bet: {e}")
+        logger.error("Error deleting bet: %s", e)
         db.session.rollback()
         return jsonify({'message': 'Error deleting bet', 'error': str(e)}), 500
 
@@ -1266,107 +3895,117 @@ def delete_bet(bet_id):
 def get_betting_stats():
     """Get betting statistics and ROI"""
     try:
-        all_bets = Bet.query.all()
-        won_bets = Bet.query.filter_by(status='won').all()
-        lost_bets = Bet.query.filter_by(status='lost').all()
-        pending_bets = Bet.query.filter_by(status='pending').all()
-        partial_bets = Bet.query.filter_by(status='partial').all()
-
-        total_bets = len(all_bets)
-        total_won = len(won_bets)
-        total_lost = len(lost_bets)
-        total_pending = len(pending_bets)
-        total_partial = len(partial_bets)
-
-        total_staked = sum(bet.stake for bet in all_bets)
-        total_profit = sum(bet.profit for bet in all_bets if bet.profit is not None)
-        total_payout = sum(bet.payout for bet in all_bets if bet.payout is not None)
-
-        # Calculate win rate (excluding pending)
-        completed_bets = total_won + total_lost + total_partial
-        win_rate = (total_won / completed_bets * 100) if completed_bets > 0 else 0
-
-        # Calculate ROI
-        roi = (total_profit / total_staked * 100) if total_staked > 0 else 0
-
-        # Stats by platform
-        platforms = {}
-        for bet in all_bets:
-            if bet.platform not in platforms:
-                platforms[bet.platform] = {
-                    'total_bets': 0,
-                    'won': 0,
-                    'lost': 0,
-                    'partial': 0,
-                    'profit': 0.0,
-                    'staked': 0.0
-                }
-            platforms[bet.platform]['total_bets'] += 1
-            platforms[bet.platform]['staked'] += bet.stake
-            if bet.status == 'won':
-                platforms[bet.platform]['won'] += 1
-            elif bet.status == 'lost':
-                platforms[bet.platform]['lost'] += 1
-            elif bet.status == 'partial':
-                platforms[bet.platform]['partial'] += 1
-            if bet.profit:
-                platforms[bet.platform]['profit'] += bet.profit
-
-        # Calculate platform ROI
-        for platform in platforms:
-            staked = platforms[platform]['staked']
-            platforms[platform]['roi'] = (platforms[platform]['profit'] / staked * 100) if staked > 0 else 0
-            completed = platforms[platform]['won'] + platforms[platform]['lost'] + platforms[platform]['partial']
-            platforms[platform]['win_rate'] = (platforms[platform]['won'] / completed * 100) if completed > 0 else 0
-
-        # Stats by entry type
-        entry_types = {}
-        for bet in all_bets:
-            if bet.entry_type not in entry_types:
-                entry_types[bet.entry_type] = {
-                    'total_bets': 0,
-                    'won': 0,
-                    'lost': 0,
-                    'partial': 0,
-                    'profit': 0.0,
-                    'staked': 0.0
-                }
-            entry_types[bet.entry_type]['total_bets'] += 1
-            entry_types[bet.entry_type]['staked'] += bet.stake
-            if bet.status == 'won':
-                entry_types[bet.entry_type]['won'] += 1
-            elif bet.status == 'lost':
-                entry_types[bet.entry_type]['lost'] += 1
-            elif bet.status == 'partial':
-                entry_types[bet.entry_type]['partial'] += 1
-            if bet.profit:
-                entry_types[bet.entry_type]['profit'] += bet.profit
-
-        # Calculate entry type ROI
-        for entry_type in entry_types:
-            staked = entry_types[entry_type]['staked']
-            entry_types[entry_type]['roi'] = (entry_types[entry_type]['profit'] / staked * 100) if staked > 0 else 0
-            completed = entry_types[entry_type]['won'] + entry_types[entry_type]['lost'] + entry_types[entry_type]['partial']
-            entry_types[entry_type]['win_rate'] = (entry_types[entry_type]['won'] / completed * 100) if completed > 0 else 0
-
-        return jsonify({
-            'total_bets': total_bets,
-            'won': total_won,
-            'lost': total_lost,
-            'pending': total_pending,
-            'partial': total_partial,
-            'total_staked': round(total_staked, 2),
-            'total_profit': round(total_profit, 2),
-            'total_payout': round(total_payout, 2),
-            'win_rate': round(win_rate, 2),
-            'roi': round(roi, 2),
-            'platforms': platforms,
-            'entry_types': entry_types
-        })
+        # Cached until the next bet is created, updated or deleted
+        stats_entry = single_flight.fetch('bets_stats', BETS_STATS_CACHE_DURATION, load_betting_stats)
+        return conditional_response(stats_entry, cache_control='private, no-cache')
     except Exception as e:
-        print(f"Error fetching betting stats: {e}")
+        logger.error("Error fetching betting stats: %s", e)
         return jsonify({'message': 'Error fetching stats', 'error': str(e)}), 500
 
+def load_betting_stats():
+    # May run on a background refresh thread, outside the request's app context
+    with app.app_context():
+        return compute_betting_stats()
+
+def compute_betting_stats():
+    all_bets = Bet.query.all()
+    won_bets = Bet.query.filter_by(status='won').all()
+    lost_bets = Bet.query.filter_by(status='lost').all()
+    pending_bets = Bet.query.filter_by(status='pending').all()
+    partial_bets = Bet.query.filter_by(status='partial').all()
+
+    total_bets = len(all_bets)
+    total_won = len(won_bets)
+    total_lost = len(lost_bets)
+    total_pending = len(pending_bets)
+    total_partial = len(partial_bets)
+
+    total_staked = sum(bet.stake for bet in all_bets)
+    total_profit = sum(bet.profit for bet in all_bets if bet.profit is not None)
+    total_payout = sum(bet.payout for bet in all_bets if bet.payout is not None)
+
+    # Calculate win rate (excluding pending)
+    completed_bets = total_won + total_lost + total_partial
+    win_rate = (total_won / completed_bets * 100) if completed_bets > 0 else 0
+
+    # Calculate ROI
+    roi = (total_profit / total_staked * 100) if total_staked > 0 else 0
+
+    # Stats by platform
+    platforms = {}
+    for bet in all_bets:
+        if bet.platform not in platforms:
+            platforms[bet.platform] = {
+                'total_bets': 0,
+                'won': 0,
+                'lost': 0,
+                'partial': 0,
+                'profit': 0.0,
+                'staked': 0.0
+            }
+        platforms[bet.platform]['total_bets'] += 1
+        platforms[bet.platform]['staked'] += bet.stake
+        if bet.status == 'won':
+            platforms[bet.platform]['won'] += 1
+        elif bet.status == 'lost':
+            platforms[bet.platform]['lost'] += 1
+        elif bet.status == 'partial':
+            platforms[bet.platform]['partial'] += 1
+        if bet.profit:
+            platforms[bet.platform]['profit'] += bet.profit
+
+    # Calculate platform ROI
+    for platform in platforms:
+        staked = platforms[platform]['staked']
+        platforms[platform]['roi'] = (platforms[platform]['profit'] / staked * 100) if staked > 0 else 0
+        completed = platforms[platform]['won'] + platforms[platform]['lost'] + platforms[platform]['partial']
+        platforms[platform]['win_rate'] = (platforms[platform]['won'] / completed * 100) if completed > 0 else 0
+
+    # Stats by entry type
+    entry_types = {}
+    for bet in all_bets:
+        if bet.entry_type not in entry_types:
+            entry_types[bet.entry_type] = {
+                'total_bets': 0,
+                'won': 0,
+                'lost': 0,
+                'partial': 0,
+                'profit': 0.0,
+                'staked': 0.0
+            }
+        entry_types[bet.entry_type]['total_bets'] += 1
+        entry_types[bet.entry_type]['staked'] += bet.stake
+        if bet.status == 'won':
+            entry_types[bet.entry_type]['won'] += 1
+        elif bet.status == 'lost':
+            entry_types[bet.entry_type]['lost'] += 1
+        elif bet.status == 'partial':
+            entry_types[bet.entry_type]['partial'] += 1
+        if bet.profit:
+            entry_types[bet.entry_type]['profit'] += bet.profit
+
+    # Calculate entry type ROI
+    for entry_type in entry_types:
+        staked = entry_types[entry_type]['staked']
+        entry_types[entry_type]['roi'] = (entry_types[entry_type]['profit'] / staked * 100) if staked > 0 else 0
+        completed = entry_types[entry_type]['won'] + entry_types[entry_type]['lost'] + entry_types[entry_type]['partial']
+        entry_types[entry_type]['win_rate'] = (entry_types[entry_type]['won'] / completed * 100) if completed > 0 else 0
+
+    return {
+        'total_bets': total_bets,
+        'won': total_won,
+        'lost': total_lost,
+        'pending': total_pending,
+        'partial': total_partial,
+        'total_staked': round(total_staked, 2),
+        'total_profit': round(total_profit, 2),
+        'total_payout': round(total_payout, 2),
+        'win_rate': round(win_rate, 2),
+        'roi': round(roi, 2),
+        'platforms': platforms,
+        'entry_types': entry_types
+    }
+
 def initialize_sample_data():
     if Team.query.count() == 0:
         # Sample teams - all 30 MLB teams
@@ -1450,91 +4089,287 @@ def initialize_sample_data():
 
         db.session.commit()
 
+# Past seasons are stored for good; only the current season and the career
+# line are fetched again once the cached response expires
+PLAYER_STATS_CACHE_DURATION = 5 * 60
+player_stats_tables_ready = False
+
 @app.route('/api/player/<int:player_id>/stats')
 def get_player_stats(player_id):
     """Get detailed player statistics"""
     try:
-        # Fetch player info
-        player_url = f'{MLB_API_BASE}/people/{player_id}?hydrate=stats(group=[hitting,pitching],type=[career,yearByYear])'
-        response = requests.get(player_url)
-
-        if response.status_code != 200:
+        stats_entry = single_flight.fetch(
+            f'player_stats:{player_id}', PLAYER_STATS_CACHE_DURATION, lambda: load_player_stats(player_id)
+        )
+        if stats_entry is None:
             return jsonify({'error': 'Player not found'}), 404
 
-        data = response.json()
+        return conditional_response(stats_entry)
 
-        if not data.get('people') or len(data['people']) == 0:
-            return jsonify({'error': 'Player not found'}), 404
+    except Exception as e:
+        logger.error("Error fetching player stats: %s", e)
+        return jsonify({'error': str(e)}), 500
 
-        player = data['people'][0]
+PLAYER_STATS_BATCH_MAX = 100
 
-        player_info = {
-            'id': player.get('id'),
-            'fullName': player.get('fullName'),
-            'primaryNumber': player.get('primaryNumber', 'N/A'),
-            'currentTeam': player.get('currentTeam', {}).get('name', 'Free Agent'),
-            'primaryPosition': player.get('primaryPosition', {}).get('name', 'N/A'),
-            'age': player.get('currentAge', 'N/A'),
-            'birthDate': player.get('birthDate', 'N/A'),
-            'height': player.get('height', 'N/A'),
-            'weight': player.get('weight', 'N/A'),
-            'bats': player.get('batSide', {}).get('code', 'N/A'),
-            'throws': player.get('pitchHand', {}).get('code', 'N/A'),
-            'headshot': f"https://img.mlbstatic.com/mlb-photos/image/upload/d_people:generic:headshot:67:current.png/w_426,q_auto:best/v1/people/{player.get('id')}/headshot/67/current",
-            'stats': []
-        }
-
-        # Extract stats
-        if player.get('stats'):
-            for stat_group in player['stats']:
-                for split in stat_group.get('splits', []):
-                    stat_data = split.get('stat', {})
-                    season = split.get('season', 'Career')
+@app.route('/api/players/stats')
+def get_players_stats():
+    """Stats for several players (?ids=1,2,3) in one request, each shaped like /api/player/<id>/stats"""
+    try:
+        player_ids = list(dict.fromkeys(int(player_id) for player_id in request.args.get('ids', '').split(',') if player_id.strip()))
+    except ValueError:
+        return jsonify({'error': 'ids must be a comma separated list of player ids'}), 400
+    if not player_ids:
+        return jsonify({'error': 'No player ids given'}), 400
+    if len(player_ids) > PLAYER_STATS_BATCH_MAX:
+        return jsonify({'error': f'At most {PLAYER_STATS_BATCH_MAX} players per request'}), 400
 
-                    stat_entry = {
-                        'season': season,
-                        'team': split.get('team', {}).get('name', 'N/A')
-                    }
+    try:
+        # Whatever is cached and fresh is served as is; the rest is fetched together
+        players = {}
+        stale = {}
+        for player_id in player_ids:
+            entry = api_cache.get(f'player_stats:{player_id}')
+            if entry and entry.is_fresh():
+                players[player_id] = entry.data
+            elif entry:
+                stale[player_id] = entry.data
+        missing = [player_id for player_id in player_ids if player_id not in players]
+        if players:
+            metrics.inc('mlb_cache_requests_total', len(players), key='player_stats', result='hit')
+        failed = []
+        if missing:
+            metrics.inc('mlb_cache_requests_total', len(missing), key='player_stats', result='miss')
+            try:
+                loaded = load_players_stats(missing, failed=failed)
+            except Exception as e:
+                logger.error("Error loading stats for players %s: %s", missing, e)
+                loaded, failed = {}, missing
+            for player_id, player_info in loaded.items():
+                api_cache.set(f'player_stats:{player_id}', player_info, PLAYER_STATS_CACHE_DURATION)
+                players[player_id] = player_info
+            # An upstream failure only costs the players it was for; a stale copy beats nothing
+            for player_id in failed:
+                if player_id in stale:
+                    players[player_id] = stale[player_id]
 
-                    # Add hitting stats if available
-                    if 'avg' in stat_data:
-                        stat_entry.update({
-                            'gamesPlayed': stat_data.get('gamesPlayed', 0),
-                            'atBats': stat_data.get('atBats', 0),
-                            'hits': stat_data.get('hits', 0),
-                            'avg': stat_data.get('avg', '.000'),
-                            'homeRuns': stat_data.get('homeRuns', 0),
-                            'rbi': stat_data.get('rbi', 0),
-                            'runs': stat_data.get('runs', 0),
-                            'obp': stat_data.get('obp', '.000'),
-                            'slg': stat_data.get('slg', '.000'),
-                            'ops': stat_data.get('ops', '.000'),
-                            'stolenBases': stat_data.get('stolenBases', 0)
-                        })
-
-                    # Add pitching stats if available
-                    if 'era' in stat_data:
-                        stat_entry.update({
-                            'gamesPlayed': stat_data.get('gamesPlayed', 0),
-                            'gamesStarted': stat_data.get('gamesStarted', 0),
-                            'wins': stat_data.get('wins', 0),
-                            'losses': stat_data.get('losses', 0),
-                            'era': stat_data.get('era', '0.00'),
-                            'inningsPitched': stat_data.get('inningsPitched', '0.0'),
-                            'strikeOuts': stat_data.get('strikeOuts', 0),
-                            'walks': stat_data.get('baseOnBalls', 0),
-                            'whip': stat_data.get('whip', '0.00'),
-                            'saves': stat_data.get('saves', 0)
-                        })
-
-                    player_info['stats'].append(stat_entry)
-
-        return jsonify(player_info)
+        return jsonify({
+            'players': [players[player_id] for player_id in player_ids if player_id in players],
+            'not_found': [player_id for player_id in player_ids if player_id not in players and player_id not in failed],
+            'failed': [player_id for player_id in player_ids if player_id not in players and player_id in failed],
+        })
 
     except Exception as e:
-        print(f"Error fetching player stats: {e}")
+        logger.error("Error fetching stats for players: %s", e)
         return jsonify({'error': str(e)}), 500
 
+def people_stats_path(player_ids, season=None):
+    """Every season and the career line, or with season only that season and the career line"""
+    person_ids = ','.join(str(player_id) for player_id in player_ids)
+    if season is None:
+        return f'people?personIds={person_ids}&hydrate=stats(group=[hitting,pitching],type=[career,yearByYear])'
+    return f'people?personIds={person_ids}&hydrate=stats(group=[hitting,pitching],type=[career,season],season={season})'
+
+def fetch_people(player_ids, season=None):
+    response = mlb_api.get('people', people_stats_path(player_ids, season))
+    if response.status_code != 200:
+        return []
+    return response.json().get('people') or []
+
+def load_player_stats(player_id):
+    """Profile and stat rows for one player, or None if statsapi does not know them"""
+    return load_players_stats([player_id]).get(player_id)
+
+def load_players_stats(player_ids, failed=None):
+    """
+    Profile and stat rows by player id for the players statsapi knows. A
+    player seen for the first time gets every season fetched and the closed
+    ones archived; for the rest only the current season and the career line
+    are fetched and the archived rows go back where yearByYear had them.
+    That is at most two people calls however many players are asked for.
+    Given a failed list, a people call that raises adds its players to it
+    instead, so the other call's players are still returned.
+    """
+    current_year = datetime.now().year
+    archives = read_player_archives(player_ids, current_year)
+    results = {}
+
+    def people(ids, season=None):
+        try:
+            return fetch_people(ids, season)
+        except requests.RequestException as e:
+            if failed is None:
+                raise
+            logger.warning("Error fetching stats for players %s: %s", ids, e)
+            failed.extend(ids)
+            return []
+
+    unarchived = [player_id for player_id in player_ids if player_id not in archives]
+    if unarchived:
+        for player in people(unarchived):
+            archive_player_seasons(player, current_year)
+            results[player.get('id')] = parse_player_stats(player)
+
+    archived = [player_id for player_id in player_ids if player_id in archives]
+    if archived:
+        for player in people(archived, current_year):
+            if player.get('id') in archives:
+                results[player['id']] = merge_player_stats(player, *archives[player['id']])
+
+    return results
+
+def ensure_player_stats_tables():
+    global player_stats_tables_ready
+    if not player_stats_tables_ready:
+        ensure_tables(PlayerStatsArchive, PlayerSeasonStats)
+        player_stats_tables_ready = True
+
+def read_player_archives(player_ids, current_year):
+    """(layout, archived rows by group) for each player whose closed seasons are all stored"""
+    try:
+        with app.app_context():
+            ensure_player_stats_tables()
+            archives = PlayerStatsArchive.query.filter(
+                PlayerStatsArchive.player_id.in_(player_ids),
+                PlayerStatsArchive.through_season >= current_year - 1
+            ).all()
+            if not archives:
+                return {}
+            rows = {}
+            seasons = PlayerSeasonStats.query.filter(
+                PlayerSeasonStats.player_id.in_([archive.player_id for archive in archives])
+            ).order_by(PlayerSeasonStats.player_id, PlayerSeasonStats.sequence)
+            for season in seasons:
+                rows.setdefault(season.player_id, {}).setdefault(season.stat_group, []).append(json.loads(season.data))
+            return {
+                archive.player_id: ([tuple(pair) for pair in json.loads(archive.layout)], rows.get(archive.player_id, {}))
+                for archive in archives
+            }
+    except Exception as e:
+        logger.error("Error reading archived player stats: %s", e)
+        return {}
+
+def archive_player_seasons(player, current_year):
+    """Store the yearByYear rows of seasons before current_year and the order of the stat groups"""
+    player_id = player.get('id')
+    layout = []
+    seasons = []
+    for stat_group in player.get('stats') or []:
+        kind = stat_group.get('type', {}).get('displayName')
+        group = stat_group.get('group', {}).get('displayName')
+        layout.append([kind, group])
+        if kind != 'yearByYear':
+            continue
+        for sequence, split in enumerate(stat_group.get('splits', [])):
+            try:
+                season = int(split.get('season'))
+            except (TypeError, ValueError):
+                continue
+            if season < current_year:
+                seasons.append(PlayerSeasonStats(
+                    player_id=player_id, stat_group=group, season=season,
+                    sequence=sequence, data=json.dumps(parse_stat_split(split))
+                ))
+
+    try:
+        with app.app_context():
+            ensure_player_stats_tables()
+            PlayerSeasonStats.query.filter_by(player_id=player_id).delete()
+            db.session.add_all(seasons)
+            db.session.merge(PlayerStatsArchive(
+                player_id=player_id, through_season=current_year - 1, layout=json.dumps(layout), archived_at=datetime.utcnow()
+            ))
+            db.session.commit()
+    except Exception as e:
+        logger.error("Error archiving stats for player %s: %s", player_id, e)
+
+def merge_player_stats(player, layout, archived):
+    """A current-season response plus the archived rows, in the order of the full yearByYear response"""
+    fresh = OrderedDict()
+    for stat_group in player.get('stats') or []:
+        kind = stat_group.get('type', {}).get('displayName')
+        # The current season stands in for the last yearByYear rows
+        if kind == 'season':
+            kind = 'yearByYear'
+        fresh[(kind, stat_group.get('group', {}).get('displayName'))] = stat_group.get('splits', [])
+
+    player_info = parse_player_stats({**player, 'stats': []})
+    # Groups the player had no rows in before (a first pitching appearance) go last
+    for kind, group in layout + [pair for pair in fresh if pair not in layout]:
+        if kind == 'yearByYear':
+            player_info['stats'].extend(archived.get(group, []))
+        player_info['stats'].extend(parse_stat_split(split) for split in fresh.get((kind, group), []))
+    return player_info
+
+def parse_player_stats(player):
+    """Profile and per-season/career stat rows for one entry of a people response"""
+    player_info = {
+        'id': player.get('id'),
+        'fullName': player.get('fullName'),
+        'primaryNumber': player.get('primaryNumber', 'N/A'),
+        'currentTeam': player.get('currentTeam', {}).get('name', 'Free Agent'),
+        'primaryPosition': player.get('primaryPosition', {}).get('name', 'N/A'),
+        'age': player.get('currentAge', 'N/A'),
+        'birthDate': player.get('birthDate', 'N/A'),
+        'height': player.get('height', 'N/A'),
+        'weight': player.get('weight', 'N/A'),
+        'bats': player.get('batSide', {}).get('code', 'N/A'),
+        'throws': player.get('pitchHand', {}).get('code', 'N/A'),
+        'headshot': f"https://img.mlbstatic.com/mlb-photos/image/upload/d_people:generic:headshot:67:current.png/w_426,q_auto:best/v1/people/{player.get('id')}/headshot/67/current",
+        'stats': []
+    }
+
+    # Extract stats
+    if player.get('stats'):
+        for stat_group in player['stats']:
+            for split in stat_group.get('splits', []):
+                player_info['stats'].append(parse_stat_split(split))
+
+    return player_info
+
+def parse_stat_split(split):
+    """One season (or career) row of hitting and/or pitching stats"""
+    stat_data = split.get('stat', {})
+    season = split.get('season', 'Career')
+
+    stat_entry = {
+        'season': season,
+        'team': split.get('team', {}).get('name', 'N/A')
+    }
+
+    # Add hitting stats if available
+    if 'avg' in stat_data:
+        stat_entry.update({
+            'gamesPlayed': stat_data.get('gamesPlayed', 0),
+            'atBats': stat_data.get('atBats', 0),
+            'hits': stat_data.get('hits', 0),
+            'avg': stat_data.get('avg', '.000'),
+            'homeRuns': stat_data.get('homeRuns', 0),
+            'rbi': stat_data.get('rbi', 0),
+            'runs': stat_data.get('runs', 0),
+            'obp': stat_data.get('obp', '.000'),
+            'slg': stat_data.get('slg', '.000'),
+            'ops': stat_data.get('ops', '.000'),
+            'stolenBases': stat_data.get('stolenBases', 0)
+        })
+
+    # Add pitching stats if available
+    if 'era' in stat_data:
+        stat_entry.update({
+            'gamesPlayed': stat_data.get('gamesPlayed', 0),
+            'gamesStarted': stat_data.get('gamesStarted', 0),
+            'wins': stat_data.get('wins', 0),
+            'losses': stat_data.get('losses', 0),
+            'era': stat_data.get('era', '0.00'),
+            'inningsPitched': stat_data.get('inningsPitched', '0.0'),
+            'strikeOuts': stat_data.get('strikeOuts', 0),
+            'walks': stat_data.get('baseOnBalls', 0),
+            'whip': stat_data.get('whip', '0.00'),
+            'saves': stat_data.get('saves', 0)
+        })
+
+    return stat_entry
+
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
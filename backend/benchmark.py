@@ -0,0 +1,213 @@
+"""
+Load test and micro-benchmarks for the API.
+
+Drive a running server (ideally started with MLB_API_BASE pointing at
+mlb_replay.py so every run sees the same upstream data):
+
+    python backend/benchmark.py http --base-url http://localhost:5000 --concurrency 16 --requests 400
+
+Time the pure functions on the request path:
+
+    python backend/benchmark.py micro
+
+Both write their results as JSON (--output) and can print the change
+against an earlier results file (--compare).
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import argparse
+import json
+import os
+import subprocess
+import threading
+import time
+import timeit
+
+import numpy as np
+import requests
+
+def route_paths(args):
+    return {
+        'games': f'/api/games/{args.date}',
+        'teams': '/api/teams',
+        'players': f'/api/players/{args.team_id}',
+        'matchup': f'/api/matchup/{args.pitcher_id}/{args.batter_id}',
+        'bets': '/api/bets',
+        'bets_stats': '/api/bets/stats',
+    }
+
+def summarize(latencies, errors, elapsed):
+    """Latency percentiles in milliseconds plus throughput for one route"""
+    if not latencies:
+        return {'requests': 0, 'errors': errors}
+    samples = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'mean_ms': round(float(samples.mean()), 2),
+        'p50_ms': round(float(p50), 2),
+        'p95_ms': round(float(p95), 2),
+        'p99_ms': round(float(p99), 2),
+        'max_ms': round(float(samples.max()), 2),
+        'throughput_rps': round(len(latencies) / elapsed, 1) if elapsed else None,
+    }
+
+def run_route(base_url, path, total, concurrency, warmup, headers):
+    """Issue total GETs to one path from concurrency threads, each with its own keep-alive session"""
+    local = threading.local()
+
+    def session():
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        return local.session
+
+    def timed_get(_):
+        started = time.perf_counter()
+        try:
+            response = session().get(base_url + path, headers=headers, timeout=30)
+            ok = response.status_code < 500
+        except requests.RequestException:
+            ok = False
+        return time.perf_counter() - started, ok
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(timed_get, range(warmup)))
+        started = time.perf_counter()
+        results = list(pool.map(timed_get, range(total)))
+        elapsed = time.perf_counter() - started
+
+    latencies = [latency for latency, ok in results if ok]
+    errors = sum(1 for _, ok in results if not ok)
+    return summarize(latencies, errors, elapsed)
+
+def run_http(args):
+    headers = {'Accept-Encoding': 'gzip'} if args.gzip else {}
+    paths = route_paths(args)
+    selected = args.routes.split(',') if args.routes else list(paths)
+    results = {}
+    for name in selected:
+        results[name] = run_route(args.base_url.rstrip('/'), paths[name], args.requests, args.concurrency, args.warmup, headers)
+        print(f"{name:12} {format_result(results[name])}")
+    return {
+        'config': {
+            'base_url': args.base_url,
+            'concurrency': args.concurrency,
+            'requests': args.requests,
+            'warmup': args.warmup,
+            'gzip': args.gzip,
+            'paths': {name: paths[name] for name in selected},
+        },
+        'routes': results,
+    }
+
+def format_result(result):
+    if not result.get('requests'):
+        return f"no successful requests ({result['errors']} errors)"
+    return (f"p50 {result['p50_ms']:8.2f} ms  p95 {result['p95_ms']:8.2f} ms  "
+            f"p99 {result['p99_ms']:8.2f} ms  {result['throughput_rps']:8.1f} req/s  {result['errors']} errors")
+
+def sample_roster(size=26):
+    roster = []
+    for index in range(size):
+        pitcher = index % 2 == 0
+        group = 'pitching' if pitcher else 'hitting'
+        stat = {'era': f'{3 + index % 3}.{index:02d}'} if pitcher else {'avg': f'.{250 + index:03d}', 'ops': '.800'}
+        roster.append({
+            'person': {'id': 600000 + index, 'fullName': f'Player {index}',
+                       'stats': [{'group': {'displayName': group}, 'splits': [{'stat': stat}]}]},
+            'position': {'abbreviation': 'P' if pitcher else ['C', '1B', '2B', 'SS', '3B', 'LF', 'CF', 'RF', 'DH'][index % 9]},
+        })
+    return {'roster': roster}
+
+def sample_person(seasons=15):
+    hitting = {'gamesPlayed': 150, 'atBats': 550, 'hits': 160, 'avg': '.291', 'homeRuns': 30, 'rbi': 95,
+               'runs': 90, 'obp': '.370', 'slg': '.520', 'ops': '.890', 'stolenBases': 8}
+    splits = [{'season': str(2010 + year), 'team': {'name': 'New York Yankees'}, 'stat': hitting} for year in range(seasons)]
+    return {
+        'id': 592450, 'fullName': 'Sample Player', 'currentTeam': {'name': 'New York Yankees'},
+        'stats': [
+            {'type': {'displayName': 'yearByYear'}, 'group': {'displayName': 'hitting'}, 'splits': splits},
+            {'type': {'displayName': 'career'}, 'group': {'displayName': 'hitting'}, 'splits': [{'stat': hitting}]},
+        ],
+    }
+
+def run_micro(args):
+    # The app module only builds its caches and clients at import; nothing is fetched
+    import app as mlb_app
+
+    roster = sample_roster()
+    person = sample_person()
+    cases = {
+        'calculate_win_probability': lambda: mlb_app.calculate_win_probability(4, 3, '7th', 'Bottom', 'live'),
+        'calculate_prizepicks_payout': lambda: mlb_app.calculate_prizepicks_payout(10, 5, 'Flex', 4),
+        'calculate_underdog_payout': lambda: mlb_app.calculate_underdog_payout(10, 4, 'Flex', 3),
+        'parse_roster_players': lambda: mlb_app.parse_roster_players(roster),
+        'parse_player_stats': lambda: mlb_app.parse_player_stats(person),
+    }
+
+    results = {}
+    for name, case in cases.items():
+        timer = timeit.Timer(case)
+        loops, _ = timer.autorange()
+        runs = [elapsed / loops for elapsed in timer.repeat(repeat=args.repeat, number=loops)]
+        results[name] = {
+            'loops': loops,
+            'best_us': round(min(runs) * 1e6, 3),
+            'median_us': round(float(np.median(runs)) * 1e6, 3),
+        }
+        print(f"{name:28} best {results[name]['best_us']:10.3f} us  median {results[name]['median_us']:10.3f} us")
+    return {'config': {'repeat': args.repeat}, 'micro': results}
+
+def compare(current, previous_path):
+    """Print the change of each headline number against an earlier results file"""
+    with open(previous_path) as previous_file:
+        previous = json.load(previous_file)
+    for section, metric in (('routes', 'p95_ms'), ('routes', 'throughput_rps'), ('micro', 'median_us')):
+        for name, result in current.get(section, {}).items():
+            before = previous.get(section, {}).get(name, {}).get(metric)
+            after = result.get(metric)
+            if before and after is not None:
+                print(f"{name:28} {metric:15} {before:10.2f} -> {after:10.2f} ({(after - before) / before:+.1%})")
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the MLB stats API')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='earlier results file to compare against')
+    modes = parser.add_subparsers(dest='mode', required=True)
+
+    http = modes.add_parser('http', help='load test a running server')
+    http.add_argument('--base-url', default='http://localhost:5000')
+    http.add_argument('--concurrency', type=int, default=8)
+    http.add_argument('--requests', type=int, default=200, help='requests per route')
+    http.add_argument('--warmup', type=int, default=10, help='untimed requests per route first')
+    http.add_argument('--routes', help='comma separated subset of: games,teams,players,matchup,bets,bets_stats')
+    http.add_argument('--date', default=datetime.now().strftime('%Y-%m-%d'))
+    http.add_argument('--team-id', type=int, default=147)
+    http.add_argument('--pitcher-id', type=int, default=543037)
+    http.add_argument('--batter-id', type=int, default=592450)
+    http.add_argument('--gzip', action='store_true', help='send Accept-Encoding: gzip')
+
+    micro = modes.add_parser('micro', help='time the pure functions')
+    micro.add_argument('--repeat', type=int, default=5)
+
+    args = parser.parse_args()
+    results = run_http(args) if args.mode == 'http' else run_micro(args)
+    results.update({'mode': args.mode, 'commit': git_commit(), 'timestamp': datetime.now().isoformat(timespec='seconds')})
+
+    if args.compare:
+        compare(results, args.compare)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+        print(f"Wrote {args.output}")
+
+if __name__ == '__main__':
+    main()
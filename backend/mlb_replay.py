@@ -0,0 +1,116 @@
+"""
+Stand-in for the MLB Stats API that serves recorded fixtures.
+
+Record fixtures by running the app with MLB_RECORD_DIR set, then serve
+them with:
+
+    python backend/mlb_replay.py --fixtures fixtures/ --port 5050 --latency 0.2
+
+and start the app with MLB_API_BASE=http://localhost:5050/api/v1.
+Latency, timeouts and errors can be injected to see how the app behaves
+when statsapi is slow or failing.
+"""
+from flask import Flask, jsonify, request, Response
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import time
+from urllib.parse import unquote
+
+def load_fixtures(directory):
+    """Map each recorded path (with its query string) to its fixture"""
+    fixtures = {}
+    for fixture_path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        with open(fixture_path) as fixture_file:
+            fixture = json.load(fixture_file)
+        # Clients may percent-encode brackets and commas; match on the decoded form
+        fixtures[unquote(fixture['path'])] = fixture
+    return fixtures
+
+def parse_slow_rules(rules):
+    """--slow 'feed/live=1.5' style rules as (compiled pattern, seconds) pairs"""
+    parsed = []
+    for rule in rules:
+        pattern, _, seconds = rule.rpartition('=')
+        parsed.append((re.compile(pattern), float(seconds)))
+    return parsed
+
+def create_replay_app(fixtures, prefix='/api/v1', latency=0.0, jitter=0.0, error_rate=0.0,
+                      timeout_rate=0.0, hang=30.0, slow=(), loose=False):
+    app = Flask(__name__)
+    counters = {'requests': 0, 'served': 0, 'missing': 0, 'errors': 0, 'hangs': 0}
+
+    # Without an exact match, --loose serves any fixture for the same path
+    by_route = {}
+    for path, fixture in fixtures.items():
+        by_route.setdefault(path.split('?')[0], fixture)
+
+    @app.route('/__replay/stats')
+    def replay_stats():
+        return jsonify({'fixtures': len(fixtures), **counters})
+
+    @app.route(f'{prefix}/<path:path>')
+    def replay(path):
+        counters['requests'] += 1
+        query = unquote(request.query_string.decode('utf-8'))
+        full_path = f'{path}?{query}' if query else path
+
+        delay = max(latency + random.uniform(-jitter, jitter), 0)
+        for pattern, seconds in slow:
+            if pattern.search(full_path):
+                delay = seconds
+        if timeout_rate and random.random() < timeout_rate:
+            counters['hangs'] += 1
+            delay = hang
+        time.sleep(delay)
+
+        if error_rate and random.random() < error_rate:
+            counters['errors'] += 1
+            return jsonify({'message': 'Injected error'}), 503
+
+        fixture = fixtures.get(full_path)
+        if fixture is None and loose:
+            fixture = by_route.get(path)
+        if fixture is None:
+            counters['missing'] += 1
+            return jsonify({'message': f'No fixture recorded for {full_path}'}), 404
+
+        counters['served'] += 1
+        body = fixture['body']
+        payload = body if isinstance(body, str) else json.dumps(body)
+        return Response(payload, status=fixture.get('status', 200), mimetype='application/json')
+
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve recorded MLB Stats API fixtures')
+    parser.add_argument('--fixtures', default=os.environ.get('MLB_RECORD_DIR', 'fixtures'),
+                        help='directory written by MLB_RECORD_DIR')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5050)
+    parser.add_argument('--prefix', default='/api/v1', help='path prefix of MLB_API_BASE')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random +/- seconds around --latency')
+    parser.add_argument('--slow', action='append', default=[], metavar='PATTERN=SECONDS',
+                        help='fixed latency for paths matching a regex, e.g. feed/live=2')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='fraction of requests that hang')
+    parser.add_argument('--hang', type=float, default=30.0, help='seconds a hanging request sleeps')
+    parser.add_argument('--loose', action='store_true',
+                        help='serve a fixture for the same path when the query string does not match')
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    print(f"Loaded {len(fixtures)} fixtures from {args.fixtures}")
+    app = create_replay_app(
+        fixtures, prefix=args.prefix.rstrip('/'), latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, timeout_rate=args.timeout_rate, hang=args.hang,
+        slow=parse_slow_rules(args.slow), loose=args.loose
+    )
+    app.run(host=args.host, port=args.port, threaded=True)
+
+if __name__ == '__main__':
+    main()
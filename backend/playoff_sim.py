@@ -0,0 +1,56 @@
+"""
+Monte Carlo season simulation behind /api/standings/odds.
+
+Kept apart from app.py so the simulation pool's worker processes only
+import numpy, not Flask, SQLAlchemy and the caches.
+"""
+import numpy as np
+
+WILD_CARDS_PER_LEAGUE = 3
+BYES_PER_LEAGUE = 2
+
+def simulate_seasons(seed, simulations, wins, home, away, home_win_prob, league, division):
+    """
+    Play out the remaining games for a block of seasons at once (one row per
+    season) and count, per team, division titles, wild cards, byes and wins.
+    Runs in the simulation pool, so it only touches its arguments.
+    """
+    rng = np.random.default_rng(seed)
+    team_count = len(wins)
+    rows = np.arange(simulations)[:, None]
+
+    # Win totals: each simulated result adds one to the home or away column
+    home_won = (rng.random((simulations, len(home))) < home_win_prob).astype(np.float32)
+    home_matrix = np.zeros((len(home), team_count), dtype=np.float32)
+    away_matrix = np.zeros((len(away), team_count), dtype=np.float32)
+    home_matrix[np.arange(len(home)), home] = 1
+    away_matrix[np.arange(len(away)), away] = 1
+    season_wins = wins + home_won @ home_matrix + (1 - home_won) @ away_matrix
+
+    # Fractional noise below one win breaks ties at random
+    ranking = season_wins + rng.random((simulations, team_count)) * 0.5
+
+    division_winner = np.zeros((simulations, team_count), dtype=bool)
+    for division_id in np.unique(division):
+        members = np.flatnonzero(division == division_id)
+        best = members[np.argmax(ranking[:, members], axis=1)]
+        division_winner[np.arange(simulations), best] = True
+
+    wild_card = np.zeros_like(division_winner)
+    bye = np.zeros_like(division_winner)
+    for league_id in np.unique(league):
+        in_league = league == league_id
+        winners = np.where(division_winner & in_league, ranking, -np.inf)
+        top_winners = np.argsort(-winners, axis=1)[:, :BYES_PER_LEAGUE]
+        bye[rows, top_winners] |= np.isfinite(winners[rows, top_winners])
+
+        others = np.where(~division_winner & in_league, ranking, -np.inf)
+        top_others = np.argsort(-others, axis=1)[:, :WILD_CARDS_PER_LEAGUE]
+        wild_card[rows, top_others] |= np.isfinite(others[rows, top_others])
+
+    return {
+        'division': division_winner.sum(axis=0),
+        'wild_card': wild_card.sum(axis=0),
+        'bye': bye.sum(axis=0),
+        'wins': season_wins.sum(axis=0)
+    }
@@ -119,14 +119,133 @@ document.addEventListener('DOMContentLoaded', function() {
     loadTeams();
     setupThemeToggle();
 
-    // Auto-refresh games every 15 seconds (only if viewing today)
+    // Live updates for today's games are pushed by the server
+    subscribeToLiveGames();
+
+    // The stream is opened for a fixed date; move it along when the day rolls over
     setInterval(() => {
+        if (gamesStream && formatDateKey(new Date()) !== streamDate) {
+            gamesStream.close();
+            subscribeToLiveGames();
+        }
+    }, 60000);
+});
+
+function formatDateKey(date) {
+    const year = date.getFullYear();
+    const month = String(date.getMonth() + 1).padStart(2, '0');
+    const day = String(date.getDate()).padStart(2, '0');
+    return `${year}-${month}-${day}`;
+}
+
+// Subscribe to the scoreboard stream for today; falls back to polling if unavailable
+let gamesStream = null;
+let streamDate = null;
+let gamesPollTimer = null;
+
+function subscribeToLiveGames() {
+    if (!window.EventSource) {
+        startGamesPolling();
+        return;
+    }
+
+    streamDate = formatDateKey(new Date());
+    gamesStream = new EventSource(`/api/games/stream?date=${streamDate}`);
+
+    gamesStream.addEventListener('snapshot', function(event) {
+        const snapshot = JSON.parse(event.data);
+        streamDate = snapshot.date;
+        apiCache.games[streamDate] = {
+            data: snapshot.games,
+            timestamp: Date.now(),
+            version: parseInt(event.lastEventId)
+        };
+        renderStreamedGames(streamDate);
+    });
+
+    gamesStream.addEventListener('game', function(event) {
+        const change = JSON.parse(event.data);
+        const cached = apiCache.games[streamDate];
+        if (!cached) {
+            return;
+        }
+        const game = cached.data.find(g => g.id === change.id);
+        if (game) {
+            Object.assign(game, change);
+            cached.timestamp = Date.now();
+            cached.version = parseInt(event.lastEventId);
+            renderStreamedGames(streamDate);
+        }
+    });
+
+    gamesStream.addEventListener('error', function() {
+        // EventSource reconnects on its own unless the server refused the stream
+        if (this.readyState === EventSource.CLOSED) {
+            gamesStream = null;
+            startGamesPolling();
+        }
+    });
+}
+
+function renderStreamedGames(dateKey) {
+    // Only re-render if the user is looking at the streamed date
+    if (formatDateKey(currentDate) === dateKey) {
+        renderGames(apiCache.games[dateKey].data, currentDate);
+    }
+}
+
+function startGamesPolling() {
+    if (gamesPollTimer) {
+        return;
+    }
+    // Poll for changes every 15 seconds (only if viewing today)
+    gamesPollTimer = setInterval(() => {
         const today = new Date();
         if (currentDate.toDateString() === today.toDateString()) {
-            loadGamesForDate(currentDate);
+            pollGameChanges(formatDateKey(today));
         }
     }, 15000);
-});
+}
+
+async function pollGameChanges(dateKey) {
+    const cached = apiCache.games[dateKey];
+    if (!cached || cached.version === undefined) {
+        loadGamesForDate(currentDate);
+        return;
+    }
+
+    try {
+        // Ask only for games that changed since the version we already have
+        const response = await fetch(`/api/games/${dateKey}?since=${cached.version}`);
+        const delta = await response.json();
+        if (delta.version === undefined) {
+            return;
+        }
+
+        if (delta.full) {
+            cached.data = delta.games;
+        } else {
+            delta.games.forEach(change => {
+                const index = cached.data.findIndex(g => g.id === change.id);
+                if (index >= 0) {
+                    cached.data[index] = change;
+                } else {
+                    cached.data.push(change);
+                }
+            });
+            cached.data = cached.data.filter(g => !delta.removed.includes(g.id));
+        }
+
+        const changed = delta.full || delta.games.length > 0 || delta.removed.length > 0;
+        cached.version = delta.version;
+        cached.timestamp = Date.now();
+        if (changed) {
+            renderStreamedGames(dateKey);
+        }
+    } catch (error) {
+        console.error('Error polling game changes:', error);
+    }
+}
 
 function setupDatePicker() {
     const datePicker = document.getElementById('date-picker');
@@ -291,9 +410,14 @@ async function loadGamesForDate(date) {
 
         const response = await fetch(`/api/games/${dateStr}`);
         const games = await response.json();
+        const version = response.headers.get('X-Games-Version');
 
-        // Cache the results
-        apiCache.games[dateStr] = { data: games, timestamp: now };
+        // Cache the results along with the scoreboard version for change polling
+        apiCache.games[dateStr] = {
+            data: games,
+            timestamp: now,
+            version: version !== null ? parseInt(version) : undefined
+        };
 
         renderGames(games, date);
     } catch (error) {
@@ -0,0 +1,35 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Configure the app before it is imported: private cache and database files, no refresher thread
+os.environ['CACHE_BACKEND'] = 'memory'
+TEST_DIR = tempfile.mkdtemp()
+os.environ['CACHE_DB_PATH'] = os.path.join(TEST_DIR, 'cache.db')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(TEST_DIR, 'baseball_stats.db')
+os.environ['BACKGROUND_REFRESH'] = '0'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import app as app_module  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def appmod():
+    return app_module
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def cache(request, tmp_path):
+    if request.param == 'memory':
+        return app_module.MemoryCache()
+    return app_module.SQLiteCache(str(tmp_path / 'cache.db'))
+
+
+@pytest.fixture
+def api_cache(monkeypatch):
+    """A fresh in-memory cache in place of the module-wide one"""
+    cache = app_module.MemoryCache()
+    monkeypatch.setattr(app_module, 'api_cache', cache)
+    return cache
@@ -0,0 +1,154 @@
+import threading
+import time
+
+
+def run_in_thread(func):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_lru_evicts_least_recently_used_over_byte_budget(appmod):
+    lru = appmod.LRUCache(max_bytes=100)
+    lru.put('a', 'A', 40)
+    lru.put('b', 'B', 40)
+    assert lru.get('a') == 'A'  # 'b' is now the least recently used
+    lru.put('c', 'C', 40)
+
+    assert lru.get('b') is None
+    assert lru.get('a') == 'A'
+    assert lru.get('c') == 'C'
+    stats = lru.stats()
+    assert stats['bytes'] == 80
+    assert stats['evictions'] == 1
+
+
+def test_lru_replacing_a_key_recounts_its_size(appmod):
+    lru = appmod.LRUCache(max_bytes=100)
+    lru.put('a', 'A', 60)
+    lru.put('a', 'A2', 30)
+    lru.put('b', 'B', 60)
+
+    assert lru.stats()['bytes'] == 90
+    assert lru.get('a') == 'A2'
+    assert lru.stats()['evictions'] == 0
+
+
+def test_lru_keeps_newest_entry_even_if_over_budget(appmod):
+    lru = appmod.LRUCache(max_bytes=10)
+    lru.put('a', 'A', 5)
+    lru.put('big', 'BIG', 50)
+
+    assert lru.get('a') is None
+    assert lru.get('big') == 'BIG'
+    assert lru.stats()['entries'] == 1
+
+
+def test_lru_pop_releases_bytes(appmod):
+    lru = appmod.LRUCache(max_bytes=100)
+    lru.put('a', 'A', 40)
+    lru.pop('a')
+    lru.pop('missing')
+    assert lru.stats()['bytes'] == 0
+
+
+def test_set_and_get_round_trip(cache):
+    stored = cache.set('games:2024-07-01', [{'id': 1}], 60, version=3)
+    entry = cache.get('games:2024-07-01')
+
+    assert entry.data == [{'id': 1}]
+    assert entry.version == 3
+    assert entry.etag == stored.etag
+    assert entry.is_fresh()
+    assert cache.get('missing') is None
+
+
+def test_get_returns_the_replacing_body(cache):
+    cache.set('teams', {'v': 1}, 60)
+    assert cache.get('teams').data == {'v': 1}
+    cache.set('teams', {'v': 2}, 60)
+
+    entry = cache.get('teams')
+    assert entry.data == {'v': 2}
+    assert entry.etag == cache.set('other', {'v': 2}, 60).etag
+
+
+def test_sqlite_get_sees_rows_written_by_another_process(appmod, tmp_path):
+    path = str(tmp_path / 'shared.db')
+    reader = appmod.SQLiteCache(path)
+    writer = appmod.SQLiteCache(path)
+    writer.set('standings', {'v': 1}, 60)
+    assert reader.get('standings').data == {'v': 1}
+
+    # The reader's decoded copy must not outlive the row it came from
+    writer.set('standings', {'v': 2}, 60)
+    assert reader.get('standings').data == {'v': 2}
+    writer.delete('standings')
+    assert reader.get('standings') is None
+
+
+def test_sqlite_prune_evicts_least_recently_accessed(appmod, tmp_path):
+    cache = appmod.SQLiteCache(str(tmp_path / 'cache.db'), max_bytes=250)
+    now = time.time()
+    for age, key in ((30, 'old'), (20, 'middle'), (10, 'new')):
+        cache.set(key, 'x' * 100, 60, timestamp=now - age)
+    cache.prune()
+
+    assert set(cache.keys()) == {'middle', 'new'}
+    assert cache.evictions == 1
+
+
+def test_lease_excludes_other_threads_until_released(cache):
+    assert cache.acquire_lease('rosters', 30)
+    assert cache.acquire_lease('rosters', 30)  # the holder may renew
+    assert cache.lease_held('rosters')
+    assert not run_in_thread(lambda: cache.acquire_lease('rosters', 30))
+
+    cache.release_lease('rosters')
+    assert not cache.lease_held('rosters')
+    assert run_in_thread(lambda: cache.acquire_lease('rosters', 30))
+
+
+def test_lease_release_by_non_holder_is_ignored(cache):
+    assert cache.acquire_lease('rosters', 30)
+    run_in_thread(lambda: cache.release_lease('rosters'))
+    assert cache.lease_held('rosters')
+
+
+def test_expired_lease_can_be_taken_over(cache):
+    assert cache.acquire_lease('rosters', 0)
+    assert not cache.lease_held('rosters')
+    assert run_in_thread(lambda: cache.acquire_lease('rosters', 30))
+
+
+def test_version_counter_starts_at_current_time_and_increments(cache):
+    assert cache.current_version('games:2024-07-01') == 0
+    before = int(time.time())
+    first = cache.bump_version('games:2024-07-01')
+
+    assert first >= before
+    assert cache.bump_version('games:2024-07-01') == first + 1
+    assert cache.current_version('games:2024-07-01') == first + 1
+
+
+def test_version_counter_survives_entry_eviction(cache):
+    cache.set('games:2024-07-01', [], 60)
+    version = cache.bump_version('games:2024-07-01')
+    cache.delete('games:2024-07-01')
+
+    assert cache.current_version('games:2024-07-01') == version
+
+
+def test_sqlite_prune_drops_only_idle_version_counters(appmod, tmp_path, monkeypatch):
+    cache = appmod.SQLiteCache(str(tmp_path / 'cache.db'))
+    cache.bump_version('games:old')
+    monkeypatch.setattr(appmod, 'VERSION_RETENTION', -1)
+    cache.prune()
+    assert cache.current_version('games:old') == 0
+
+    monkeypatch.setattr(appmod, 'VERSION_RETENTION', 60)
+    version = cache.bump_version('games:new')
+    cache.prune()
+    assert cache.current_version('games:new') == version
@@ -0,0 +1,134 @@
+import pytest
+import requests
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class FakeSession:
+    """Stands in for requests.Session: pops one outcome per call"""
+
+    def __init__(self):
+        self.outcomes = []
+        self.calls = 0
+
+    def get(self, url, timeout):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResponse(outcome)
+
+
+@pytest.fixture
+def client(appmod):
+    policies = {'schedule': appmod.EndpointPolicy(timeout=5, ttl=15, retries=0)}
+    client = appmod.MLBStatsClient('http://statsapi.test/api/v1', policies)
+    client.session = FakeSession()
+    return client
+
+
+def cool_down(breaker):
+    breaker.opened_at -= breaker.reset_timeout
+
+
+def test_breaker_opens_at_the_threshold(appmod):
+    breaker = appmod.CircuitBreaker(threshold=3, reset_timeout=30)
+    assert [breaker.record_failure() for _ in range(3)] == [False, False, True]
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+    # Calls already in flight when it opened do not extend the open period
+    opened_at = breaker.opened_at
+    assert not breaker.record_failure()
+    assert breaker.opened_at == opened_at
+
+
+def test_success_resets_the_failure_count(appmod):
+    breaker = appmod.CircuitBreaker(threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    assert not breaker.record_failure()
+    assert breaker.state == 'closed'
+
+
+def test_half_open_lets_one_trial_through(appmod):
+    breaker = appmod.CircuitBreaker(threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    cool_down(breaker)
+
+    assert breaker.state == 'half_open'
+    assert breaker.allow()
+    assert not breaker.allow()  # only the one trial
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens_for_another_period(appmod):
+    breaker = appmod.CircuitBreaker(threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    cool_down(breaker)
+    assert breaker.allow()
+
+    assert breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+
+
+def test_released_trial_frees_the_slot(appmod):
+    breaker = appmod.CircuitBreaker(threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    cool_down(breaker)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+def test_client_stops_calling_after_threshold_failures(appmod, client):
+    client.session.outcomes = [requests.ConnectionError('refused')] * appmod.CIRCUIT_FAILURE_THRESHOLD
+    for _ in range(appmod.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(requests.ConnectionError):
+            client.get('schedule', 'schedule?sportId=1')
+
+    with pytest.raises(appmod.UpstreamUnavailable):
+        client.get('schedule', 'schedule?sportId=1')
+    assert client.session.calls == appmod.CIRCUIT_FAILURE_THRESHOLD
+    # Other endpoints have their own breaker
+    assert client.breaker('teams').state == 'closed'
+
+
+def test_retryable_statuses_count_as_failures(appmod, client):
+    client.session.outcomes = [503] * appmod.CIRCUIT_FAILURE_THRESHOLD
+    for _ in range(appmod.CIRCUIT_FAILURE_THRESHOLD):
+        assert client.get('schedule', 'schedule').status_code == 503
+    assert client.breaker('schedule').state == 'open'
+
+
+def test_client_recovers_through_a_successful_trial(appmod, client):
+    client.session.outcomes = [503] * appmod.CIRCUIT_FAILURE_THRESHOLD + [200, 200]
+    for _ in range(appmod.CIRCUIT_FAILURE_THRESHOLD):
+        client.get('schedule', 'schedule')
+    cool_down(client.breaker('schedule'))
+
+    assert client.get('schedule', 'schedule').status_code == 200
+    assert client.breaker('schedule').state == 'closed'
+    assert client.get('schedule', 'schedule').status_code == 200
+
+
+def test_spent_deadline_skips_the_call(appmod, client):
+    token = appmod.request_deadline.set(appmod.time.monotonic() - 1)
+    try:
+        with pytest.raises(appmod.UpstreamUnavailable):
+            client.get('schedule', 'schedule')
+    finally:
+        appmod.request_deadline.reset(token)
+
+    assert client.session.calls == 0
+    breaker = client.breaker('schedule')
+    assert (breaker.failures, breaker.state) == (0, 'closed')
+    # The deadline was spent, not the endpoint: the next call goes through
+    client.session.outcomes = [200]
+    assert client.get('schedule', 'schedule').status_code == 200
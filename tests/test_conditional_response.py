@@ -0,0 +1,101 @@
+import gzip
+
+import pytest
+
+
+@pytest.fixture
+def entry(appmod):
+    return appmod.build_cache_entry({'games': ['x' * 40] * 50}, 60)
+
+
+def respond(appmod, entry, headers=None):
+    with appmod.app.test_request_context('/api/games', headers=headers or {}):
+        return appmod.conditional_response(entry)
+
+
+def test_sends_the_stored_body_with_its_etag(appmod, entry):
+    response = respond(appmod, entry)
+
+    assert response.status_code == 200
+    assert response.get_data() == entry.body
+    assert response.get_etag() == (entry.etag, False)
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.vary
+    assert response.headers['Cache-Control'] == 'public, max-age=60'
+
+
+def test_sends_the_gzip_variant_under_its_own_etag(appmod, entry):
+    response = respond(appmod, entry, {'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()) == entry.body
+    assert response.get_etag() == (f'{entry.etag}-gzip', False)
+
+
+def test_prefers_the_brotli_variant(appmod, entry):
+    brotli = pytest.importorskip('brotli')
+    response = respond(appmod, entry, {'Accept-Encoding': 'gzip, br'})
+
+    assert response.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(response.get_data()) == entry.body
+    assert response.get_etag() == (f'{entry.etag}-br', False)
+
+
+def test_small_bodies_are_not_compressed(appmod):
+    small = appmod.build_cache_entry({'a': 1}, 60)
+    response = respond(appmod, small, {'Accept-Encoding': 'gzip'})
+
+    assert small.encodings == {}
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_data() == small.body
+
+
+def test_if_none_match_is_not_modified(appmod, entry):
+    response = respond(appmod, entry, {'If-None-Match': f'"{entry.etag}"'})
+
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    assert response.get_etag() == (entry.etag, False)
+
+
+@pytest.mark.parametrize('suffix', ['', '-gzip', '-br'])
+def test_if_none_match_on_any_variant_is_not_modified(appmod, entry, suffix):
+    response = respond(appmod, entry, {'If-None-Match': f'"{entry.etag}{suffix}"', 'Accept-Encoding': 'gzip'})
+
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    assert response.get_etag()[0].startswith(entry.etag)
+
+
+def test_if_none_match_on_other_content_sends_the_body(appmod, entry):
+    response = respond(appmod, entry, {'If-None-Match': '"somethingelse", W/"older"'})
+
+    assert response.status_code == 200
+    assert response.get_data() == entry.body
+
+
+def test_if_modified_since_is_ignored_when_if_none_match_is_sent(appmod, entry):
+    response = respond(appmod, entry, {
+        'If-None-Match': '"somethingelse"',
+        'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT',
+    })
+    assert response.status_code == 200
+
+
+def test_if_modified_since(appmod, entry):
+    assert respond(appmod, entry, {'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'}).status_code == 304
+    assert respond(appmod, entry, {'If-Modified-Since': 'Thu, 01 Jan 1970 00:00:00 GMT'}).status_code == 200
+
+
+def test_games_route_answers_a_revalidation_with_304(appmod, api_cache, monkeypatch):
+    monkeypatch.setattr(appmod, 'single_flight', appmod.SingleFlight(api_cache))
+    appmod.store_games_snapshot('2024-07-01', [{'id': 1, 'status': 'final'}])
+    client = appmod.app.test_client()
+
+    first = client.get('/api/games/2024-07-01')
+    assert first.status_code == 200
+    assert first.get_json() == [{'id': 1, 'status': 'final'}]
+    second = client.get('/api/games/2024-07-01', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 304
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert second.headers['X-Games-Version'] == first.headers['X-Games-Version']
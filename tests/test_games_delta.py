@@ -0,0 +1,112 @@
+DATE = '2024-07-01'
+
+
+def game(game_id, status='live', home_score=0):
+    return {'id': game_id, 'status': status, 'home_score': home_score}
+
+
+def test_first_snapshot_starts_an_empty_diff_ring(appmod, api_cache):
+    entry = appmod.store_games_snapshot(DATE, [game(1), game(2)])
+
+    assert entry.version == api_cache.current_version(f'games:{DATE}') > 0
+    assert api_cache.get(f'games_diffs:{DATE}').data == []
+
+
+def test_unchanged_snapshot_keeps_its_version(appmod, api_cache):
+    first = appmod.store_games_snapshot(DATE, [game(1)])
+    second = appmod.store_games_snapshot(DATE, [game(1)])
+
+    assert second.version == first.version
+    assert api_cache.get(f'games_diffs:{DATE}').data == []
+
+
+def test_delta_collects_changes_since_a_version(appmod, api_cache):
+    v1 = appmod.store_games_snapshot(DATE, [game(1), game(2), game(3)]).version
+    v2 = appmod.store_games_snapshot(DATE, [game(1, home_score=1), game(2), game(3)]).version
+    entry = appmod.store_games_snapshot(DATE, [game(1, home_score=2), game(2, status='final')])
+
+    assert (v1 + 1, v2 + 1) == (v2, entry.version)
+    delta = appmod.build_games_delta(DATE, entry, v1)
+    assert delta['full'] is False
+    assert delta['version'] == entry.version
+    assert sorted(delta['games'], key=lambda g: g['id']) == [game(1, home_score=2), game(2, status='final')]
+    assert delta['removed'] == [3]
+
+    delta = appmod.build_games_delta(DATE, entry, v2)
+    assert delta['removed'] == [3]
+    assert len(delta['games']) == 2
+
+
+def test_game_removed_then_back_is_reported_as_changed(appmod, api_cache):
+    v1 = appmod.store_games_snapshot(DATE, [game(1), game(2)]).version
+    appmod.store_games_snapshot(DATE, [game(1)])
+    entry = appmod.store_games_snapshot(DATE, [game(1), game(2, home_score=1)])
+
+    delta = appmod.build_games_delta(DATE, entry, v1)
+    assert delta['games'] == [game(2, home_score=1)]
+    assert delta['removed'] == []
+
+
+def test_current_version_gets_an_empty_delta(appmod, api_cache):
+    entry = appmod.store_games_snapshot(DATE, [game(1)])
+    assert appmod.build_games_delta(DATE, entry, entry.version) == {
+        'version': entry.version, 'full': False, 'games': [], 'removed': []
+    }
+
+
+def test_version_ahead_of_the_server_gets_a_full_snapshot(appmod, api_cache):
+    entry = appmod.store_games_snapshot(DATE, [game(1)])
+    delta = appmod.build_games_delta(DATE, entry, entry.version + 5)
+
+    assert delta['full'] is True
+    assert delta['version'] == entry.version
+    assert delta['games'] == [game(1)]
+
+
+def test_version_older_than_the_ring_gets_a_full_snapshot(appmod, api_cache, monkeypatch):
+    monkeypatch.setattr(appmod, 'GAMES_DIFF_HISTORY', 2)
+    v1 = appmod.store_games_snapshot(DATE, [game(1)]).version
+    for score in range(1, 4):
+        entry = appmod.store_games_snapshot(DATE, [game(1, home_score=score)])
+
+    assert len(api_cache.get(f'games_diffs:{DATE}').data) == 2
+    assert appmod.build_games_delta(DATE, entry, v1)['full'] is True
+    assert appmod.build_games_delta(DATE, entry, entry.version - 2)['full'] is False
+
+
+def test_version_keeps_rising_after_the_snapshot_is_evicted(appmod, api_cache):
+    entry = appmod.store_games_snapshot(DATE, [game(1)])
+    entry = appmod.store_games_snapshot(DATE, [game(1, home_score=1)])
+    api_cache.delete(f'games:{DATE}')
+    api_cache.delete(f'games_diffs:{DATE}')
+
+    rebuilt = appmod.store_games_snapshot(DATE, [game(1, home_score=1)])
+    assert rebuilt.version == entry.version + 1
+    # Nothing to diff against, so a client at the old version starts over
+    assert appmod.build_games_delta(DATE, rebuilt, entry.version)['full'] is True
+    assert appmod.build_games_delta(DATE, rebuilt, rebuilt.version)['full'] is False
+
+
+def test_version_survives_lru_eviction(appmod, monkeypatch):
+    cache = appmod.MemoryCache(max_bytes=1)  # every set evicts the previous entry
+    monkeypatch.setattr(appmod, 'api_cache', cache)
+    first = appmod.store_games_snapshot(DATE, [game(1)])
+    cache.set('filler', 'x' * 100, 60)
+    assert cache.get(f'games:{DATE}') is None
+
+    assert appmod.store_games_snapshot(DATE, [game(1)]).version > first.version
+
+
+def test_memory_backend_versions_differ_between_workers(appmod, monkeypatch):
+    tags = iter([1, 2])
+    monkeypatch.setattr(appmod.random, 'getrandbits', lambda bits: next(tags))
+    worker_a, worker_b = appmod.MemoryCache(), appmod.MemoryCache()
+    monkeypatch.setattr(appmod, 'api_cache', worker_a)
+    appmod.store_games_snapshot(DATE, [game(1)])
+    entry = appmod.store_games_snapshot(DATE, [game(1, home_score=1)])
+
+    # A version handed out by another worker never lines up with this one's
+    other = worker_b.bump_version(f'games:{DATE}')
+    assert other > entry.version
+    assert appmod.build_games_delta(DATE, entry, other)['full'] is True
+    assert appmod.build_games_delta(DATE, entry, other - 2 ** 33)['full'] is True
@@ -0,0 +1,69 @@
+import pytest
+
+GAME = 745001
+LINEUPS = {
+    'home_pitcher': {'id': 10, 'name': 'Home Starter'},
+    'away_pitcher': {'id': 20, 'name': 'Away Starter'},
+    'home': [{'id': 1, 'name': 'H1'}, {'id': 2, 'name': 'H2'}],
+    'away': [{'id': 3, 'name': 'A1'}, {'id': 4, 'name': 'A2'}],
+}
+
+
+@pytest.fixture
+def client(appmod, api_cache, monkeypatch):
+    monkeypatch.setattr(appmod, 'single_flight', appmod.SingleFlight(api_cache))
+    api_cache.set(f'lineups:{GAME}', LINEUPS, 30)
+    return appmod.app.test_client()
+
+
+def career_line(appmod, pitcher_id, batter_id):
+    if (pitcher_id, batter_id) == (20, 2):
+        raise KeyError('stats')  # an unexpected vsPlayer payload
+    if (pitcher_id, batter_id) == (10, 4):
+        return appmod.build_cache_entry({}, 3600)  # never faced each other
+    return appmod.build_cache_entry({'at_bats': pitcher_id + batter_id}, 3600)
+
+
+def cells(body):
+    return {
+        (body[f'{side}_pitcher']['id'], batter['id']): batter['matchup']
+        for side in ('home', 'away')
+        for batter in body[f'{side}_pitcher']['batters']
+    }
+
+
+def test_failing_cell_is_null_and_the_rest_are_served(appmod, client, monkeypatch):
+    monkeypatch.setattr(appmod, 'fetch_vs_player', lambda p, b: career_line(appmod, p, b))
+    response = client.get(f'/api/game/{GAME}/matchups')
+
+    assert response.status_code == 200
+    assert response.headers['ETag']
+    body = response.get_json()
+    assert body['complete'] is False
+    assert cells(body) == {(10, 3): {'at_bats': 13}, (10, 4): {}, (20, 1): {'at_bats': 21}, (20, 2): None}
+
+    # The incomplete matrix is cached briefly and revalidates like any other entry
+    again = client.get(f'/api/game/{GAME}/matchups', headers={'If-None-Match': response.headers['ETag']})
+    assert again.status_code == 304
+
+
+def test_upstream_errors_blank_only_their_cell(appmod, client, monkeypatch):
+    def fetch_vs_player(pitcher_id, batter_id):
+        if batter_id == 3:
+            raise appmod.UpstreamUnavailable('vsPlayer circuit is open')
+        return appmod.build_cache_entry({'at_bats': 1}, 3600)
+
+    monkeypatch.setattr(appmod, 'fetch_vs_player', fetch_vs_player)
+    body = client.get(f'/api/game/{GAME}/matchups').get_json()
+
+    assert cells(body) == {(10, 3): None, (10, 4): {'at_bats': 1}, (20, 1): {'at_bats': 1}, (20, 2): {'at_bats': 1}}
+    assert body['complete'] is False
+
+
+def test_complete_matrix(appmod, client, monkeypatch):
+    monkeypatch.setattr(appmod, 'fetch_vs_player', lambda p, b: appmod.build_cache_entry({'at_bats': 2}, 3600))
+    body = client.get(f'/api/game/{GAME}/matchups').get_json()
+
+    assert body['complete'] is True
+    assert list(cells(body).values()) == [{'at_bats': 2}] * 4
+    assert body['home_pitcher']['name'] == 'Home Starter'
@@ -0,0 +1,38 @@
+import time
+
+
+def test_render_sums_every_workers_snapshot(appmod, cache, monkeypatch):
+    workers = [appmod.Metrics(cache), appmod.Metrics(cache)]
+    for pid, worker in enumerate(workers, start=100):
+        worker.inc('mlb_upstream_retries_total', endpoint='schedule')
+        worker.observe('mlb_upstream_request_duration_seconds', 0.2, endpoint='schedule')
+        monkeypatch.setattr(appmod.os, 'getpid', lambda pid=pid: pid)
+        worker.publish(force=True)
+
+    text = workers[1].render()
+    assert 'mlb_upstream_retries_total{endpoint="schedule"} 2' in text
+    assert 'mlb_upstream_request_duration_seconds_bucket{endpoint="schedule",le="0.1"} 0' in text
+    assert 'mlb_upstream_request_duration_seconds_bucket{endpoint="schedule",le="0.25"} 2' in text
+    assert 'mlb_upstream_request_duration_seconds_count{endpoint="schedule"} 2' in text
+
+
+def test_snapshots_stay_out_of_the_cache(appmod, cache):
+    worker = appmod.Metrics(cache)
+    worker.inc('mlb_cache_requests_total', key='games', result='hit')
+    worker.render()
+    worker.render()
+
+    stats = cache.stats()
+    assert (stats['entries'], stats['bytes'], stats['hits'], stats['misses']) == (0, 0, 0, 0)
+    assert cache.keys('metrics:') == []
+    assert 'mlb_cache_entries 0' in worker.render()
+
+
+def test_exited_workers_drop_out(appmod, cache, monkeypatch):
+    cache.set_worker_snapshot('metrics:1', {'counters': [['mlb_upstream_retries_total', [], 5]], 'histograms': []})
+    assert len(cache.worker_snapshots(60)) == 1
+
+    later = time.time() + appmod.METRICS_WORKER_TTL + 1
+    monkeypatch.setattr(appmod.time, 'time', lambda: later)
+    assert cache.worker_snapshots(appmod.METRICS_WORKER_TTL) == []
+    assert appmod.Metrics(cache).collect() == ({}, {})
@@ -0,0 +1,88 @@
+import pytest
+
+# (team_id, player_id, name, position)
+PLAYERS = [
+    (114, 1, 'José Ramírez', '3B'),
+    (114, 2, 'Jose Abreu', '1B'),
+    (147, 3, 'Aaron Judge', 'RF'),
+    (147, 4, 'Aaron Hicks', 'CF'),
+    (147, 5, 'Gerrit Cole', 'P'),
+    (111, 6, 'Rafael Devers', '3B'),
+    (111, 7, 'Ram Ramos', 'C'),
+    (111, 8, 'Ra\U0002000bul Ito', 'SS'),
+]
+
+
+@pytest.fixture(scope='module')
+def index(appmod):
+    rosters = {'teams': {}, 'players': {}}
+    for team_id, player_id, name, position in PLAYERS:
+        rosters['teams'].setdefault(str(team_id), []).append(player_id)
+        rosters['players'][str(player_id)] = {
+            'id': player_id, 'name': name, 'position': position, 'hitting': {}, 'pitching': {}
+        }
+    return appmod.PlayerSearchIndex(rosters)
+
+
+def ids(result):
+    return [player['id'] for player in result['players']]
+
+
+def test_normalize_name_folds_accents_and_punctuation(appmod):
+    assert appmod.normalize_name('José Ramírez') == 'jose ramirez'
+    assert appmod.normalize_name("  Travis d'Arnaud Jr. ") == 'travis d arnaud jr'
+    assert appmod.normalize_name(None) == ''
+
+
+def test_empty_query_matches_nothing(index):
+    for query in ('', '   ', '.,-'):
+        assert index.search(query) == {'players': [], 'total': 0, 'facets': {'position': {}, 'team': {}}}
+
+
+def test_accented_names_match_plain_queries_and_back(index):
+    assert ids(index.search('ramir')) == [1]
+    assert ids(index.search('RAMÍREZ')) == [1]
+    assert ids(index.search('josé')) == [2, 1]
+
+
+def test_any_name_word_is_a_prefix(index):
+    assert ids(index.search('judge')) == [3]
+    assert ids(index.search('dev')) == [6]
+    # Only word starts match, not the middle of a word
+    assert ids(index.search('udge')) == []
+
+
+def test_multi_word_queries_match_in_either_order(index):
+    assert ids(index.search('jose ram')) == [1]
+    assert ids(index.search('ramirez jose')) == [1]
+    assert ids(index.search('aaron h')) == [4]
+    assert ids(index.search('aaron zzz')) == []
+
+
+def test_full_name_prefix_hits_rank_first(index):
+    # 'Ram Ramos' starts with the query; 'José Ramírez' only has a word that does
+    assert ids(index.search('ram')) == [7, 1]
+
+
+def test_prefix_range_ends_exactly(index):
+    assert ids(index.search('aaron')) == [4, 3]
+    assert ids(index.search('aaron judge')) == [3]
+    assert ids(index.search('aaron judges')) == []
+    assert ids(index.search('z')) == []
+    # A name continuing past the Basic Multilingual Plane is still in range
+    assert ids(index.search('ra')) == [6, 7, 8, 1]
+
+
+def test_limit_keeps_total_and_facets_over_all_matches(index):
+    result = index.search('a', limit=1)
+    assert len(result['players']) == 1
+    assert result['total'] == 3  # Aaron Judge, Aaron Hicks, Jose Abreu
+    assert result['facets']['team'] == {147: 2, 114: 1}
+
+
+def test_facet_filters(index):
+    result = index.search('ra', position='3B')
+    assert ids(result) == [6, 1]
+    assert result['facets']['position'] == {'3B': 2, 'C': 1, 'SS': 1}
+    assert ids(index.search('ra', team_id=111)) == [6, 7, 8]
+    assert ids(index.search('ra', position='P')) == []
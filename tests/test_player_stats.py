@@ -0,0 +1,152 @@
+from datetime import datetime
+
+import pytest
+
+YEAR = datetime.now().year
+
+
+def split(season, team, avg):
+    return {'season': str(season), 'team': {'name': team}, 'stat': {'avg': avg, 'homeRuns': 10}}
+
+
+def stat_group(kind, group, splits):
+    return {'type': {'displayName': kind}, 'group': {'displayName': group}, 'splits': splits}
+
+
+class Upstream:
+    """statsapi people responses for one hitter, with the current season's line adjustable"""
+
+    def __init__(self, player_id):
+        self.player_id = player_id
+        self.current_avg = '.280'
+        self.past = [split(YEAR - 2, 'New York Yankees', '.300'),
+                     split(YEAR - 1, 'Boston Red Sox', '.250'),
+                     split(YEAR - 1, 'New York Yankees', '.260')]
+        self.calls = []
+
+    def player(self, stats):
+        return {'id': self.player_id, 'fullName': 'Test Hitter', 'stats': stats}
+
+    def fetch_people(self, player_ids, season=None):
+        self.calls.append((tuple(player_ids), season))
+        current = split(YEAR, 'New York Yankees', self.current_avg)
+        career = stat_group('career', 'hitting', [{'stat': {'avg': '.285'}}])
+        if season is None:
+            return [self.player([stat_group('yearByYear', 'hitting', self.past + [current]), career])]
+        return [self.player([stat_group('season', 'hitting', [current]), career])]
+
+
+@pytest.fixture
+def upstream(appmod, monkeypatch):
+    upstream = Upstream(player_id=660271)
+    monkeypatch.setattr(appmod, 'fetch_people', upstream.fetch_people)
+    yield upstream
+    with appmod.app.app_context():
+        appmod.PlayerSeasonStats.query.delete()
+        appmod.PlayerStatsArchive.query.delete()
+        appmod.db.session.commit()
+
+
+def seasons(player_info):
+    return [(row['season'], row['team'], row['avg']) for row in player_info['stats']]
+
+
+def test_first_request_fetches_every_season_and_archives_closed_ones(appmod, upstream):
+    player_info = appmod.load_player_stats(upstream.player_id)
+
+    assert upstream.calls == [((upstream.player_id,), None)]
+    assert seasons(player_info) == [
+        (str(YEAR - 2), 'New York Yankees', '.300'),
+        (str(YEAR - 1), 'Boston Red Sox', '.250'),
+        (str(YEAR - 1), 'New York Yankees', '.260'),
+        (str(YEAR), 'New York Yankees', '.280'),
+        ('Career', 'N/A', '.285'),
+    ]
+    layout, archived = appmod.read_player_archives([upstream.player_id], YEAR)[upstream.player_id]
+    assert layout == [('yearByYear', 'hitting'), ('career', 'hitting')]
+    # Only seasons that are over are stored
+    assert [row['season'] for row in archived['hitting']] == [str(YEAR - 2), str(YEAR - 1), str(YEAR - 1)]
+
+
+def test_merged_response_matches_the_unarchived_one(appmod, upstream):
+    unarchived = appmod.load_player_stats(upstream.player_id)
+    merged = appmod.load_player_stats(upstream.player_id)
+
+    assert upstream.calls[1] == ((upstream.player_id,), YEAR)
+    assert merged == unarchived
+
+
+def test_closed_seasons_come_from_the_archive_and_the_current_one_live(appmod, upstream):
+    appmod.load_player_stats(upstream.player_id)
+    # Upstream changes after archiving: only the current season may show it
+    upstream.current_avg = '.312'
+    upstream.past[0] = split(YEAR - 2, 'New York Yankees', '.999')
+
+    merged = appmod.load_player_stats(upstream.player_id)
+    assert seasons(merged)[0] == (str(YEAR - 2), 'New York Yankees', '.300')
+    assert seasons(merged)[3] == (str(YEAR), 'New York Yankees', '.312')
+    assert len(merged['stats']) == 5
+
+
+def test_archive_from_before_last_season_is_refetched(appmod, upstream):
+    appmod.load_player_stats(upstream.player_id)
+
+    # A year later the archive no longer covers every closed season
+    assert appmod.read_player_archives([upstream.player_id], YEAR + 1) == {}
+    assert upstream.player_id in appmod.read_player_archives([upstream.player_id], YEAR)
+
+
+def test_new_stat_group_is_appended_after_the_archived_layout(appmod, upstream):
+    appmod.load_player_stats(upstream.player_id)
+    layout, archived = appmod.read_player_archives([upstream.player_id], YEAR)[upstream.player_id]
+    pitching = stat_group('season', 'pitching', [{'season': str(YEAR), 'team': {'name': 'New York Yankees'}, 'stat': {'era': '0.00'}}])
+    player = upstream.player(upstream.fetch_people([upstream.player_id], YEAR)[0]['stats'] + [pitching])
+
+    merged = appmod.merge_player_stats(player, layout, archived)
+    assert [row['season'] for row in merged['stats']] == [
+        str(YEAR - 2), str(YEAR - 1), str(YEAR - 1), str(YEAR), 'Career', str(YEAR)
+    ]
+    assert merged['stats'][-1]['era'] == '0.00'
+
+
+@pytest.fixture
+def batch_client(appmod, api_cache, monkeypatch):
+    monkeypatch.setattr(appmod, 'single_flight', appmod.SingleFlight(api_cache))
+    return appmod.app.test_client()
+
+
+def test_batch_serves_cached_players_when_upstream_fails(appmod, api_cache, upstream, batch_client, monkeypatch):
+    api_cache.set('player_stats:1', {'id': 1, 'stats': []}, 300)
+
+    def failing_fetch_people(player_ids, season=None):
+        raise appmod.UpstreamUnavailable('people circuit is open')
+
+    monkeypatch.setattr(appmod, 'fetch_people', failing_fetch_people)
+    response = batch_client.get('/api/players/stats?ids=1,2')
+
+    assert response.status_code == 200
+    assert response.get_json() == {'players': [{'id': 1, 'stats': []}], 'not_found': [], 'failed': [2]}
+
+
+def test_batch_keeps_the_call_that_worked(appmod, api_cache, upstream, batch_client, monkeypatch):
+    appmod.load_player_stats(upstream.player_id)  # archived, so it is fetched for the current season only
+    api_cache.set('player_stats:2', {'id': 2, 'stats': ['stale']}, 300, timestamp=0)
+
+    def fetch_people(player_ids, season=None):
+        if season is None:
+            raise appmod.requests.ConnectionError('reset by peer')
+        return upstream.fetch_people(player_ids, season)
+
+    monkeypatch.setattr(appmod, 'fetch_people', fetch_people)
+    body = batch_client.get(f'/api/players/stats?ids={upstream.player_id},2,3').get_json()
+
+    # Player 2 falls back to its stale copy; player 3 has nothing to serve
+    assert [player['id'] for player in body['players']] == [upstream.player_id, 2]
+    assert body['failed'] == [3]
+    assert body['not_found'] == []
+
+
+def test_batch_reports_unknown_players(appmod, api_cache, upstream, batch_client):
+    body = batch_client.get(f'/api/players/stats?ids={upstream.player_id},404').get_json()
+    assert [player['id'] for player in body['players']] == [upstream.player_id]
+    assert (body['not_found'], body['failed']) == ([404], [])
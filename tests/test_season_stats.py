@@ -0,0 +1,104 @@
+import pytest
+
+TEAM_GAMES = 100  # the most games any hitter on the team has played
+
+
+def hitter(player_id, pa, avg, home_runs, games=80):
+    return {
+        'id': player_id, 'name': f'H{player_id}', 'position': 'RF', 'team_id': 147,
+        'hitting': {'gamesPlayed': games, 'plateAppearances': pa, 'avg': avg, 'homeRuns': home_runs},
+        'pitching': {},
+    }
+
+
+def pitcher(player_id, innings, era):
+    return {
+        'id': player_id, 'name': f'P{player_id}', 'position': 'P', 'team_id': 147,
+        'hitting': {}, 'pitching': {'inningsPitched': innings, 'era': era},
+    }
+
+
+PLAYERS = [
+    hitter(1, 400, '.300', 30, games=TEAM_GAMES),
+    hitter(2, 350, '.280', 30),
+    hitter(3, 320, '.280', 12),
+    hitter(4, 311, '.250', 30),  # qualifies: 3.1 PA per team game is 310
+    hitter(5, 300, '.400', 40),  # 10 PA short of qualifying
+    hitter(6, 0, '.---', 0),
+    pitcher(10, '120.0', '2.50'),
+    pitcher(11, '100.1', '3.10'),
+    pitcher(12, '99.2', '1.00'),  # 99 2/3 innings: short of 100
+    pitcher(13, '150.0', '4.75'),
+]
+
+
+@pytest.fixture(scope='module')
+def columns(appmod):
+    rosters = {'teams': {'147': [player['id'] for player in PLAYERS]}, 'players': {str(p['id']): p for p in PLAYERS}}
+    return appmod.SeasonStatsColumns(rosters)
+
+
+def ids(columns, rows):
+    return [columns.players[row]['id'] for row in rows]
+
+
+def test_qualifiers(columns):
+    assert ids(columns, columns.qualified['hitting'].nonzero()[0]) == [1, 2, 3, 4]
+    assert ids(columns, columns.qualified['pitching'].nonzero()[0]) == [10, 11, 13]
+
+
+def test_innings_thirds(appmod):
+    assert appmod.innings_value('99.2') == pytest.approx(99 + 2 / 3)
+    assert appmod.innings_value('-.--') != appmod.innings_value('-.--')  # NaN
+
+
+def test_rate_leaders_only_count_qualified_players(columns):
+    assert ids(columns, columns.leaders('avg', 10)) == [1, 2, 3, 4]
+    assert ids(columns, columns.leaders('avg', 1, qualified=False)) == [5]
+
+
+def test_ties_keep_roster_order_across_the_cut(columns):
+    # Four players hit 30+ homers, three of them exactly 30
+    assert ids(columns, columns.leaders('homeRuns', 2)) == [5, 1]
+    assert ids(columns, columns.leaders('homeRuns', 3)) == [5, 1, 2]
+    assert ids(columns, columns.leaders('homeRuns', 5)) == [5, 1, 2, 4, 3]
+    assert ids(columns, columns.leaders('avg', 3)) == [1, 2, 3]
+
+
+def test_lower_is_better_for_era(columns):
+    assert ids(columns, columns.leaders('era', 10)) == [10, 11, 13]
+    assert ids(columns, columns.leaders('era', 1, qualified=False)) == [12]
+
+
+def test_missing_values_are_never_leaders(columns):
+    leaders = ids(columns, columns.leaders('avg', 10, qualified=False))
+    assert 6 not in leaders
+    assert 10 not in leaders
+    assert len(leaders) == 5
+
+
+def test_limit_larger_than_the_pool(columns):
+    assert len(columns.leaders('era', 100)) == 3
+    assert len(columns.leaders('saves', 5)) == 0
+
+
+def test_percentile_edges(columns):
+    # avg pool: .250 .280 .280 .300; ties count half
+    assert columns.percentiles(1)['hitting']['avg']['percentile'] == 87.5
+    assert columns.percentiles(4)['hitting']['avg']['percentile'] == 12.5
+    assert columns.percentiles(2)['hitting']['avg']['percentile'] == 50.0
+    # An unqualified player is ranked against the qualified pool without joining it
+    assert columns.percentiles(5)['hitting']['avg']['percentile'] == 100.0
+
+
+def test_percentiles_for_lower_is_better_stats(columns):
+    # era pool: 2.50 3.10 4.75
+    assert columns.percentiles(10)['pitching']['era']['percentile'] == pytest.approx(83.3)
+    assert columns.percentiles(13)['pitching']['era']['percentile'] == pytest.approx(16.7)
+    assert columns.percentiles(12)['pitching']['era'] == {'value': 1.0, 'percentile': 100.0}
+
+
+def test_percentiles_skip_missing_stats_and_unknown_players(columns):
+    assert 'pitching' not in columns.percentiles(1)
+    assert 'avg' not in columns.percentiles(6).get('hitting', {})
+    assert columns.percentiles(999) is None
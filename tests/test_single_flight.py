@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+
+def wait_until(predicate, timeout=2):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def flight(appmod, cache):
+    return appmod.SingleFlight(cache, wait_timeout=2, poll_interval=0.01)
+
+
+def test_fresh_entry_is_served_without_loading(flight, cache):
+    cache.set('teams', ['cached'], 60)
+    assert flight.fetch('teams', 60, lambda: pytest.fail('loader ran')).data == ['cached']
+
+
+def test_concurrent_misses_run_the_loader_once(flight):
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(2)
+        return ['loaded']
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.fetch('teams', 60, loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    assert wait_until(lambda: calls)
+    time.sleep(0.05)  # give the followers time to find the key busy
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert [entry.data for entry in results] == [['loaded']] * 8
+
+
+def test_stale_entry_is_served_while_revalidating(flight, cache):
+    cache.set('standings', ['old'], 60, timestamp=time.time() - 120)
+    release = threading.Event()
+
+    def loader():
+        release.wait(2)
+        return ['new']
+
+    assert flight.fetch('standings', 60, loader).data == ['old']
+    # The revalidation is still running; the stale copy keeps being served
+    assert flight.fetch('standings', 60, loader).data == ['old']
+    release.set()
+
+    assert wait_until(lambda: cache.get('standings').data == ['new'])
+    assert flight.fetch('standings', 60, loader).data == ['new']
+
+
+def test_failed_revalidation_keeps_the_stale_entry(flight, cache):
+    cache.set('standings', ['old'], 60, timestamp=time.time() - 120)
+
+    def loader():
+        raise ValueError('upstream payload')
+
+    assert flight.fetch('standings', 60, loader).data == ['old']
+    assert wait_until(lambda: not flight._is_refreshing('standings'))
+    assert cache.get('standings').data == ['old']
+    assert not cache.lease_held('standings')
+
+
+def test_refresh_is_busy_while_another_worker_holds_the_lease(flight, cache):
+    holder = threading.Thread(target=lambda: cache.acquire_lease('teams', 30))
+    holder.start()
+    holder.join()
+
+    assert flight.refresh('teams', 60, lambda: ['loaded']) is flight.BUSY
+
+
+def test_refresh_skips_the_loader_if_the_entry_became_fresh(flight, cache):
+    cache.set('teams', ['fresh'], 60)
+    assert flight.refresh('teams', 60, lambda: pytest.fail('loader ran')).data == ['fresh']
+    assert flight.refresh('teams', 60, lambda: ['forced'], force=True).data == ['forced']
+
+
+def test_refreshing_set_is_empty_after_refreshes(flight):
+    for key in ('a', 'b', 'c'):
+        flight.refresh(key, 60, lambda: [key])
+    flight.refresh('none', 60, lambda: None)
+    assert flight._refreshing == set()
+
+
+def test_loader_returning_none_stores_nothing(flight, cache):
+    assert flight.fetch('teams', 60, lambda: None) is None
+    assert cache.get('teams') is None
@@ -0,0 +1,15 @@
+def test_diff_reports_every_changed_field(appmod):
+    previous = {1: {'id': 1, 'status': 'live', 'home_score': 2, 'decisions': None, 'series_status': 'Game 1'}}
+    current = {1: {'id': 1, 'status': 'final', 'home_score': 2, 'decisions': {'winner': 'Cole'}}}
+
+    assert appmod.diff_live_games(previous, current) == {
+        1: {'status': 'final', 'decisions': {'winner': 'Cole'}, 'series_status': None}
+    }
+
+
+def test_diff_skips_unchanged_games(appmod):
+    games = {1: {'id': 1, 'status': 'live'}, 2: {'id': 2, 'status': 'scheduled', 'probable_home_pitcher': 'A'}}
+    current = {**games, 2: {**games[2], 'probable_home_pitcher': 'B'}}
+
+    assert appmod.diff_live_games(games, games) == {}
+    assert appmod.diff_live_games(games, current) == {2: {'probable_home_pitcher': 'B'}}
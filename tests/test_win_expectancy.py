@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+# 600 half-innings averaging 0.5 runs: enough to calibrate the run environment
+ARCHIVE_RUNS = [0] * 420 + [1] * 100 + [2] * 50 + [3] * 30
+
+
+@pytest.fixture(scope='module')
+def table(appmod):
+    table, scale = appmod.build_win_expectancy_table(ARCHIVE_RUNS)
+    return table, scale
+
+
+def test_table_shape_and_range(appmod, table):
+    table, _ = table
+    assert table.shape == (appmod.WE_INNINGS, 2, 3, 8, 2 * appmod.WE_MAX_DIFF + 1)
+    assert np.all((table >= 0) & (table <= 1))
+
+
+def test_calibration_matches_the_archive_run_rate(appmod, table):
+    _, scale = table
+    dist = appmod.build_run_distributions(appmod.scaled_event_rates(scale))
+    expected_runs = dist[0, 0] @ np.arange(appmod.WE_MAX_RUNS + 1)
+    assert expected_runs == pytest.approx(np.mean(ARCHIVE_RUNS), abs=0.01)
+
+
+def test_small_archive_uses_league_average_rates(appmod):
+    _, scale = appmod.calibrate_run_distributions([1] * 10)
+    assert scale == 1.0
+
+
+def test_game_start_is_close_to_even(appmod, table):
+    table, _ = table
+    # Evenly matched teams: batting last changes when the game ends, not who wins
+    assert table[0, 0, 0, 0, appmod.WE_MAX_DIFF] == pytest.approx(0.5, abs=0.01)
+
+
+def test_win_expectancy_rises_with_the_home_lead(table):
+    table, _ = table
+    assert np.all(np.diff(table, axis=-1) >= -1e-6)
+
+
+def test_runners_and_outs_move_the_batting_team(appmod, table):
+    table, _ = table
+    tied = appmod.WE_MAX_DIFF
+    bottom_seventh = table[6, 1]
+    # Home batting: runners help, outs hurt
+    assert bottom_seventh[0, 0b111, tied] > bottom_seventh[0, 0, tied]
+    assert bottom_seventh[0, 0, tied] > bottom_seventh[2, 0, tied]
+    top_seventh = table[6, 0]
+    assert top_seventh[0, 0b111, tied] < top_seventh[0, 0, tied]
+
+
+def test_home_lead_in_the_bottom_of_the_ninth_is_a_win(appmod, table):
+    table, _ = table
+    assert np.all(table[8, 1, :, :, appmod.WE_MAX_DIFF + 1:] == 1.0)
+
+
+def test_lookup_clips_extra_innings_and_big_leads(appmod, table, tmp_path):
+    table, _ = table
+    path = tmp_path / 'we.npy'
+    np.save(path, table)
+    lookup = appmod.WinExpectancy(str(path))
+    probabilities = lookup.lookup_many([(1, 0, 0, 0, 0), (14, 1, 1, 0b010, 25), (3, 0, 2, 0, -30)])
+
+    assert probabilities[0] == pytest.approx(table[0, 0, 0, 0, appmod.WE_MAX_DIFF] * 100, abs=1e-3)
+    assert probabilities[1] == pytest.approx(99.9)
+    # Leads past WE_MAX_DIFF are looked up as WE_MAX_DIFF
+    assert probabilities[2] == pytest.approx(table[2, 0, 2, 0, 0] * 100, abs=1e-3)
+    assert appmod.WinExpectancy(str(tmp_path / 'missing.npy')).lookup_many([(1, 0, 0, 0, 0)]) is None
+
+
+def test_build_command_writes_the_table(appmod, monkeypatch, tmp_path):
+    path = tmp_path / 'instance' / 'we.npy'
+    monkeypatch.setattr(appmod, 'WIN_EXPECTANCY_PATH', str(path))
+    monkeypatch.setattr(appmod, 'archived_runs_per_half_inning', lambda: [1] * 10)
+    result = appmod.app.test_cli_runner().invoke(args=['build-win-expectancy'])
+
+    assert result.exit_code == 0
+    assert 'Only 10 archived half-innings' in result.output
+    assert np.load(path).shape[0] == appmod.WE_INNINGS
+
+
+@pytest.mark.parametrize('linescore, live_data, expected', [
+    # Mid-inning: the state as reported
+    ({'currentInning': 3, 'isTopInning': True, 'outs': 1, 'offense': {'first': {}, 'third': {}}}, {}, (3, 0, 1, 0b101, 2)),
+    # The live feed's outs and bases win over the linescore's
+    ({'currentInning': 5, 'isTopInning': False, 'outs': 0}, {'outs': 2, 'bases': 0b010}, (5, 1, 2, 0b010, 2)),
+    # Middle of an inning: start of the bottom half
+    ({'currentInning': 4, 'isTopInning': True, 'inningState': 'Middle', 'outs': 3}, {}, (4, 1, 0, 0, 2)),
+    # End of an inning: start of the next top half
+    ({'currentInning': 6, 'isTopInning': False, 'inningState': 'End', 'outs': 3}, {}, (7, 0, 0, 0, 2)),
+    # Extra innings start with a runner on second
+    ({'currentInning': 10, 'isTopInning': True, 'inningState': 'Middle'}, {}, (10, 1, 0, 0b010, 2)),
+    ({'currentInning': 9, 'isTopInning': False, 'inningState': 'End'}, {}, (10, 0, 0, 0b010, 2)),
+])
+def test_game_situation(appmod, linescore, live_data, expected):
+    assert appmod.game_situation(linescore, live_data, home_score=5, away_score=3) == expected
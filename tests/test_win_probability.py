@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+
+def sample(appmod, timestamp, probability, inning=1):
+    return np.array([(timestamp, inning, 0, 0, probability)], dtype=appmod.WINPROB_SAMPLE)
+
+
+def test_series_keeps_the_latest_samples_in_order(appmod, cache):
+    key = 'winprob:1'
+    assert cache.series_version(key) == 0
+    for i in range(6):
+        assert cache.append_sample(key, sample(appmod, 100 + i, 50 + i), capacity=4)
+
+    samples = cache.series(key, appmod.WINPROB_SAMPLE)
+    assert samples['timestamp'].tolist() == [102, 103, 104, 105]
+    assert cache.series_version(key) == 6
+
+
+def test_repeated_state_is_not_appended(appmod, cache):
+    assert cache.append_sample('winprob:1', sample(appmod, 100, 50))
+    assert not cache.append_sample('winprob:1', sample(appmod, 101, 50))
+    assert cache.series_version('winprob:1') == 1
+
+
+@pytest.fixture
+def builds(appmod, api_cache, monkeypatch):
+    calls = []
+    build = appmod.build_cache_entry
+
+    def counting_build(*args, **kwargs):
+        calls.append(args[0])
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(appmod, 'build_cache_entry', counting_build)
+    return calls
+
+
+def test_route_reuses_the_encoded_series_until_a_sample_lands(appmod, api_cache, builds):
+    client = appmod.app.test_client()
+    assert client.get('/api/game/7/winprob').status_code == 404
+
+    api_cache.append_sample('winprob:7', sample(appmod, 100, 55.04))
+    first = client.get('/api/game/7/winprob')
+    assert first.get_json()['win_probability'] == [55.0]
+    assert client.get('/api/game/7/winprob').get_data() == first.get_data()
+    assert client.get('/api/game/7/winprob', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+    assert len(builds) == 1
+
+    api_cache.append_sample('winprob:7', sample(appmod, 110, 61.0, inning=2))
+    second = client.get('/api/game/7/winprob', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.get_json()['inning'] == [1, 2]
+    assert len(builds) == 2